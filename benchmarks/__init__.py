@@ -0,0 +1,4 @@
+import os
+
+# benchmarks must not open any window
+os.environ.setdefault("MPLBACKEND", "Agg")
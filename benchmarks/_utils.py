@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import numpy as np
+
+from whitecanvas import new_canvas
+from whitecanvas.canvas import SingleCanvas
+
+BACKENDS = ["mock", "matplotlib"]
+SIZES = [10**3, 10**5, 10**7]
+
+
+def make_canvas(backend: str) -> SingleCanvas:
+    return new_canvas(backend=backend)
+
+
+def close_figures():
+    import matplotlib.pyplot as plt
+
+    plt.close("all")
+
+
+def random_xy(size: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=size), rng.normal(size=size)
+
+
+def random_image(size: int, seed: int = 0) -> np.ndarray:
+    """Random 2D image with approximately `size` pixels."""
+    side = int(np.sqrt(size))
+    return np.random.default_rng(seed).random((side, side), dtype=np.float32)
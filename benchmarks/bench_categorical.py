@@ -0,0 +1,69 @@
+"""Categorical plots built from different data frame types."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from benchmarks._utils import BACKENDS, close_figures, make_canvas
+
+FRAME_TYPES = ["dict", "pandas", "polars"]
+
+
+def make_frame(frame_type: str, size: int):
+    rng = np.random.default_rng(0)
+    data = {
+        "label": np.repeat(["A", "B", "C", "D"], size // 4),
+        "y": rng.normal(size=size // 4 * 4),
+    }
+    if frame_type == "dict":
+        return data
+    try:
+        if frame_type == "pandas":
+            import pandas as pd
+
+            return pd.DataFrame(data)
+        elif frame_type == "polars":
+            import polars as pl
+
+            return pl.DataFrame(data)
+    except ImportError:
+        # asv skips the benchmark
+        raise NotImplementedError(f"{frame_type} is not installed") from None
+    raise ValueError(f"Unknown frame type {frame_type!r}")
+
+
+class CategoricalPlots:
+    params = [BACKENDS, FRAME_TYPES, [10**3, 10**5]]
+    param_names = ["backend", "frame", "size"]
+
+    def setup(self, backend: str, frame: str, size: int):
+        self.canvas = make_canvas(backend)
+        self.df = make_frame(frame, size)
+
+    def teardown(self, backend: str, frame: str, size: int):
+        close_figures()
+
+    def time_violinplot(self, backend: str, frame: str, size: int):
+        self.canvas.cat_x(self.df, "label", "y").add_violinplot()
+
+    def time_boxplot(self, backend: str, frame: str, size: int):
+        self.canvas.cat_x(self.df, "label", "y").add_boxplot()
+
+    def time_stripplot(self, backend: str, frame: str, size: int):
+        self.canvas.cat_x(self.df, "label", "y").add_stripplot()
+
+
+class SwarmPlot:
+    # swarm plot places the markers one by one
+    params = [BACKENDS, FRAME_TYPES, [10**3, 10**4]]
+    param_names = ["backend", "frame", "size"]
+
+    def setup(self, backend: str, frame: str, size: int):
+        self.canvas = make_canvas(backend)
+        self.df = make_frame(frame, size)
+
+    def teardown(self, backend: str, frame: str, size: int):
+        close_figures()
+
+    def time_swarmplot(self, backend: str, frame: str, size: int):
+        self.canvas.cat_x(self.df, "label", "y").add_swarmplot()
@@ -0,0 +1,33 @@
+"""Serialization of canvases."""
+
+from __future__ import annotations
+
+from benchmarks._utils import (
+    BACKENDS,
+    close_figures,
+    make_canvas,
+    random_image,
+    random_xy,
+)
+
+
+class Json:
+    params = [BACKENDS, [10**3, 10**5, 10**6]]
+    param_names = ["backend", "size"]
+
+    def setup(self, backend: str, size: int):
+        self.canvas = make_canvas(backend)
+        x, y = random_xy(size)
+        self.canvas.add_line(x, y)
+        self.canvas.add_markers(x, y)
+        self.canvas.add_image(random_image(size))
+        self.json = self.canvas.write_json()
+
+    def teardown(self, backend: str, size: int):
+        close_figures()
+
+    def time_write_json(self, backend: str, size: int):
+        self.canvas.write_json()
+
+    def time_read_json(self, backend: str, size: int):
+        self.canvas.read_json(self.json, backend=backend)
@@ -0,0 +1,102 @@
+"""Construction and update of the primitive layers."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from benchmarks._utils import (
+    BACKENDS,
+    SIZES,
+    close_figures,
+    make_canvas,
+    random_image,
+    random_xy,
+)
+
+
+class LayerCreation:
+    params = [BACKENDS, SIZES]
+    param_names = ["backend", "size"]
+    number = 1  # a fresh canvas for every sample
+
+    def setup(self, backend: str, size: int):
+        self.canvas = make_canvas(backend)
+        self.x, self.y = random_xy(size)
+        self.image = random_image(size)
+
+    def teardown(self, backend: str, size: int):
+        close_figures()
+
+    def time_add_line(self, backend: str, size: int):
+        self.canvas.add_line(self.x, self.y)
+
+    def time_add_markers(self, backend: str, size: int):
+        self.canvas.add_markers(self.x, self.y)
+
+    def time_add_image(self, backend: str, size: int):
+        self.canvas.add_image(self.image)
+
+
+class LayerUpdate:
+    params = [BACKENDS, SIZES]
+    param_names = ["backend", "size"]
+
+    def setup(self, backend: str, size: int):
+        self.canvas = make_canvas(backend)
+        x, y = random_xy(size)
+        self.line = self.canvas.add_line(x, y)
+        self.markers = self.canvas.add_markers(x, y)
+        self.image = self.canvas.add_image(random_image(size))
+        self.x, self.y = random_xy(size, seed=1)
+        self.new_image = random_image(size, seed=1)
+
+    def teardown(self, backend: str, size: int):
+        close_figures()
+
+    def time_line_data(self, backend: str, size: int):
+        self.line.data = self.x, self.y
+
+    def time_markers_data(self, backend: str, size: int):
+        self.markers.data = self.x, self.y
+
+    def time_image_data(self, backend: str, size: int):
+        self.image.data = self.new_image
+
+
+class Autoscale:
+    params = [BACKENDS, SIZES]
+    param_names = ["backend", "size"]
+
+    def setup(self, backend: str, size: int):
+        self.canvas = make_canvas(backend)
+        x, y = random_xy(size)
+        self.canvas.add_line(x, y)
+        self.canvas.add_markers(x, y * 2)
+        self.canvas.add_image(random_image(size))
+
+    def teardown(self, backend: str, size: int):
+        close_figures()
+
+    def time_autoscale(self, backend: str, size: int):
+        self.canvas.autoscale()
+
+
+class DimsSlicing:
+    params = [BACKENDS, [10**3, 10**5, 10**6]]
+    param_names = ["backend", "size"]
+    nframes = 10
+
+    def setup(self, backend: str, size: int):
+        self.canvas = make_canvas(backend)
+        x = np.arange(size, dtype=np.float64)
+        rng = np.random.default_rng(0)
+        self.canvas.dims.add_line(x, rng.normal(size=(self.nframes, size)))
+        images = np.stack([random_image(size, seed=i) for i in range(self.nframes)])
+        self.canvas.dims.add_image(images)
+
+    def teardown(self, backend: str, size: int):
+        close_figures()
+
+    def time_set_indices(self, backend: str, size: int):
+        for i in range(self.nframes):
+            self.canvas.dims.set_indices(i)
@@ -0,0 +1,56 @@
+"""Layers that compute statistics of the input data."""
+
+from __future__ import annotations
+
+from benchmarks._utils import BACKENDS, SIZES, close_figures, make_canvas, random_xy
+
+
+class Histogram:
+    params = [BACKENDS, SIZES]
+    param_names = ["backend", "size"]
+
+    def setup(self, backend: str, size: int):
+        self.canvas = make_canvas(backend)
+        self.data, _ = random_xy(size)
+
+    def teardown(self, backend: str, size: int):
+        close_figures()
+
+    def time_add_hist(self, backend: str, size: int):
+        self.canvas.add_hist(self.data, bins=100)
+
+    def time_accumulate(self, backend: str, size: int):
+        layer = self.canvas.add_hist([], bins=100, limits=(0, 1))
+        layer.accumulate(self.data)
+
+
+class Kde:
+    # KDE evaluates every sample on every grid point
+    params = [BACKENDS, [10**3, 10**5, 10**6]]
+    param_names = ["backend", "size"]
+
+    def setup(self, backend: str, size: int):
+        self.canvas = make_canvas(backend)
+        self.data, _ = random_xy(size)
+
+    def teardown(self, backend: str, size: int):
+        close_figures()
+
+    def time_add_kde(self, backend: str, size: int):
+        self.canvas.add_kde(self.data)
+
+
+class ColorByDensity:
+    # density is evaluated at every point, which is quadratic in size
+    params = [BACKENDS, [10**3, 10**4]]
+    param_names = ["backend", "size"]
+
+    def setup(self, backend: str, size: int):
+        self.canvas = make_canvas(backend)
+        self.markers = self.canvas.add_markers(*random_xy(size))
+
+    def teardown(self, backend: str, size: int):
+        close_figures()
+
+    def time_color_by_density(self, backend: str, size: int):
+        self.markers.color_by_density()
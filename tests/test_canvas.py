@@ -1,4 +1,6 @@
 import sys
+import threading
+import time
 from pathlib import Path
 import tempfile
 import numpy as np
@@ -236,6 +238,40 @@ def test_unlink(backend: str):
 
     grid = wc.new_row(2, backend=backend).fill().link_x().link_y()
 
+def test_link_throttled(backend: str):
+    grid = wc.new_row(3, backend=backend).fill()
+    # long enough not to be applied by the time, regardless of the test speed
+    linker = wc.link_axes([c.x for c in grid], msec=3_600_000)
+    grid[0].x.lim = (10, 11)  # leading edge is applied immediately
+    assert grid[2].x.lim == pytest.approx((10, 11))
+    grid[0].x.lim = (12, 13)
+    grid[1].x.lim = (14, 15)
+    assert grid[2].x.lim == pytest.approx((10, 11))
+    linker.flush()
+    for canvas in grid:
+        assert canvas.x.lim == pytest.approx((14, 15))
+    grid[1].x.lim = (16, 17)
+    assert grid[2].x.lim == pytest.approx((14, 15))
+    grid[1].mouse.emulate_drag([(0, 0), (1, 1)])  # applied on release
+    for canvas in grid:
+        assert canvas.x.lim == pytest.approx((16, 17))
+    linker.unlink_all()
+    assert grid[0].mouse.moved._slots == []
+
+def test_link_throttled_trailing():
+    canvas0 = new_canvas("mock")
+    canvas1 = new_canvas("mock")
+    wc.link_axes(canvas0.x, canvas1.x, msec=16)
+    canvas0.x.lim = (0, 1)
+    canvas0.x.lim = (0, 5)
+    assert canvas1.x.lim == pytest.approx((0, 1))
+    # the last limits are applied without any further change
+    for _ in range(100):
+        time.sleep(0.01)
+        if canvas1.x.lim != pytest.approx((0, 1)):
+            break
+    assert canvas1.x.lim == pytest.approx((0, 5))
+
 def test_jointgrid(backend: str):
     rng = np.random.default_rng(0)
     joint = wc.new_jointgrid(backend=backend, size=(100, 100)).with_hist().with_kde().with_rug()
@@ -304,6 +340,22 @@ def test_multidim():
     canvas.dims.set_values({"T": 1})
     canvas._repr_png_()
 
+def test_multidim_autoscale():
+    canvas = new_canvas(backend="mock")
+    img = np.stack([np.full((5, 5), i, dtype=np.float32) for i in range(3)])
+    img[2, 0, 0] = np.nan
+    layer = canvas.dims.add_image(img)
+    layer.autoscale()
+    assert layer.base.clim == (0, 2)
+    canvas.dims.set_indices(1)
+    assert layer.base.clim == (0, 2)
+    layer.autoscale(over_stack=False)
+    assert layer.base.clim == (1, 1)
+    canvas.dims.set_indices(2)
+    assert layer.base.clim == (2, 2)
+    canvas.dims.set_indices(0)
+    assert layer.base.clim == (0, 0)
+
 def test_multidim_slider():
     # TODO: how to test other app backends?
     plt.close("all")
@@ -415,6 +467,113 @@ def test_emulating_mouse_move():
     canvas.mouse.emulate_drag([(1, 1), (1, 2), (1, 3)], button="right")
     assert history == ["press", "move", "move", "release"]
 
+def test_mouse_move_coalescing():
+    canvas = new_canvas("mock")
+    canvas.mouse.move_interval = 1000
+    positions = []
+
+    @canvas.mouse.moved.connect
+    def _move(ev: MouseEvent):
+        positions.append(tuple(ev.pos))
+
+    canvas.mouse.emulate_hover([(0, 0), (1, 1), (2, 2), (3, 3)])
+    assert positions == [(0, 0)]  # leading edge only
+    canvas.mouse.moved.flush()
+    assert positions == [(0, 0), (3, 3)]  # only the latest pending event
+    positions.clear()
+    canvas.mouse.emulate_drag([(0, 0), (1, 1), (2, 2), (4, 4)])
+    # press and release are never dropped, and the pending move event is delivered
+    # just before the release event
+    assert positions == [(0, 0), (4, 4), (4, 4)]
+    canvas.mouse.move_interval = 0
+    positions.clear()
+    canvas.mouse.emulate_hover([(0, 0), (1, 1), (2, 2)])
+    assert positions == [(0, 0), (1, 1), (2, 2)]
+
+def test_mouse_move_coalescing_trailing():
+    canvas = new_canvas("mock")
+    positions = []
+
+    @canvas.mouse.moved.connect(msec=50)
+    def _move(ev: MouseEvent):
+        positions.append(tuple(ev.pos))
+
+    canvas.mouse.emulate_hover([(0, 0), (1, 1), (2, 2)])
+    assert positions == [(0, 0)]
+    # the last move event is delivered without any further event
+    for _ in range(100):
+        time.sleep(0.01)
+        if len(positions) > 1:
+            break
+    assert positions == [(0, 0), (2, 2)]
+
+def test_mouse_move_coalescing_gui_timer():
+    pytest.importorskip("pyqtgraph")
+    from qtpy.QtWidgets import QApplication
+
+    canvas = new_canvas("pyqtgraph")
+    calls = []
+
+    @canvas.mouse.moved.connect(msec=20)
+    def _move(ev: MouseEvent):
+        calls.append((tuple(ev.pos), threading.current_thread()))
+
+    canvas.mouse.emulate_hover([(0, 0), (1, 1), (2, 2)])
+    for _ in range(100):
+        QApplication.processEvents()
+        time.sleep(0.01)
+        if len(calls) > 1:
+            break
+    assert [pos for pos, _ in calls] == [(0, 0), (2, 2)]
+    # the trailing event is delivered in the GUI thread
+    assert all(th is threading.main_thread() for _, th in calls)
+
+def test_mock_instrument():
+    from whitecanvas.backend.mock import Markers, instrument
+
+    set_data = Markers._plt_set_data
+    with instrument() as report:
+        canvas = new_canvas("mock")
+        layer = canvas.add_markers(np.arange(10), np.arange(10))
+        layer.data = np.arange(10), np.arange(10) * 2
+        layer.data = np.arange(10), np.arange(10) * 2
+        nredundant = report[("Markers", "_plt_set_face_color")].redundant
+        layer.face.color = "red"
+        layer.face.color = "blue"
+        layer.face.color = "blue"
+        canvas.title.text = "Title"
+    assert report.draw_count > 0
+    # inherited methods are recorded once, under the subclass
+    assert report[("Title", "_plt_set_text")].count == 1
+    assert report.by_class("_SupportsText") == {}
+    assert report[("Markers", "_plt_set_data")].count == 2
+    assert report[("Markers", "_plt_set_data")].redundant == 1
+    assert report[("Markers", "_plt_set_face_color")].redundant == nredundant + 1
+    assert report[("Markers", "_plt_set_data")].nbytes >= 4 * 80
+    assert report.redundant_calls >= 1
+    assert "_plt_set_data" in report.by_class("Markers")
+    assert "Markers._plt_set_data" in report.summary(max_rows=100)
+    # methods are restored
+    assert Markers._plt_set_data is set_data
+    layer.data = np.arange(10), np.arange(10)
+    assert report[("Markers", "_plt_set_data")].count == 2
+
+def test_mock_instrument_multiline():
+    from whitecanvas.backend.mock import instrument
+
+    canvas = new_canvas("mock")
+    x = np.arange(10)
+    layer = canvas.add_errorbars(x, x - 1, x + 1)
+    with instrument() as report:
+        layer.set_data(x, x - 2, x + 2)
+        layer.set_data(x, x - 2, x + 2)
+        layer.set_data(x, x - 3, x + 3)
+    stats = report[("MultiLine", "_plt_set_data")]
+    assert stats.count == 3
+    # packed lines are compared by value, not by identity
+    assert stats.redundant == 1
+    assert stats.nbytes >= 3 * 10 * 2 * 2 * 8
+
 def test_canvas_3d(backend: str):
     if backend not in ("matplotlib", "vispy", "plotly"):
         pytest.skip(f"{backend} does not support 3d")
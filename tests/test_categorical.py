@@ -1,4 +1,5 @@
 import numpy as np
+from numpy.testing import assert_allclose
 
 from whitecanvas import new_canvas, read_canvas
 from whitecanvas.core import new_jointgrid
@@ -77,8 +78,8 @@ def test_cat_plots(backend: str, orient: str):
     cat_plt.add_violinplot(color="c").with_box().copy()
     cat_plt.add_violinplot(color="c").as_edge_only().move(0.1).with_strip().copy()
     cat_plt.add_violinplot(color="c").with_swarm().copy()
-    cat_plt.add_pointplot(color="c").err_by_se().err_by_sd().err_by_quantile().est_by_mean().est_by_median().move(0.1).copy()
-    cat_plt.add_barplot(color="c").err_by_se().err_by_sd().err_by_quantile().est_by_mean().est_by_median().move(0.1).copy()
+    cat_plt.add_pointplot(color="c").err_by_se().err_by_sd().err_by_quantile().err_by_bootstrap(n_boot=100).est_by_mean().est_by_median().move(0.1).copy()
+    cat_plt.add_barplot(color="c").err_by_se().err_by_sd().err_by_quantile().err_by_bootstrap(n_boot=100).est_by_mean().est_by_median().move(0.1).copy()
     with filter_warning(backend, "plotly"):
         cat_plt.add_rugplot(color="c").scale_by_density().move(0.1).copy()
     cat_plt.add_heatmap_hist(bins=4).copy()
@@ -183,6 +184,58 @@ def test_cat_xy(backend: str):
         canvas.add_legend()
     read_canvas(canvas.write_json())
 
+def test_update_source(backend: str):
+    canvas = new_canvas(backend=backend)
+    rng = np.random.default_rng(0)
+
+    def _df(n: int):
+        return {
+            "y": rng.normal(size=n),
+            "label": np.repeat(["A", "B", "C"], n // 3),
+            "c": ["P", "Q"] * (n // 2),
+        }
+
+    df0, df1 = _df(30), _df(42)
+    cat_plt = canvas.cat_x(df0, "label", "y")
+    cat_new = canvas.cat_x(df1, "label", "y")
+    box = cat_plt.add_boxplot(color="c").update_source(df1)
+    assert_allclose(
+        box.base._get_sep_values(),
+        cat_new.add_boxplot(color="c").base._get_sep_values(),
+    )
+    violin = cat_plt.add_violinplot(color="c").update_source(df1)
+    for b0, b1 in zip(violin.base, cat_new.add_violinplot(color="c").base):
+        assert_allclose(b0.data.y1, b1.data.y1)
+    point = cat_plt.add_pointplot(color="c").est_by_median().update_source(df1)
+    assert_allclose(
+        point.base.data.y,
+        cat_new.add_pointplot(color="c").est_by_median().base.data.y,
+    )
+    strip = cat_plt.add_stripplot(color="c").update_source(df1)
+    assert strip.base.ndata == 42
+    assert_color_array_equal(
+        strip.base.face.color,
+        cat_new.add_stripplot(color="c").base.face.color,
+    )
+    swarm = cat_plt.add_swarmplot(color="c", hatch="c")
+    # the number of markers changes in each update
+    for df in [df1, df0, df1]:
+        strip.update_source(df)
+        swarm.update_source(df)
+        assert len(strip.base.face.hatch) == strip.base.ndata
+        assert len(swarm.base.face.hatch) == swarm.base.ndata
+        assert swarm.base.size.shape == (swarm.base.ndata,)
+        assert swarm.base.edge.width.shape == (swarm.base.ndata,)
+    assert_color_array_equal(
+        swarm.base.face.color,
+        cat_new.add_swarmplot(color="c", hatch="c").base.face.color,
+    )
+    with pytest.raises(ValueError):
+        box.update_source({"y": [0.0], "label": ["D"], "c": ["P"]})
+    with pytest.raises(TypeError):
+        canvas.cat(df0, y="y").along_y().add_hist().update_source(df1)
+
+
 @pytest.mark.parametrize("orient", ["v", "h"])
 def test_agg(backend: str, orient: str):
     canvas = new_canvas(backend=backend)
@@ -70,6 +70,17 @@ def test_network(backend: str):
     assert_array_equal(layer.nodes.data.x, np.arange(10))
     assert_array_equal(layer.nodes.data.y, np.arange(10) * 2)
     assert len(canvas.layers) == 1
+    assert layer.edges.nlines == 3
+    assert_allclose(layer.edges.data[2], [[1, 2], [3, 6]])
+    layer.with_text([f"{i}" for i in range(10)])
+    nodes = np.stack([np.arange(10), np.arange(10) * 3], axis=1)
+    layer.set_nodes(nodes)
+    assert_allclose(layer.edges.data[2], [[1, 3], [3, 9]])
+    assert_allclose(layer.texts.pos.y, np.arange(10) * 3 + 0.1)
+    layer.set_graph(nodes, [[0, 1], [2, 3], [4, 5]])
+    assert_allclose(layer.edges.data[2], [[4, 12], [5, 15]])
+    assert_array_equal(layer.connections, [[0, 1], [2, 3], [4, 5]])
+    layer.read_json(layer.write_json(), backend=backend)
 
 def test_line_fill(backend: str):
     canvas = new_canvas(backend=backend)
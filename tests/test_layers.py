@@ -88,11 +88,83 @@ def test_markers(backend: str):
     _test_visibility(layer)
     layer.data = np.array([[0, 0], [1, 1], [2, 2]])
     canvas.autoscale()
+    assert list(layer.nearest(1.8, 2.1, k=2)) == [2, 1]
+    assert list(layer.query_rect((0.5, 2.5, 0.5, 1.5))) == [1]
+    layer.data = np.array([[0, 0], [1, 1], [2, 2], [3, 3]])
+    assert list(layer.nearest(3.1, 3.0, max_dist=0.5)) == [3]
 
     layer_copy = layer.copy()
     assert layer.symbol == layer_copy.symbol
     layer.read_json(layer.write_json(), backend=backend)
 
+def test_markers_streaming_vispy():
+    canvas = new_canvas(backend="vispy")
+    layer = canvas.add_markers([0, 1, 2], [0, 1, 2], color="red", size=5, symbol="D")
+    backend = layer._backend
+    reallocs = 0
+    for n in range(4, 100):
+        capacity = backend._buffer.shape[0]
+        layer.data = np.arange(n), np.arange(n)
+        reallocs += backend._buffer.shape[0] != capacity
+    # the buffer grows with headroom instead of on every append
+    assert reallocs < 15
+    assert layer.ndata == 99
+    assert layer.size == 5
+    assert layer.symbol == "D"
+    assert_color_equal(layer.face.color, "red")
+    layer.data = np.arange(3), np.arange(3)
+    # removed markers are hidden
+    assert np.all(backend._buffer["a_size"][3:] == 0)
+    layer.size = 8
+    assert layer.size == 8
+    assert_allclose(layer.data.x, np.arange(3))
+    canvas.autoscale()
+
+def test_markers_uniform_matplotlib():
+    canvas = new_canvas(backend="matplotlib")
+    layer = canvas.add_markers(np.arange(100), np.arange(100), size=5, symbol="s")
+    backend = layer._backend
+    layer.with_edge(color="black", width=2)
+    # uniform properties are not repeated for each marker
+    assert len(backend.get_paths()) == 1
+    assert backend.get_sizes().shape == (1,)
+    assert backend.get_linewidth().shape == (1,)
+    assert_allclose(backend._plt_get_symbol_size(), np.full(100, 5))
+    assert_allclose(backend._plt_get_edge_width(), np.full(100, 2))
+    offsets = backend.get_offsets()
+    layer.data = np.arange(100) * 2, np.arange(100)
+    assert backend.get_offsets() is offsets
+    assert_allclose(layer.data.x, np.arange(100) * 2)
+    layer.data = np.arange(3), np.arange(3)
+    assert layer.size == 5
+    assert layer.edge.width == 2
+
+def test_markers_hover_pick_vispy():
+    canvas = new_canvas(backend="vispy")
+    layer = canvas.add_markers([0, 1, 2], [0, 1, 2]).with_hover_text(["a", "b", "c"])
+    picked = []
+    layer.events.clicked.connect(picked.append)
+    native = canvas._canvas()
+    scale = np.array([0.01, 0.01])  # size of a screen pixel
+    native._update_tooltip(np.array([1.0, 1.02]), scale)
+    assert native._tooltip.visible
+    assert native._tooltip.text == "b"
+    native._update_tooltip(np.array([5.0, 5.0]), scale)
+    assert not native._tooltip.visible
+    layer._backend._pick_at(np.array([2.01, 2.0]), scale)
+    assert picked == [[2]]
+
+def test_markers_swap_data(backend: str):
+    canvas = new_canvas(backend=backend)
+    layer = canvas.add_markers([0, 1, 2], [5, 6, 7])
+    data = layer.data
+    layer.data = data.y, data.x
+    assert_allclose(layer.data.x, [5, 6, 7])
+    assert_allclose(layer.data.y, [0, 1, 2])
+    # a snapshot of the data is not updated in place
+    assert_allclose(data.x, [0, 1, 2])
+    assert_allclose(data.y, [5, 6, 7])
+
 def test_regression(backend: str):
     rng = np.random.default_rng(14453)
     canvas = new_canvas(backend=backend)
@@ -212,6 +284,27 @@ def test_infcurve(backend: str):
     # test ufunc
     canvas.add_infcurve(np.sin)
 
+    # test adaptive sampling
+    nevals = []
+
+    def _model(x):
+        nevals.append(x.size)
+        return np.tanh(20 * x)
+
+    canvas.x.lim = (-5, 5)
+    layer = canvas.add_infcurve(_model).set_adaptive_sampling(1e-3, max_points=512)
+    layer.with_hover_text("tanh")
+    xdata, ydata = layer._backend._plt_get_data()
+    assert 64 < xdata.size <= 512
+    assert_allclose(ydata, np.tanh(20 * xdata))
+    nevals.clear()
+    canvas.x.lim = (-4.5, 5.5)  # pan
+    assert 0 < sum(nevals) < layer._backend._plt_get_data()[0].size
+    layer.set_adaptive_sampling(None)
+    assert layer._backend._plt_get_data()[0].size == 256
+    with pytest.raises(ValueError):
+        layer.set_adaptive_sampling(-1)
+
     layer = canvas.add_infline((3, 3), angle=50)
     layer.pos = (2, 2)
     assert layer.pos == (2, 2)
@@ -263,6 +356,122 @@ def test_band(backend: str):
     assert_color_equal(layer.face.color, layer_copy.face.color)
     layer.read_json(layer.write_json(), backend=backend)
 
+def test_multiband(backend: str):
+    from whitecanvas.layers import MultiBand
+
+    canvas = new_canvas(backend=backend)
+    x = np.arange(5)
+    data = [(x, x - i, x ** 2 / 2 + i) for i in range(3)]
+    layer = canvas.add_layer(MultiBand(data, backend=backend))
+    assert layer.nbands == 3
+    for xyy, (x0, y0, y1) in zip(layer.data, data):
+        assert_allclose(xyy.x, x0)
+        assert_allclose(xyy.y0, y0)
+        assert_allclose(xyy.y1, y1)
+
+    layer.with_face(color="red")
+    assert_color_equal(layer.face.color, "red")
+    with filter_warning(backend, "plotly"):
+        layer.with_face_multi(color=["red", "green", "blue"])
+        layer.with_edge_multi(color=["red", "green", "blue"], width=1)
+    layer.with_hover_text(["a", "b", "c"])
+    _test_visibility(layer)
+    canvas.autoscale()
+    layer.read_json(layer.write_json(), backend=backend)
+    layer.data = data[:2]
+    assert layer.nbands == 2
+
+def test_violin_legacy_json():
+    from whitecanvas.layers import Band
+    from whitecanvas.layers.group import ViolinPlot
+
+    # violin plots used to be saved as a collection of bands
+    x = np.arange(5)
+    bands = [
+        Band(x, -x - i, x + i, orient="horizontal", color=color, backend="mock")
+        for i, color in enumerate(["red", "blue"])
+    ]
+    d = {
+        "type": f"{ViolinPlot.__module__}.ViolinPlot",
+        "children": [band.to_dict() for band in bands],
+        "name": "violin",
+        "visible": True,
+        "shape": "both",
+        "extent": 0.5,
+        "orient": "horizontal",
+    }
+    layer = ViolinPlot.from_dict(d, backend="mock")
+    assert layer.orient.is_vertical
+    assert len(layer) == 2
+    assert_color_equal(layer.face.color[0], "red")
+    assert_color_equal(layer.face.color[1], "blue")
+    for item, band in zip(layer, bands):
+        assert_allclose(item.data.y1, band.data.y1)
+    layer[-1].data = x, -x, x
+    assert_allclose(layer.data[1].y1, x)
+    with pytest.raises(IndexError):
+        layer[2]
+
+
+def test_violin_items(backend: str):
+    from whitecanvas.layers.group import ViolinPlot
+
+    if backend == "plotly":
+        pytest.skip("plotly does not support per-band face and edge properties")
+    canvas = new_canvas(backend=backend)
+    rng = np.random.default_rng(0)
+    data = [rng.normal(size=10) for _ in range(3)]
+    layer = ViolinPlot.from_arrays([0, 1, 2], data, backend=backend)
+    canvas.add_layer(layer)
+    assert len(layer) == 3
+    with filter_warning(backend, "vispy"):
+        layer[1].face.color = "red"
+        layer[1].edge.update(color="blue", width=2)
+    assert_color_equal(layer.face.color[1], "red")
+    assert_color_equal(layer[1].face.color, "red")
+    assert_color_equal(layer[1].edge.color, "blue")
+    if backend != "vispy":
+        assert layer[1].edge.width == pytest.approx(2)
+    assert not np.allclose(layer.face.color[0], layer.face.color[1])
+    layer[0].with_face(alpha=0.5)
+    layer[2].visible = False
+    assert layer[0].face.alpha == pytest.approx(0.5, abs=0.01)
+    assert not layer[2].visible
+    assert layer[2].face.alpha == 0
+    layer[2].visible = True
+    assert layer[2].visible
+    assert layer[2].face.alpha == pytest.approx(layer[1].face.alpha)
+    layer[0].with_hover_text("first")
+    assert layer._hover_texts == ["first", "", ""]
+
+def test_multiline(backend: str):
+    from whitecanvas.layers import MultiLine
+
+    canvas = new_canvas(backend=backend)
+    data = [np.stack([np.arange(n), np.arange(n) ** 2], axis=1) for n in [2, 5, 3]]
+    layer = canvas.add_layer(MultiLine(data, backend=backend))
+    assert layer.nlines == 3
+    assert_allclose(layer.data.lengths, [2, 5, 3])
+    assert_allclose(layer.data.coords, np.concatenate(data))
+    for seg, seg0 in zip(layer.data, data):
+        assert_allclose(seg, seg0)
+    # lines are views of one buffer
+    assert np.shares_memory(layer.data[1], layer.data.coords)
+    assert_allclose(layer.data[1:][0], data[1])
+    if backend in ("matplotlib", "bokeh"):
+        # the stored data is returned as a read-only view
+        with pytest.raises(ValueError):
+            layer.data[0][0, 0] = 1.0
+    with filter_warning(backend, "plotly"):
+        layer.color = ["red", "green", "blue"]
+    layer.with_hover_text(["a", "b", "c"])
+    _test_visibility(layer)
+    canvas.autoscale()
+    layer.read_json(layer.write_json(), backend=backend)
+    layer.data = np.zeros((3, 4, 2))
+    assert_allclose(layer.data.lengths, [4, 4, 4])
+
+
 def test_image(backend: str):
     canvas = new_canvas(backend=backend)
 
@@ -273,6 +482,11 @@ def test_image(backend: str):
     assert layer.cmap == "viridis"
     layer.clim = (0.5, 1.5)
     assert layer.clim == (0.5, 1.5)
+    layer.clim = None
+    assert layer.clim == pytest.approx((layer.data.min(), layer.data.max()))
+    layer.autoscale((10, 90), sample_size=25)
+    low, high = layer.clim
+    assert layer.data.min() < low < high < layer.data.max()
     _test_visibility(layer)
     assert layer.data.shape == (10, 10)
     layer.data = np.random.random((10, 10))
@@ -288,6 +502,43 @@ def test_image(backend: str):
     assert layer.shift == layer_copy.shift
     layer.read_json(layer.write_json(), backend=backend)
 
+def test_image_tiles_vispy(monkeypatch):
+    from whitecanvas.backend.vispy import image as _vispy_image
+
+    monkeypatch.setattr(_vispy_image, "_TILE_SIZE", 16)
+    monkeypatch.setattr(_vispy_image, "_OVERVIEW_SIZE", 32)
+    canvas = new_canvas(backend="vispy")
+    img = np.random.default_rng(0).random((60, 100))
+    layer = canvas.add_image(img)
+    backend = layer._backend
+    assert backend._data.shape == (15, 25)  # downsampled overview
+    assert backend._plt_get_data() is img
+
+    def visible_tiles():
+        return {key for key, tile in backend._tiles.items() if tile.visible}
+
+    canvas.x.lim = (1, 10)
+    canvas.y.lim = (1, 10)
+    assert visible_tiles() == {(0, 0)}
+    canvas.x.lim = (40, 50)
+    canvas.y.lim = (20, 30)
+    assert visible_tiles() == {(16, 32), (16, 48)}
+    # contrast limits are updated without re-creating the tiles
+    tiles = dict(backend._tiles)
+    layer.clim = (0.2, 0.8)
+    assert backend._tiles == tiles
+    assert all(tile.clim == (0.2, 0.8) for tile in tiles.values())
+    # tiles are evicted when they exceed the memory budget
+    monkeypatch.setattr(_vispy_image, "_TILE_MEMORY_BUDGET", 16 * 16 * 4 * 3)
+    canvas.x.lim = (70, 80)
+    assert len(backend._tiles) <= 3
+    canvas.x.lim = (0, 100)
+    canvas.y.lim = (0, 60)
+    assert visible_tiles() == set()
+    layer.shift = (10, 10)
+    layer.data = np.zeros((10, 10))
+    assert len(backend._tiles) == 0
+
 def test_errorbars(backend: str):
     canvas = new_canvas(backend=backend)
 
@@ -384,6 +635,43 @@ def test_texts(backend: str):
     layer_copy = layer.copy()
     assert layer.family == layer_copy.family
 
+def test_texts_culling_matplotlib():
+    canvas = new_canvas(backend="matplotlib")
+    x, y = np.meshgrid(np.arange(100), np.arange(100))
+    layer = canvas.add_text(x.ravel(), y.ravel(), ["text"] * x.size)
+    canvas.x.lim = (-0.5, 99.5)
+    canvas.y.lim = (-0.5, 99.5)
+    renderer = canvas.native.figure.canvas.get_renderer()
+    # overlapping texts are hidden when zoomed out
+    assert 0 < layer._backend._indices_to_draw(renderer).size < x.size
+    # texts outside of the view are not drawn
+    canvas.x.lim = (10, 20)
+    canvas.y.lim = (10, 20)
+    indices = layer._backend._indices_to_draw(renderer)
+    assert indices.size > 0
+    assert np.all((x.ravel()[indices] > 0) & (y.ravel()[indices] > 0))
+    canvas.screenshot()
+
+def test_texts_bbox_matplotlib():
+    canvas = new_canvas(backend="matplotlib")
+    layer = canvas.add_text([0, 1, 2], [0, 1, 2], ["a", "b", "c"])
+    layer.face.color = "red"
+    layer.face.hatch = "/"
+    layer.edge.width = 2
+    layer.edge.style = ":"
+    children = layer._backend.get_children()
+    assert_color_equal(layer.face.color, "red")
+    assert layer.edge.width == pytest.approx(2)
+    canvas.screenshot()
+    for child in children:
+        patch = child.get_bbox_patch()
+        assert_color_equal(patch.get_facecolor(), "red")
+        assert patch.get_hatch() == "/"
+        assert patch.get_linewidth() == pytest.approx(2)
+    layer.data = [0, 1, 2, 3], [0, 1, 2, 3], ["a", "b", "c", "d"]
+    assert len(layer.face.color) == 4
+
+
 def test_with_text(backend: str):
     canvas = new_canvas(backend=backend)
     x = np.arange(10)
@@ -37,6 +37,44 @@ def test_hist():
     layer.edges
     layer.update_edges([-2, 0, 1, 2])
 
+def test_hist_accumulate():
+    canvas = new_canvas(backend="mock")
+    rng = np.random.default_rng(1642)
+    data = rng.normal(size=(5, 100))
+    layer = canvas.add_hist(data[0], bins=10, limits=(-2, 2))
+    for arr in data[1:]:
+        layer.accumulate(arr)
+    expected = canvas.add_hist(data.ravel(), bins=10, limits=(-2, 2))
+    assert layer.data is None
+    assert_allclose(layer.counts, expected.counts)
+    for kind in ["count", "density", "probability", "frequency", "percent"]:
+        layer.kind = expected.kind = kind
+        assert_allclose(layer.line.data.y, expected.line.data.y)
+    layer.shape = expected.shape = "step"
+    assert_allclose(layer.fill.data.y1, expected.fill.data.y1)
+    with pytest.raises(ValueError):
+        layer.update_edges(5)
+
+    # exponential decay
+    layer = canvas.add_hist([], bins=[0, 1, 2])
+    layer.accumulate([0.5, 0.5, 1.5])
+    layer.accumulate([1.5, 2.0], decay=0.5)
+    assert_allclose(layer.counts, [1, 2.5])
+
+    # sliding window
+    layer = canvas.add_hist([], bins=[0, 1, 2])
+    layer.accumulate([0.5, 0.5], window=2)
+    layer.accumulate([1.5], window=2)
+    assert_allclose(layer.counts, [2, 1])
+    layer.accumulate([1.5, 1.5], window=2)
+    assert_allclose(layer.counts, [0, 3])
+    layer.accumulate([0.5], window=1)
+    assert_allclose(layer.counts, [1, 0])
+    with pytest.raises(TypeError):
+        layer.accumulate([0.5], decay=0.5, window=2)
+    layer_copy = layer.copy()
+    assert_allclose(layer_copy.counts, [1, 0])
+
 def test_kde():
     canvas = new_canvas(backend="mock")
     rng = np.random.default_rng(1642)
@@ -71,6 +109,54 @@ def test_hover_template():
     with pytest.raises(ValueError):
         layer.with_hover_template("c: {c}", extra={"c": [0, 1, 4, 5]})
 
+def test_hover_template_collections():
+    from whitecanvas.layers.group import BandCollection, LineCollection
+
+    lines = LineCollection.from_segments([np.zeros((3, 2))] * 3, backend="mock")
+    band_data = [([0, 1], [0, 0], [1, 1])] * 3
+    bands = BandCollection.from_data_list(band_data, backend="matplotlib")
+    with pytest.raises(KeyError):
+        lines.with_hover_template("{c}")
+    texts = []
+    for line in lines:
+        line.with_hover_text = texts.append
+    lines.with_hover_template("{i}: {a:.1f}", extra={"a": [0.5, 1.5, 2.5]})
+    assert texts == ["0: 0.5", "1: 1.5", "2: 2.5"]
+    bands.with_hover_template("band-{i}")
+    assert [band._backend._hover_texts for band in bands] == [
+        ["band-0"], ["band-1"], ["band-2"]
+    ]
+
+def test_hover_texts_lazy():
+    from whitecanvas.utils.template import HoverTexts
+
+    rng = np.random.default_rng(0)
+    params = {
+        "x": rng.normal(size=20),
+        "y": rng.normal(size=20).astype(np.float32),
+        "i": np.arange(20),
+        "s": [f"s{i}" for i in range(20)],
+    }
+    templates = [
+        "const {{brace}}",
+        "x={x:.2f}, y={y}",
+        "{y!s} {y!r} {i:>4d}",
+        "{s!r}: {s[1]} {x.real:.1e}",
+    ]
+    for template in templates:
+        expected = [
+            template.format(**{k: v[i] for k, v in params.items()}) for i in range(20)
+        ]
+        texts = HoverTexts(template, params, 20)
+        assert len(texts) == 20
+        assert texts[3] == expected[3]
+        assert texts[-1] == expected[-1]
+        assert list(texts) == expected
+        assert list(texts[4:9]) == expected[4:9]
+        assert list(texts[np.array([5, 2])]) == [expected[5], expected[2]]
+    with pytest.raises(KeyError):
+        HoverTexts("{z}", params, 20)
+
 def test_fit():
     canvas = new_canvas(backend="mock")
     rng = np.random.default_rng(1642)
@@ -185,3 +271,136 @@ def test_read_write_json_file():
     assert_allclose(markers.data.x, [1, 2, 3])
     assert_allclose(markers.data.y, [4, 5, 6])
     plt.close("all")
+
+def test_grouped_array():
+    from whitecanvas.utils.grouped import GroupedArray
+
+    rng = np.random.default_rng(0)
+    arrays = [rng.normal(size=rng.integers(1, 30)) for _ in range(50)]
+    grouped = GroupedArray.from_arrays(arrays)
+    q = [0, 0.1, 0.25, 0.5, 0.75, 1]
+    assert_allclose(grouped.quantile(q), np.stack([np.quantile(a, q) for a in arrays], axis=1))
+    assert_allclose(grouped.mean(), [np.mean(a) for a in arrays])
+    assert_allclose(
+        grouped.std(ddof=1), [np.std(a, ddof=1) if a.size > 1 else 0 for a in arrays]
+    )
+    codes = np.repeat(np.arange(len(arrays)), [a.size for a in arrays])
+    grouped = GroupedArray.from_codes(np.concatenate(arrays), codes)
+    assert_allclose(grouped.median(), [np.median(a) for a in arrays])
+
+def test_grouped_bootstrap():
+    from whitecanvas.utils.grouped import GroupedArray
+
+    rng = np.random.default_rng(0)
+    grouped = GroupedArray.from_arrays([rng.normal(size=40), rng.normal(3, size=60)])
+    low, high = grouped.bootstrap(n_boot=2000, seed=1)
+    assert np.all(low < grouped.mean()) and np.all(grouped.mean() < high)
+    low2, high2 = grouped.bootstrap(n_boot=2000, seed=1, n_workers=2)
+    assert_allclose(low, low2)
+    assert_allclose(high, high2)
+
+def test_grid_index():
+    from whitecanvas.utils.spatial import GridIndex
+
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=500)
+    y = rng.normal(size=500) * 10
+    x[3] = np.nan
+    index = GridIndex(x, y)
+    for _ in range(20):
+        qx, qy = rng.normal(size=2) * [2, 20]
+        dist = np.hypot(x - qx, y - qy)
+        dist[3] = np.inf
+        indices, distances = index.nearest(qx, qy, k=3)
+        assert_allclose(indices, np.argsort(dist)[:3])
+        assert_allclose(distances, np.sort(dist)[:3])
+        assert np.all(index.nearest(qx, qy, k=3, max_dist=1.0)[1] <= 1.0)
+        left, right = np.sort(rng.normal(size=2))
+        bottom, top = np.sort(rng.normal(size=2) * 10)
+        with np.errstate(invalid="ignore"):
+            inside = (left <= x) & (x <= right) & (bottom <= y) & (y <= top)
+        indices = index.query_rect(left, right, bottom, top)
+        assert_allclose(indices, np.flatnonzero(inside))
+    assert GridIndex([], []).nearest(0, 0)[0].size == 0
+
+def test_as_color_array():
+    from cmap import Color
+    from whitecanvas.utils.normalize import as_color_array, hex_colors
+
+    rng = np.random.default_rng(0)
+    ints = rng.integers(0, 256, size=(30, 4))
+    hex9 = np.array(["#%02x%02X%02x%02x" % tuple(row) for row in ints])
+    hex7 = np.array(["#%02x%02x%02x" % tuple(row[:3]) for row in ints])
+    names = rng.choice(["red", "blue", "#f0a", "#FF000080", "rgba(0, 255, 0, 0.5)"], 30)
+    for colors in [hex9, hex7, np.where(ints[:, 0] > 128, hex9, hex7), names,
+                   names.astype(object)]:
+        expected = np.stack([Color(c).rgba for c in colors]).astype(np.float32)
+        out = as_color_array(colors, 30)
+        assert out.dtype == np.float32
+        assert_allclose(out, expected)
+        assert hex_colors(out) == [Color(c).hex for c in out]
+    with pytest.raises(ValueError):
+        as_color_array(np.array(["#gg0000", "red"]), 2)
+    with pytest.raises(ValueError):
+        as_color_array(np.array(["red", "not-a-color"]), 2)
+    arr = np.zeros((30, 4), dtype=np.float32)
+    assert as_color_array(arr, 30) is arr
+
+def test_colormap_lut():
+    from cmap import Colormap
+    from whitecanvas.utils.lut import LUT_SIZE, colormap_lut, map_colors
+
+    cmap = Colormap("viridis")
+    assert colormap_lut(cmap).shape == (LUT_SIZE, 4)
+    assert colormap_lut(cmap).base is colormap_lut(cmap).base  # cached
+    rng = np.random.default_rng(0)
+    values = rng.uniform(-0.2, 1.2, size=(20, 30))
+    values[0, :4] = [np.nan, 0.0, 1.0, np.inf]
+    expected = cmap(values, N=LUT_SIZE).astype(np.float32)
+    assert_allclose(map_colors(cmap, values), expected)
+    assert_allclose(map_colors(cmap, values * 10 + 5, clim=(5, 15)), expected, atol=1e-6)
+
+    canvas = new_canvas(backend="mock")
+    img = canvas.add_image(rng.normal(size=(10, 10)), cmap="viridis")
+    img.clim = (-1, 1)
+    assert img.data_mapped.shape == (10, 10, 4)
+    data_norm = (img.data - -1) / 2
+    assert_allclose(img.data_mapped, cmap(data_norm, N=LUT_SIZE), atol=1e-6)
+
+def _imported_modules(code: str) -> dict[str, int]:
+    """Run code with `python -X importtime` and return the cumulative import times."""
+    import subprocess
+    import sys
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True,
+        cwd=Path(__file__).parent.parent,
+    )  # fmt: skip
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+def test_lazy_import():
+    heavy = ["cmap", "whitecanvas.canvas", "whitecanvas.layers"]
+    times = _imported_modules("import whitecanvas")
+    assert not any(mod in times for mod in heavy)
+    times = _imported_modules(
+        "from whitecanvas import new_canvas; new_canvas('mock').add_line([0, 1])"
+    )
+    assert "whitecanvas.canvas" in times
+    unused = [
+        "whitecanvas.canvas.dataframe",
+        "whitecanvas.canvas._joint",
+        "whitecanvas.canvas.canvas3d",
+        "whitecanvas.layers.tabular",
+    ]
+    assert not any(mod in times for mod in unused)
+    # submodules can be imported before the top-level functions are accessed
+    times = _imported_modules("import whitecanvas.layers; import whitecanvas.theme")
+    assert "whitecanvas.layers" in times
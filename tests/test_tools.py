@@ -1,3 +1,4 @@
+import time
 import numpy as np
 from whitecanvas import new_canvas
 from whitecanvas import tools
@@ -103,3 +104,82 @@ def test_point_contained():
         assert sel.contains_point([0.5, 0.5])
         assert not sel.contains_point(1.5, 0.5)
         assert np.all(sel.contains_points([(1.5, 1.4), (0.2, 1.8)]) == [True, False])
+
+def test_lasso_tracked_points():
+    canvas = new_canvas("mock")
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-0.5, 2.5, size=(200, 2))
+    markers = canvas.add_markers(points[:, 0], points[:, 1])
+    with tools.lasso_selector(canvas) as sel:
+        sel.track_points(markers)
+        canvas.mouse.emulate_drag([[0, 0], [0, 1], [2, 1], [2, 2], [1, 2], [1, 0]])
+        expected = sel.contains_points(points)
+        assert np.all(sel.tracked_points_inside() == expected)
+        assert np.all(sel.contains_points(markers) == expected)
+
+def test_cross_filter():
+    canvas0 = new_canvas("mock")
+    canvas1 = new_canvas("mock")
+    df = {"x": np.arange(10.0), "y": np.arange(10.0) % 3, "z": np.arange(10.0)[::-1]}
+    cf = tools.CrossFilter(10, dim_alpha=0.5, msec=0)
+    layer0 = cf.add_layer(canvas0.cat(df, "x", "y").add_markers())
+    layer1 = cf.add_layer(canvas1.add_markers(df["x"], df["z"]))
+    layer2 = cf.add_layer(canvas1.add_markers([0, 1], [0, 1]), rows=[9, 2])
+    mock = MagicMock()
+    cf.changed.connect(mock)
+    selector = tools.rect_selector(canvas0)
+    cf.connect_selector(selector, layer0)
+    canvas0.mouse.emulate_drag([[1.5, -1], [4.5, 10]])
+    mock.assert_called_once()
+    assert list(np.flatnonzero(cf.selection)) == [2, 3, 4]
+    alpha = layer1.face.color[:, 3]
+    assert np.all(alpha[[2, 3, 4]] == 1) and np.all(alpha[[0, 1, 5]] == 0.5)
+    assert list(layer2.face.color[:, 3]) == [0.5, 1]
+    assert np.all(layer0.base.face.color[:, 3] == alpha)
+    cf.clear()
+    assert cf.selection.all()
+    assert np.all(layer1.face.color[:, 3] == 1)
+    cf.select([0])
+    cf.remove_layer(layer1)
+    assert np.all(layer1.face.color[:, 3] == 1)
+
+def test_cross_filter_throttled():
+    canvas = new_canvas("mock")
+    cf = tools.CrossFilter(10, dim_alpha=0.5, msec=50)
+    layer = cf.add_layer(canvas.add_markers(np.arange(10.0), np.arange(10.0)))
+    # programmatic selection is always applied immediately
+    cf.select([0])
+    cf.select([1])
+    assert list(np.flatnonzero(layer.face.color[:, 3] == 1)) == [1]
+    selector = tools.rect_selector(canvas)
+    cf.connect_selector(selector, layer)
+    canvas.mouse.emulate_drag([[1.5, 1.5], [4.5, 4.5]])  # applied on release
+    assert list(np.flatnonzero(layer.face.color[:, 3] == 1)) == [2, 3, 4]
+    cf.select([0])
+    # selections from the selector coming faster than msec are merged ...
+    selector.changed.emit(selector.selection)
+    assert list(np.flatnonzero(cf.selection)) == [2, 3, 4]
+    assert list(np.flatnonzero(layer.face.color[:, 3] == 1)) == [0]
+    # ... and the last one is applied without any further event
+    for _ in range(100):
+        time.sleep(0.01)
+        if layer.face.color[0, 3] != 1:
+            break
+    assert list(np.flatnonzero(layer.face.color[:, 3] == 1)) == [2, 3, 4]
+
+def test_selector_blitting_matplotlib():
+    canvas = new_canvas("matplotlib")
+    canvas.add_markers(np.random.random(1000), np.random.random(1000))
+    tools.rect_selector(canvas)
+    fig = canvas.native.figure
+    # interactive canvases (such as QtAgg if a QApplication is running) defer
+    # draw_idle to the event loop, which does not run here
+    fig.canvas.draw_idle = fig.canvas.draw
+    fig.canvas.draw()
+    fig.canvas.blit = MagicMock()
+    canvas.mouse.emulate_drag([[0, 0], [0.2, 0.3], [0.5, 0.5], [1, 1]])
+    assert fig.canvas.blit.call_count > 0
+    assert not fig.stale
+    background = canvas._canvas()._background
+    canvas.x.lim = (0, 2)
+    assert canvas._canvas()._background is not background
@@ -1,23 +1,26 @@
 __version__ = "0.3.3"
 
-from whitecanvas import theme
-from whitecanvas.canvas import link_axes
-from whitecanvas.core import (
-    load_dataset,
-    new_canvas,
-    new_canvas_3d,
-    new_col,
-    new_grid,
-    new_jointgrid,
-    new_row,
-    read_canvas,
-    read_canvas_3d,
-    read_col,
-    read_grid,
-    read_jointgrid,
-    read_row,
-    wrap_canvas,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from whitecanvas import theme
+    from whitecanvas.canvas import link_axes
+    from whitecanvas.core import (
+        load_dataset,
+        new_canvas,
+        new_canvas_3d,
+        new_col,
+        new_grid,
+        new_jointgrid,
+        new_row,
+        read_canvas,
+        read_canvas_3d,
+        read_col,
+        read_grid,
+        read_jointgrid,
+        read_row,
+        wrap_canvas,
+    )
 
 __all__ = [
     "new_canvas",
@@ -37,3 +40,27 @@ __all__ = [
     "theme",
     "link_axes",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Canvas classes depend on all the layers and cmap. They are imported on the first
+    # access (PEP 562) so that `import whitecanvas` itself is fast.
+    if name == "theme":
+        # `from whitecanvas import theme` would call this function again
+        import importlib
+
+        out = importlib.import_module("whitecanvas.theme")
+    elif name == "link_axes":
+        from whitecanvas.canvas import link_axes as out
+    elif name in __all__:
+        from whitecanvas import core
+
+        out = getattr(core, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = out
+    return out
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -9,8 +9,6 @@ from typing import Any
 import numpy as np
 from cmap import Color, Colormap
 
-from whitecanvas.canvas._palette import ColorPalette
-
 
 @lru_cache(maxsize=1)
 def catalog_names():
@@ -19,6 +17,10 @@ def catalog_names():
 
 class CustomEncoder(json.JSONEncoder):
     def default(self, obj):
+        # importing the canvas module here avoids a cycle when `whitecanvas.layers`
+        # is imported before `whitecanvas.canvas`
+        from whitecanvas.canvas._palette import ColorPalette
+
         if isinstance(obj, dict):
             if isinstance(color := obj.get("color"), np.ndarray):
                 if color.ndim == 1:
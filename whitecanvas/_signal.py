@@ -11,9 +11,8 @@ from typing import (
     overload,
 )
 
-from psygnal import throttled
-
-from whitecanvas.types import MouseEvent
+from whitecanvas.types import MouseEvent, MouseEventType
+from whitecanvas.utils.throttle import CallLater, Throttled
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -28,22 +27,80 @@ _F = TypeVar("_F", bound=Callable)
 
 
 class _Slot(Generic[_G]):
-    def __init__(self, slot: _G, msec: int = 0, leading: bool = True):
+    """
+    A mouse move callback.
+
+    If `msec` is positive, mouse move events are coalesced; only the latest pending
+    event is delivered at most once per `msec`. The pending move event is delivered
+    by the trailing call scheduled with `call_later` (in the GUI event loop of the
+    canvas), by the next event after the interval, or just before a press, release
+    or double-click event, which are always delivered immediately.
+    """
+
+    def __init__(
+        self,
+        slot: _G,
+        msec: int = 0,
+        leading: bool = True,
+        call_later: CallLater | None = None,
+    ):
         self._slot_orig = slot
-        if not inspect.isgeneratorfunction(slot):
-            fn = _to_generator_function(slot)
-        else:
-            fn = slot
-        if msec > 0:
-            fn = throttled(fn, timeout=msec, leading=leading)
-        self._slot = fn
+        self._is_generator = inspect.isgeneratorfunction(slot)
         self._generator: Generator | None = None
         self._current_event: MouseEvent | None = None
+        self._pending_event: MouseEvent | None = None
+        self._leading = leading
+        self._call_later = call_later
+        self._use_default_interval = False
+        self.set_interval(msec)
+
+    @property
+    def interval(self) -> int:
+        """Minimum interval of the move event delivery in milliseconds."""
+        return self._msec
+
+    def set_interval(self, msec: int) -> None:
+        """Set the minimum interval of the move event delivery."""
+        if msec < 0:
+            raise ValueError(f"msec must be non-negative, got {msec!r}.")
+        self._msec = msec
+        if msec > 0:
+            self._deliver = Throttled(
+                self._deliver_pending,
+                msec=msec,
+                leading=self._leading,
+                call_later=self._call_later,
+            )
+        else:
+            self._deliver = self._deliver_pending
 
     def next(self, ev: MouseEvent):
         """Advance the slot."""
+        if ev.type == MouseEventType.MOVE:
+            self._pending_event = ev  # older pending event is dropped
+            self._deliver()
+        else:
+            self.flush()  # such as the last move event before release
+            self._advance(ev)
+
+    def flush(self) -> None:
+        """Deliver the pending move event immediately."""
+        if isinstance(self._deliver, Throttled):
+            self._deliver.flush()
+        else:
+            self._deliver_pending()
+
+    def _deliver_pending(self) -> None:
+        if (ev := self._pending_event) is not None:
+            self._pending_event = None
+            self._advance(ev)
+
+    def _advance(self, ev: MouseEvent):
+        if not self._is_generator:
+            self._slot_orig(ev)
+            return
         if self._generator is None:
-            self._generator = self._slot(ev)
+            self._generator = self._slot_orig(ev)
             self._current_event = ev
         try:
             self._current_event.update(ev)
@@ -53,13 +110,6 @@ class _Slot(Generic[_G]):
             return
 
 
-def _to_generator_function(f: Callable[[MouseEvent], Any | None]):
-    def _f(ev: MouseEvent):
-        yield f(ev)
-
-    return _f
-
-
 class _MouseSignalMixin:
     def __init__(self):
         self._slots: list[_Slot] = []
@@ -83,18 +133,50 @@ class _MouseSignalMixin:
 
 
 class MouseMoveSignal(_MouseSignalMixin):
+    def __init__(self):
+        super().__init__()
+        self._msec = 0
+        self._call_later: CallLater | None = None
+
+    def __get__(self, instance: Any, owner: type[Any] | None = None) -> Self:
+        out = super().__get__(instance, owner)
+        if instance is not None:
+            # trailing events are delivered in the event loop of the canvas
+            out._call_later = getattr(instance, "_call_later", None)
+        return out
+
+    @property
+    def interval(self) -> int:
+        """Default minimum interval of the callbacks in milliseconds."""
+        return self._msec
+
+    @interval.setter
+    def interval(self, msec: int):
+        if msec < 0:
+            raise ValueError(f"msec must be non-negative, got {msec!r}.")
+        for slot in self._slots:
+            if slot._use_default_interval:
+                slot.set_interval(msec)
+        self._msec = msec
+
     @overload
-    def connect(self, slot: _G, *, msec: int = 0, leading: bool = True) -> _G: ...
+    def connect(
+        self, slot: _G, *, msec: int | None = None, leading: bool = True
+    ) -> _G: ...
 
     @overload
     def connect(
-        self, slot: None = None, *, msec: int = 0, leading: bool = True
+        self, slot: None = None, *, msec: int | None = None, leading: bool = True
     ) -> Callable[[_G], _G]: ...
 
-    def connect(self, slot=None, *, msec: int = 0, leading: bool = True):
+    def connect(self, slot=None, *, msec: int | None = None, leading: bool = True):
         """
         Connect a mouse move callback.
 
+        If `msec` is given, mouse move events that come faster than this interval are
+        coalesced and only the latest one is delivered. The default interval of the
+        signal is used if not given.
+
         >>> @canvas.mouse.moved.connect
         >>> def on_mouse_move(ev: MouseEvent):
         ...     print(started)
@@ -108,7 +190,12 @@ class MouseMoveSignal(_MouseSignalMixin):
         def _inner(slot: _F) -> _F:
             if not callable(slot):
                 raise TypeError(f"Can only connect callable object, got {slot!r}")
-            self._slots.append(_Slot(slot, msec=msec, leading=leading))
+            _msec = self._msec if msec is None else msec
+            _slot = _Slot(
+                slot, msec=_msec, leading=leading, call_later=self._call_later
+            )
+            _slot._use_default_interval = msec is None
+            self._slots.append(_slot)
             return slot
 
         return _inner(slot) if slot is not None else _inner
@@ -124,7 +211,7 @@ class MouseMoveSignal(_MouseSignalMixin):
             if _slot._slot_orig is slot:
                 i = _i
                 break
-        if i > 0:
+        if i >= 0:
             self._slots.pop(i)
         elif not missing_ok:
             raise ValueError(f"Slot {slot!r} not found")
@@ -135,6 +222,17 @@ class MouseMoveSignal(_MouseSignalMixin):
         for slot in self._slots:
             slot.next(ev)
 
+    def flush(self) -> None:
+        """Deliver all the pending mouse move events immediately."""
+        for slot in self._slots:
+            slot.flush()
+
+    def _copy(self):
+        new = super()._copy()
+        new._msec = self._msec
+        new._call_later = self._call_later
+        return new
+
 
 class MouseSignal(_MouseSignalMixin, Generic[_R]):
     def __init__(self, typ: type[_R]):
@@ -165,7 +263,7 @@ class MouseSignal(_MouseSignalMixin, Generic[_R]):
             if _slot is slot:
                 i = _i
                 break
-        if i > 0:
+        if i >= 0:
             self._slots.pop(i)
         elif not missing_ok:
             raise ValueError(f"Slot {slot!r} not found")
@@ -5,6 +5,14 @@ import numpy as np
 from whitecanvas.types import Hatch, LineStyle
 
 
+def _fit_rows(values: list, ndata: int, default) -> list:
+    """Fit the stored values to the current number of data, which may change."""
+    if len(values) >= ndata:
+        return values[:ndata]
+    last = values[-1] if values else default
+    return values + [last] * (ndata - len(values))
+
+
 def edge_style():
     def _getter(self):
         return getattr(self, "__edge_style_value", LineStyle.SOLID)
@@ -17,14 +25,13 @@ def edge_style():
 
 def edge_styles():
     def _getter(self):
-        return getattr(
-            self, "__edge_style_value", [LineStyle.SOLID] * self._plt_get_ndata()
-        )
+        values = getattr(self, "__edge_style_value", [])
+        return _fit_rows(values, self._plt_get_ndata(), LineStyle.SOLID)
 
     def _setter(self, value: LineStyle | list[LineStyle]):
         if isinstance(value, LineStyle):
             value = [value] * self._plt_get_ndata()
-        setattr(self, "__edge_style_value", value)
+        setattr(self, "__edge_style_value", list(value))
 
     return _getter, _setter
 
@@ -63,13 +70,12 @@ def face_hatch():
 
 def face_hatches():
     def _getter(self):
-        return getattr(
-            self, "__face_hatch_value", [Hatch.SOLID] * self._plt_get_ndata()
-        )
+        values = getattr(self, "__face_hatch_value", [])
+        return _fit_rows(values, self._plt_get_ndata(), Hatch.SOLID)
 
     def _setter(self, value: Hatch | list[Hatch]):
         if isinstance(value, Hatch):
             value = [value] * self._plt_get_ndata()
-        setattr(self, "__face_hatch_value", value)
+        setattr(self, "__face_hatch_value", list(value))
 
     return _getter, _setter
@@ -1,5 +1,5 @@
 from whitecanvas.backend.bokeh._base import to_html
-from whitecanvas.backend.bokeh.band import Band
+from whitecanvas.backend.bokeh.band import Band, MultiBand
 from whitecanvas.backend.bokeh.bars import Bars
 from whitecanvas.backend.bokeh.canvas import Canvas, CanvasGrid
 from whitecanvas.backend.bokeh.image import Image
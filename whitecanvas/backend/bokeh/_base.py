@@ -12,7 +12,7 @@ from numpy.typing import NDArray
 
 from whitecanvas.protocols import BaseProtocol
 from whitecanvas.types import Hatch, LineStyle, Symbol
-from whitecanvas.utils.normalize import arr_color, hex_color
+from whitecanvas.utils.normalize import arr_color, hex_color, hex_colors
 
 _M = TypeVar("_M", bound=bk_models.Model)
 
@@ -48,7 +48,7 @@ class HeteroLayer(BokehLayer[_M]):
         if color.ndim == 1:
             color = [hex_color(color)] * self._plt_get_ndata()
         else:
-            color = [hex_color(c) for c in color]
+            color = hex_colors(color)
         self._data.data["face_color"] = color
 
     def _plt_get_face_hatch(self) -> list[Hatch]:
@@ -90,7 +90,7 @@ class HeteroLayer(BokehLayer[_M]):
         if color.ndim == 1:
             color = [hex_color(color)] * self._plt_get_ndata()
         else:
-            color = [hex_color(c) for c in color]
+            color = hex_colors(color)
         self._data.data["edge_color"] = color
 
 
@@ -101,7 +101,7 @@ class SupportsMouseEvents:
             self._model.on_event(event, lambda e: callback(e.indices))
 
     def _plt_set_hover_text(self, text: list[str]):
-        self._data.data["hovertexts"] = text
+        self._data.data["hovertexts"] = list(text)  # format all the lazy texts at once
 
 
 def to_bokeh_line_style(style: LineStyle) -> str:
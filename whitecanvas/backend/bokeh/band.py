@@ -2,14 +2,16 @@ from __future__ import annotations
 
 import bokeh.models as bk_models
 import numpy as np
+from numpy.typing import NDArray
 
 from whitecanvas.backend.bokeh._base import (
     BokehLayer,
+    HeteroLayer,
     SupportsMouseEvents,
     from_bokeh_hatch,
     to_bokeh_hatch,
 )
-from whitecanvas.protocols import BandProtocol, check_protocol
+from whitecanvas.protocols import BandProtocol, MultiBandProtocol, check_protocol
 from whitecanvas.types import Hatch, LineStyle, Orientation
 from whitecanvas.utils.normalize import arr_color, hex_color
 
@@ -99,3 +101,69 @@ class Band(BokehLayer["bk_models.VArea | bk_models.HArea"], SupportsMouseEvents)
 
     def _plt_set_hover_text(self, text: str):
         self._data.data["hovertexts"] = [text] * len(self._data.data["t"])
+
+
+_DEFAULTS = {
+    "face_color": "blue",
+    "edge_color": "black",
+    "width": 0.0,
+    "pattern": " ",
+    "style": "solid",
+    "hovertexts": "",
+}
+
+
+@check_protocol(MultiBandProtocol)
+class MultiBand(HeteroLayer[bk_models.Patches], SupportsMouseEvents):
+    def __init__(self, data: list[NDArray[np.number]]):
+        ndata = len(data)
+        self._visible = True
+        self._data = bk_models.ColumnDataSource(
+            data={
+                "x": [verts[:, 0] for verts in data],
+                "y": [verts[:, 1] for verts in data],
+                "face_color": ["blue"] * ndata,
+                "edge_color": ["black"] * ndata,
+                "width": np.zeros(ndata),
+                "pattern": [" "] * ndata,
+                "style": ["solid"] * ndata,
+                "hovertexts": [""] * ndata,
+            }
+        )
+        self._model = bk_models.Patches(
+            xs="x",
+            ys="y",
+            fill_alpha=1.0,
+            line_color="edge_color",
+            line_width="width",
+            fill_color="face_color",
+            hatch_pattern="pattern",
+            line_dash="style",
+        )
+
+    def _plt_get_data(self) -> list[NDArray[np.number]]:
+        xs, ys = self._data.data["x"], self._data.data["y"]
+        return [np.stack([x, y], axis=1) for x, y in zip(xs, ys)]
+
+    def _plt_set_data(self, data: list[NDArray[np.number]]):
+        cur_data = self._data.data.copy()
+        ndata = len(cur_data["x"])
+        cur_data.update(
+            x=[verts[:, 0] for verts in data], y=[verts[:, 1] for verts in data]
+        )
+        cols_to_update = [
+            "face_color", "edge_color", "width", "pattern", "style", "hovertexts"
+        ]  # fmt: skip
+        if len(data) < ndata:
+            for key in cols_to_update:
+                cur_data[key] = cur_data[key][: len(data)]
+        elif len(data) > ndata:
+            for key in cols_to_update:
+                fill = cur_data[key][-1] if ndata > 0 else _DEFAULTS[key]
+                cur_data[key] = np.concatenate(
+                    [cur_data[key], np.full(len(data) - ndata, fill)]
+                )
+        self._data.data = cur_data
+
+    def _plt_get_ndata(self) -> int:
+        return len(self._data.data["x"])
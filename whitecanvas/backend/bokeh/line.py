@@ -12,7 +12,7 @@ from whitecanvas.backend.bokeh._base import (
 )
 from whitecanvas.protocols import LineProtocol, MultiLineProtocol, check_protocol
 from whitecanvas.types import LineStyle
-from whitecanvas.utils.normalize import arr_color, hex_color
+from whitecanvas.utils.normalize import arr_color, hex_color, hex_colors
 
 
 @check_protocol(LineProtocol)
@@ -100,6 +100,7 @@ class MultiLine(BokehLayer[bk_models.MultiLine], SupportsMouseEvents):
         )
         self._visible = True
         self._line_color = "#0000FF"
+        self._lines = data
 
     def _plt_get_ndata(self):
         return len(self._data.data["x"])
@@ -115,13 +116,10 @@ class MultiLine(BokehLayer[bk_models.MultiLine], SupportsMouseEvents):
         self._visible = visible
 
     def _plt_get_data(self):
-        xs, ys = self._data.data["x"], self._data.data["y"]
-        out = []
-        for x, y in zip(xs, ys):
-            out.append(np.stack([x, y], axis=1))
-        return out
+        return self._lines.read_only()
 
     def _plt_set_data(self, data):
+        lines = data
         xdata = []
         ydata = []
         for seg in data:
@@ -159,6 +157,7 @@ class MultiLine(BokehLayer[bk_models.MultiLine], SupportsMouseEvents):
             "hovertexts": hovertexts,
         }
         self._data.data.update(data)
+        self._lines = lines
 
     def _plt_get_edge_width(self) -> NDArray[np.floating]:
         return self._data.data["width"]
@@ -186,7 +185,7 @@ class MultiLine(BokehLayer[bk_models.MultiLine], SupportsMouseEvents):
         if color.ndim == 1:
             color = [hex_color(color)] * self._plt_get_ndata()
         else:
-            color = [hex_color(c) for c in color]
+            color = hex_colors(color)
         self._data.data["edge_color"] = color
 
     def _plt_get_antialias(self) -> bool:
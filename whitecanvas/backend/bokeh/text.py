@@ -13,7 +13,7 @@ from whitecanvas.backend.bokeh._base import (
 )
 from whitecanvas.protocols import TextProtocol, check_protocol
 from whitecanvas.types import Alignment, Hatch, LineStyle
-from whitecanvas.utils.normalize import arr_color, as_color_array, hex_color
+from whitecanvas.utils.normalize import arr_color, as_color_array, hex_colors
 from whitecanvas.utils.type_check import is_real_number
 
 # column names
@@ -96,7 +96,7 @@ class Texts(BokehLayer[bk_models.Text]):
 
     def _plt_set_text_color(self, color):
         color = as_color_array(color, len(self._data.data[TEXT]))
-        self._data.data[TEXT_COLOR] = [hex_color(c) for c in color]
+        self._data.data[TEXT_COLOR] = hex_colors(color)
 
     def _plt_get_text_size(self) -> float:
         return np.array(
@@ -172,7 +172,7 @@ class Texts(BokehLayer[bk_models.Text]):
 
     def _plt_set_face_color(self, color):
         color = as_color_array(color, len(self._data.data[TEXT]))
-        self._data.data[BG_COLOR] = [hex_color(c) for c in color]
+        self._data.data[BG_COLOR] = hex_colors(color)
 
     def _plt_get_face_hatch(self) -> list[Hatch]:
         return [from_bokeh_hatch(h) for h in self._data.data[BG_HATCH]]
@@ -187,7 +187,7 @@ class Texts(BokehLayer[bk_models.Text]):
 
     def _plt_set_edge_color(self, color):
         color = as_color_array(color, len(self._data.data[TEXT]))
-        self._data.data[BD_COLOR] = [hex_color(c) for c in color]
+        self._data.data[BD_COLOR] = hex_colors(color)
 
     def _plt_get_edge_width(self) -> NDArray[np.floating]:
         return np.array(self._data.data[BD_WIDTH], dtype=np.float32)
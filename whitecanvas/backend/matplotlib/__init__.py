@@ -1,5 +1,5 @@
 from whitecanvas.backend.matplotlib._base import as_overlay
-from whitecanvas.backend.matplotlib.band import Band
+from whitecanvas.backend.matplotlib.band import Band, MultiBand
 from whitecanvas.backend.matplotlib.bars import Bars
 from whitecanvas.backend.matplotlib.canvas import Canvas, CanvasGrid
 from whitecanvas.backend.matplotlib.image import Image
@@ -3,9 +3,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import matplotlib.markers as mmarkers
+import numpy as np
 
 if TYPE_CHECKING:
     from matplotlib.backend_bases import MouseEvent as mplMouseEvent
+    from numpy.typing import NDArray
 
     from whitecanvas.backend.matplotlib.canvas import Canvas
     from whitecanvas.types import Symbol
@@ -33,6 +35,15 @@ def symbol_to_path(symbol: Symbol):
     return marker_obj.get_path().transformed(marker_obj.get_transform())
 
 
+def _as_rows(arr: NDArray[np.number], ndata: int) -> NDArray[np.number]:
+    """Broadcast the property array of a collection to the number of elements."""
+    if arr.shape[0] == ndata:
+        return arr
+    if arr.shape[0] == 0:
+        return np.zeros((ndata, *arr.shape[1:]), dtype=arr.dtype)
+    return np.resize(arr, (ndata, *arr.shape[1:]))
+
+
 OVERLAY_ZORDER = 10000
 
 
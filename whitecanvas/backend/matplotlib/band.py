@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import warnings
+
 import numpy as np
 from matplotlib.collections import PolyCollection
+from numpy.typing import NDArray
 
-from whitecanvas.backend.matplotlib._base import MplMouseEventsMixin
-from whitecanvas.protocols import BandProtocol, check_protocol
+from whitecanvas.backend.matplotlib._base import MplMouseEventsMixin, _as_rows
+from whitecanvas.protocols import BandProtocol, MultiBandProtocol, check_protocol
 from whitecanvas.types import Hatch, LineStyle, Orientation
+from whitecanvas.utils.normalize import as_color_array
+from whitecanvas.utils.type_check import is_real_number
 
 
 @check_protocol(BandProtocol)
@@ -116,3 +121,74 @@ class Band(PolyCollection, MplMouseEventsMixin):
 
     def _plt_set_hover_text(self, text: str):
         self._hover_texts = [text]
+
+
+@check_protocol(MultiBandProtocol)
+class MultiBand(PolyCollection, MplMouseEventsMixin):
+    def __init__(self, data: list[NDArray[np.floating]]):
+        super().__init__(data, closed=True, picker=True)
+        self._data = data
+        self._edge_style = [LineStyle.SOLID] * len(data)
+        self.set_edgecolor("#00000000")
+        MplMouseEventsMixin.__init__(self)
+
+    def _plt_get_data(self) -> list[NDArray[np.floating]]:
+        return self._data
+
+    def _plt_set_data(self, data: list[NDArray[np.floating]]):
+        self.set_verts(data)
+        self._data = data
+
+    def _plt_get_ndata(self) -> int:
+        return len(self._data)
+
+    ##### HasMultiFaces #####
+    def _plt_get_face_color(self) -> NDArray[np.float32]:
+        return _as_rows(self.get_facecolor(), self._plt_get_ndata())
+
+    def _plt_set_face_color(self, color: NDArray[np.float32]):
+        self.set_facecolor(as_color_array(color, self._plt_get_ndata()))
+
+    def _plt_get_face_hatch(self) -> list[Hatch]:
+        return [Hatch(self.get_hatch() or "")] * self._plt_get_ndata()
+
+    def _plt_set_face_hatch(self, pattern: Hatch | list[Hatch]):
+        if not isinstance(pattern, Hatch):
+            if len(set(pattern)) > 1:
+                warnings.warn(
+                    "matplotlib bands do not support multiple hatch patterns.",
+                    UserWarning,
+                    stacklevel=2,
+                )
+            pattern = pattern[0]
+        if pattern is Hatch.SOLID:
+            ptn = None
+        else:
+            ptn = pattern.value
+        self.set_hatch(ptn)
+
+    ##### HasMultiEdges #####
+    def _plt_get_edge_color(self) -> NDArray[np.float32]:
+        return _as_rows(self.get_edgecolor(), self._plt_get_ndata())
+
+    def _plt_set_edge_color(self, color: NDArray[np.float32]):
+        self.set_edgecolor(as_color_array(color, self._plt_get_ndata()))
+
+    def _plt_get_edge_width(self) -> NDArray[np.floating]:
+        return _as_rows(np.asarray(self.get_linewidth()), self._plt_get_ndata())
+
+    def _plt_set_edge_width(self, width: float | NDArray[np.floating]):
+        if is_real_number(width):
+            width = np.full(self._plt_get_ndata(), width)
+        else:
+            width = np.asarray(width)
+        self.set_linewidth(width)
+
+    def _plt_get_edge_style(self) -> list[LineStyle]:
+        return self._edge_style
+
+    def _plt_set_edge_style(self, style: LineStyle | list[LineStyle]):
+        if isinstance(style, LineStyle):
+            style = [style] * self._plt_get_ndata()
+        self.set_linestyle([s.value for s in style])
+        self._edge_style = list(style)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import warnings
 from timeit import default_timer
-from typing import Callable
+from typing import Callable, Iterator
 
 import matplotlib as mpl
 import numpy as np
@@ -11,6 +11,7 @@ from matplotlib import pyplot as plt
 from matplotlib.artist import Artist
 from matplotlib.backend_bases import MouseButton as mplMouseButton
 from matplotlib.backend_bases import MouseEvent as mplMouseEvent
+from matplotlib.backend_bases import TimerBase
 from matplotlib.collections import Collection
 from matplotlib.lines import Line2D
 from matplotlib.ticker import AutoMinorLocator
@@ -36,6 +37,7 @@ from whitecanvas.types import (
     MouseEventType,
     Rect,
 )
+from whitecanvas.utils.throttle import call_later_in_thread
 
 
 @protocols.check_protocol(protocols.CanvasProtocol)
@@ -59,12 +61,17 @@ class Canvas:
         self._annot.set_visible(False)
         self._hoverable_artists: list[MplMouseEventsMixin] = []
         self._last_hover = -1.0
+        # layers that are redrawn by blitting over the cached background
+        self._animated_layers: list[MplLayer] = []
+        self._background = None
+        self._timers: set[TimerBase] = set()
 
         fig = self._axes.figure
         if fig is None:
             return
         fig.canvas.mpl_connect("motion_notify_event", self._on_hover)
         fig.canvas.mpl_connect("figure_leave_event", self._hide_tooltip)
+        fig.canvas.mpl_connect("draw_event", self._on_draw)
         self._axes.xaxis.set_minor_locator(AutoMinorLocator())
         self._axes.yaxis.set_minor_locator(AutoMinorLocator())
 
@@ -85,6 +92,27 @@ class Canvas:
                 return
         self._hide_tooltip()
 
+    def _on_draw(self, event):
+        if event.canvas.is_saving():
+            # animated artists are drawn as usual when saving
+            return
+        if event.canvas.supports_blit:
+            self._background = event.canvas.copy_from_bbox(self._axes.bbox)
+        self._draw_animated()
+
+    def _iter_animated_artists(self) -> Iterator[Artist]:
+        for layer in self._animated_layers:
+            if isinstance(layer, Bars):
+                yield from layer.patches
+            else:
+                yield layer
+
+    def _draw_animated(self):
+        fig = self._axes.figure
+        for artist in self._iter_animated_artists():
+            if artist.figure is not None:
+                fig.draw_artist(artist)
+
     def _set_tooltip(self, pos: tuple[float, float], text: str):
         # determine in which direction to show the tooltip
         x, y = pos
@@ -165,12 +193,7 @@ class Canvas:
             for child in layer.patches:
                 self._axes.add_patch(child)
             self._axes.add_container(layer)
-        elif isinstance(layer, whitecanvasText):
-            layer.set_transform(self._axes.transData)
-            for child in layer.get_children():
-                self._axes._add_text(child)
-                child.set_clip_path(self._axes.patch)
-        elif isinstance(layer, whitecanvasImage):
+        elif isinstance(layer, (whitecanvasText, whitecanvasImage)):
             self._axes.add_artist(layer)
         else:
             raise NotImplementedError(f"{layer}")
@@ -184,6 +207,16 @@ class Canvas:
         layer.remove()
         if layer in self._hoverable_artists:
             self._hoverable_artists.remove(layer)
+        if layer in self._animated_layers:
+            self._animated_layers.remove(layer)
+
+    def _plt_set_animated(self, layer: MplLayer):
+        """Redraw the layer by blitting, without redrawing the other artists."""
+        artists = layer.patches if isinstance(layer, Bars) else [layer]
+        for artist in artists:
+            artist.set_animated(True)
+        if layer not in self._animated_layers:
+            self._animated_layers.append(layer)
 
     def _plt_get_visible(self) -> bool:
         """Get visibility of canvas"""
@@ -249,7 +282,38 @@ class Canvas:
 
     def _plt_draw(self):
         if fig := self._axes.get_figure():
-            fig.canvas.draw_idle()
+            if self._can_blit(fig):
+                # only animated layers are updated. Changes of the other artists
+                # (data, limits, etc.) mark the figure stale.
+                fig.canvas.restore_region(self._background)
+                self._draw_animated()
+                fig.canvas.blit(self._axes.bbox)
+            else:
+                fig.canvas.draw_idle()
+
+    def _plt_call_later(self, msec: int, callback: Callable[[], None]):
+        """Call the callback later in the event loop of the figure canvas."""
+        timer = self._axes.figure.canvas.new_timer(interval=msec)
+        if type(timer) is TimerBase:
+            # non-interactive canvas (such as Agg) does not have an event loop
+            return call_later_in_thread(msec, callback)
+        timer.single_shot = True
+
+        def _cb():
+            self._timers.discard(timer)
+            callback()
+
+        timer.add_callback(_cb)
+        self._timers.add(timer)  # keep a reference until it fires
+        timer.start()
+
+    def _can_blit(self, fig) -> bool:
+        return (
+            self._background is not None
+            and len(self._animated_layers) > 0
+            and not fig.stale
+            and fig.canvas.supports_blit
+        )
 
     def _plt_get_mouse_enabled(self):
         return self._axes.get_navigate()
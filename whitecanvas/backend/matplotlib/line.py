@@ -65,16 +65,19 @@ class MultiLine(LineCollection, MplMouseEventsMixin):
     def __init__(self, data: list[NDArray[np.floating]]):
         # data: list of (N, 2)
         super().__init__(data, linewidths=1, picker=True, pickradius=5)
+        self._data = data
         self._ndata = len(data)
         self._linestyle = [LineStyle.SOLID] * self._ndata
         MplMouseEventsMixin.__init__(self)
 
     ##### XYDataProtocol #####
     def _plt_get_data(self):
-        return self.get_segments()
+        # get_segments() returns copies of all the lines
+        return self._data.read_only()
 
     def _plt_set_data(self, data: list[NDArray[np.floating]]):
         self.set_segments(data)
+        self._data = data
         self._ndata = len(data)
 
     ##### HasEdges #####
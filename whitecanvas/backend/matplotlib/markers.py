@@ -8,10 +8,15 @@ import numpy as np
 from matplotlib.collections import PathCollection
 from numpy.typing import NDArray
 
-from whitecanvas.backend.matplotlib._base import MplMouseEventsMixin, symbol_to_path
+from whitecanvas.backend.matplotlib._base import (
+    MplMouseEventsMixin,
+    _as_rows,
+    symbol_to_path,
+)
 from whitecanvas.protocols import MarkersProtocol, check_protocol
 from whitecanvas.types import Hatch, LineStyle, Symbol
 from whitecanvas.utils.normalize import as_color_array
+from whitecanvas.utils.spatial import GridIndex
 from whitecanvas.utils.type_check import is_real_number
 
 if TYPE_CHECKING:
@@ -25,22 +30,62 @@ class Markers(PathCollection, MplMouseEventsMixin):
         self._symbol = Symbol.CIRCLE
         super().__init__(
             (symbol_to_path(self._symbol),),
-            sizes=[6] * len(offsets),
+            sizes=[6],
             offsets=offsets,
             picker=True,
         )
         self.set_transform(mtransforms.IdentityTransform())
-        self._edge_styles = [LineStyle.SOLID] * len(offsets)
+        # uniform properties are stored as length-1 arrays, which PathCollection
+        # broadcasts to all the markers.
+        self._edge_styles = [LineStyle.SOLID]
+        self._index: GridIndex | None = None
         MplMouseEventsMixin.__init__(self)
 
     ##### XYDataProtocol #####
     def _plt_get_data(self):
+        # copy, because the offsets are updated in place in `_plt_set_data`
         offsets = self.get_offsets()
-        return offsets[:, 0], offsets[:, 1]
+        return offsets[:, 0].copy(), offsets[:, 1].copy()
 
     def _plt_set_data(self, xdata, ydata):
-        data = np.stack([xdata, ydata], axis=1)
-        self.set_offsets(data)
+        offsets = self.get_offsets()
+        if offsets.shape[0] == xdata.size and not np.ma.isMaskedArray(offsets):
+            # update the offsets buffer in place
+            offsets[:, 0] = xdata
+            offsets[:, 1] = ydata
+            self.stale = True
+        else:
+            self.set_offsets(np.stack([xdata, ydata], axis=1))
+        self._index = None
+
+    def contains(self, mouseevent):
+        """Find markers under the mouse, nearest first, using the spatial index."""
+        if self._different_canvas(mouseevent) or not self.get_visible():
+            return False, {}
+        offsets = np.asarray(self.get_offsets(), dtype=np.float64)
+        if offsets.shape[0] == 0 or self.axes is None:
+            return False, {}
+        if self._index is None:
+            self._index = GridIndex(offsets[:, 0], offsets[:, 1])
+        # marker radius in pixels
+        radius = np.sqrt(self.get_sizes()) * self.axes.figure.dpi / 72 / 2
+        radius = np.broadcast_to(radius + self.get_pickradius(), offsets.shape[:1])
+        r_max = radius.max()
+        mx, my = mouseevent.x, mouseevent.y
+        tr = self.get_offset_transform()
+        (x0, y0), (x1, y1) = tr.inverted().transform(
+            [(mx - r_max, my - r_max), (mx + r_max, my + r_max)]
+        )
+        cand = self._index.query_rect(
+            min(x0, x1), max(x0, x1), min(y0, y1), max(y0, y1)
+        )
+        if cand.size == 0:
+            return False, {}
+        pos = tr.transform(offsets[cand])
+        dist = np.hypot(pos[:, 0] - mx, pos[:, 1] - my)
+        hit = dist <= radius[cand]
+        ind = cand[hit][np.argsort(dist[hit], kind="stable")]
+        return ind.size > 0, {"ind": ind}
 
     ##### HasSymbol protocol #####
 
@@ -49,16 +94,16 @@ class Markers(PathCollection, MplMouseEventsMixin):
 
     def _plt_set_symbol(self, symbol: Symbol):
         path = symbol_to_path(symbol)
-        self.set_paths([path] * len(self.get_offsets()))
+        self.set_paths([path])
         self._symbol = symbol
 
     def _plt_get_symbol_size(self) -> NDArray[np.floating]:
-        return np.sqrt(self.get_sizes())
+        return _as_rows(np.sqrt(self.get_sizes()), len(self.get_offsets()))
 
     def _plt_set_symbol_size(self, size: float | NDArray[np.floating]):
         if is_real_number(size):
-            size = np.full(len(self.get_offsets()), size)
-        self.set_sizes(size**2)
+            size = np.array([size], dtype=np.float64)
+        self.set_sizes(np.square(size))
 
     ##### HasFaces protocol #####
     def _plt_get_face_color(self) -> NDArray[np.float32]:
@@ -96,23 +141,25 @@ class Markers(PathCollection, MplMouseEventsMixin):
         self.set_edgecolor(color)
 
     def _plt_get_edge_style(self) -> list[LineStyle]:
+        if len(self._edge_styles) == 1:
+            return self._edge_styles * len(self.get_offsets())
         return self._edge_styles
 
     def _plt_set_edge_style(self, style: LineStyle | list[LineStyle]):
         if isinstance(style, LineStyle):
-            styles = [style.value] * len(self.get_offsets())
-            self._edge_styles = [style] * len(self.get_offsets())
+            styles = [style.value]
+            self._edge_styles = [style]
         else:
             styles = [s.value for s in style]
             self._edge_styles = style
         self.set_linestyle(styles)
 
     def _plt_get_edge_width(self) -> NDArray[np.floating]:
-        return self.get_linewidth()
+        return _as_rows(np.asarray(self.get_linewidth()), len(self.get_offsets()))
 
     def _plt_set_edge_width(self, width: float | NDArray[np.floating]):
         if is_real_number(width):
-            width = np.full(len(self.get_offsets()), width)
+            width = [width]
         self.set_linewidth(width)
 
     def post_add(self, canvas: Canvas):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import numpy as np
+from matplotlib import rcParams
 from matplotlib.artist import Artist
 from matplotlib.text import Text as mplText
 from numpy.typing import NDArray
@@ -14,135 +15,230 @@ from whitecanvas.utils.type_check import is_real_number
 
 @check_protocol(TextProtocol)
 class Texts(Artist, MplLayer):
+    """
+    A collection of texts drawn as one artist.
+
+    Text properties are stored as arrays and only applied to the child `Text`
+    objects that are actually drawn. Texts outside the axes are skipped, and texts
+    that would overlap with another text at the current zoom level are hidden.
+    """
+
     def __init__(
         self, x: NDArray[np.floating], y: NDArray[np.floating], text: list[str]
     ):
         super().__init__()
-        self._children: list[mplText] = []
-        for x0, y0, text0 in zip(x, y, text):
-            self._children.append(
-                mplText(
-                    x0,
-                    y0,
-                    text0,
-                    verticalalignment="baseline",
-                    horizontalalignment="left",
-                    clip_on=True,
-                    color=np.array([0, 0, 0, 1], dtype=np.float32),
-                )  # fmt: skip
-            )
+        ntexts = len(text)
+        self._children: list[mplText] = [_make_text() for _ in range(ntexts)]
+        self._x = np.asarray(x, dtype=np.float64)
+        self._y = np.asarray(y, dtype=np.float64)
+        self._strings = [str(t) for t in text]
+        self._nchars = np.array([len(t) for t in self._strings], dtype=np.int64)
+        self._colors = np.zeros((ntexts, 4), dtype=np.float32)
+        self._colors[:, 3] = 1.0
+        self._sizes = np.full(ntexts, rcParams["font.size"], dtype=np.float32)
+        self._rotations = np.zeros(ntexts, dtype=np.float32)
+        self._synced = np.zeros(ntexts, dtype=np.bool_)
         self._font_family = "Arial"
+        # properties of the bounding boxes, which are not created until one of them
+        # is set
+        self._has_bbox = False
+        self._face_colors = np.zeros((ntexts, 4), dtype=np.float32)
+        self._face_hatches = [Hatch.SOLID] * ntexts
+        self._edge_colors = np.zeros((ntexts, 4), dtype=np.float32)
+        self._edge_widths = np.zeros(ntexts, dtype=np.float32)
+        self._edge_styles = [LineStyle.SOLID] * ntexts
         self._align = Alignment.BOTTOM_LEFT
-        self._remove_method = _remove_method
 
     def draw(self, renderer):
-        for child in self.get_children():
+        if not self.get_visible():
+            return
+        for i in self._indices_to_draw(renderer):
+            child = self._children[i]
+            if not self._synced[i]:
+                self._sync_child(i)
             child.draw(renderer)
+        self.stale = False
 
     def get_children(self) -> list[mplText]:
         return self._children
 
-    def set_visible(self, visible: bool):
-        for child in self.get_children():
-            child.set_visible(visible)
-        super().set_visible(visible)
+    # figure, transform and clip path are passed to the children on drawing
+    def set_figure(self, fig):
+        super().set_figure(fig)
+        self._invalidate()
 
     def set_transform(self, transform):
-        for child in self.get_children():
-            child.set_transform(transform)
         super().set_transform(transform)
+        self._invalidate()
+
+    def set_clip_path(self, path, transform=None):
+        super().set_clip_path(path, transform)
+        self._invalidate()
+
+    def _invalidate(self):
+        self._synced[:] = False
+        self.stale = True
+
+    def _sync_child(self, i: int):
+        """Apply the stored properties to the i-th child."""
+        v, h = self._align.split()
+        child = self._children[i]
+        if child.figure is not self.figure:
+            child.set_figure(self.figure)
+        child.set_transform(self.get_transform())
+        child.set_clip_path(self.get_clip_path())
+        child.update(
+            {
+                "position": (self._x[i], self._y[i]),
+                "text": self._strings[i],
+                "color": self._colors[i],
+                "fontsize": self._sizes[i],
+                "rotation": self._rotations[i],
+                "fontfamily": self._font_family,
+                "verticalalignment": _VERTICAL_ALIGNMENTS_INV[v],
+                "horizontalalignment": _HORIZONTAL_ALIGNMENTS_INV[h],
+            }
+        )
+        if self._has_bbox:
+            hatch, style = self._face_hatches[i], self._edge_styles[i]
+            self._set_bbox_props(
+                child,
+                facecolor=self._face_colors[i],
+                hatch=None if hatch is Hatch.SOLID else hatch.value,
+                edgecolor=self._edge_colors[i],
+                linewidth=self._edge_widths[i],
+                linestyle=None if style is LineStyle.SOLID else style.value,
+            )
+        self._synced[i] = True
+
+    def _indices_to_draw(self, renderer) -> NDArray[np.intp]:
+        """Indices of the texts that are in the view and do not overlap."""
+        if self._x.size == 0:
+            return np.zeros(0, dtype=np.intp)
+        xy = self.get_transform().transform(np.stack([self._x, self._y], axis=1))
+        size_px = renderer.points_to_pixels(self._sizes)
+        # One em per character always covers the text, so this is safe for culling.
+        pad = size_px * (self._nchars + 2)
+        mask = (self._nchars > 0) & np.all(np.isfinite(xy), axis=1)
+        if self.axes is not None:
+            x0, y0, x1, y1 = self.axes.bbox.extents
+            mask &= (xy[:, 0] + pad >= x0) & (xy[:, 0] - pad <= x1)
+            mask &= (xy[:, 1] + pad >= y0) & (xy[:, 1] - pad <= y1)
+        indices = np.flatnonzero(mask)
+        if indices.size < 2:
+            return indices
+
+        # Texts whose anchors fall in the same grid cell overlap with each other.
+        # The cell size is an underestimate of the smallest glyph box so that texts
+        # are never hidden when they don't overlap.
+        width = size_px[indices] * self._nchars[indices] * _MIN_CHAR_WIDTH
+        height = size_px[indices]
+        if np.any(self._rotations[indices] % 180 != 0):
+            width = height = np.minimum(width, height)
+        cell_w, cell_h = width.min(), height.min()
+        if cell_w <= 0 or cell_h <= 0:
+            return indices
+        xy = xy[indices]
+        ix = np.floor((xy[:, 0] - xy[:, 0].min()) / cell_w).astype(np.int64)
+        iy = np.floor((xy[:, 1] - xy[:, 1].min()) / cell_h).astype(np.int64)
+        _, first = np.unique(ix * (iy.max() + 1) + iy, return_index=True)
+        return indices[np.sort(first)]
 
     def _plt_get_text(self) -> list[str]:
-        return [child.get_text() for child in self.get_children()]
+        return list(self._strings)
 
     def _plt_set_text(self, text: list[str]):
-        for child, text0 in zip(self.get_children(), text):
-            child.set_text(str(text0))
+        self._strings = [str(t) for t in text]
+        self._nchars = np.array([len(t) for t in self._strings], dtype=np.int64)
+        self._invalidate()
 
     def _plt_get_text_color(self):
-        return np.stack(
-            [child.get_color() for child in self.get_children()],
-            axis=0,
-            dtype=np.float32,
-        )
+        return self._colors
 
     def _plt_set_text_color(self, color):
-        color = as_color_array(color, len(self.get_children()))
-        for child, color0 in zip(self.get_children(), color):
-            child.set_color(color0)
+        self._colors = as_color_array(color, len(self.get_children()))
+        self._invalidate()
 
     def _plt_get_text_size(self) -> NDArray[np.float32]:
-        return np.array(
-            [child.get_fontsize() for child in self.get_children()], dtype=np.float32
-        )
+        return self._sizes
 
     def _plt_set_text_size(self, size: float | NDArray[np.float32]):
         if is_real_number(size):
             _size = np.full(len(self.get_children()), size, dtype=np.float32)
         else:
-            _size = size
-        for child, size0 in zip(self.get_children(), _size):
-            child.set_fontsize(size0)
+            _size = np.asarray(size, dtype=np.float32)
+        self._sizes = _size
+        self._invalidate()
 
     def _plt_get_text_position(self) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
-        ar = np.array([child.get_position() for child in self.get_children()])
-        if ar.size == 0:
-            return np.array([]), np.array([])
-        return ar[:, 0], ar[:, 1]
+        return self._x, self._y
 
     def _plt_set_text_position(
         self, position: tuple[NDArray[np.float32], NDArray[np.float32]]
     ):
         x, y = position
-        if x.size > len(self._children):
-            for _ in range(x.size - len(self._children)):
-                self._children.append(
-                    mplText(
-                        0,
-                        0,
-                        "",
-                        verticalalignment="baseline",
-                        horizontalalignment="left",
-                        clip_on=True,
-                        color=np.array([0, 0, 0, 1], dtype=np.float32),
-                    )  # fmt: skip
-                )
-        elif x.size < len(self._children):
-            for c in self._children[x.size :]:
-                c.remove()
-            self._children = self._children[: x.size]
-        for child, x0, y0 in zip(self.get_children(), x, y):
-            child.set_position((x0, y0))
+        nold = len(self._children)
+        if x.size > nold:
+            nnew = x.size - nold
+            for _ in range(nnew):
+                self._children.append(_make_text())
+            self._strings.extend([""] * nnew)
+            self._nchars = np.concatenate([self._nchars, np.zeros(nnew, np.int64)])
+            black = np.tile(np.array([0, 0, 0, 1], dtype=np.float32), (nnew, 1))
+            self._colors = np.concatenate([self._colors, black], axis=0)
+            self._sizes = np.concatenate(
+                [self._sizes, np.full(nnew, rcParams["font.size"], np.float32)]
+            )
+            self._rotations = np.concatenate([self._rotations, np.zeros(nnew)])
+            zeros = np.zeros((nnew, 4), dtype=np.float32)
+            self._face_colors = np.concatenate([self._face_colors, zeros], axis=0)
+            self._face_hatches.extend([Hatch.SOLID] * nnew)
+            self._edge_colors = np.concatenate([self._edge_colors, zeros], axis=0)
+            self._edge_widths = np.concatenate(
+                [self._edge_widths, np.zeros(nnew, np.float32)]
+            )
+            self._edge_styles.extend([LineStyle.SOLID] * nnew)
+        elif x.size < nold:
+            n = x.size
+            self._children = self._children[:n]
+            self._strings = self._strings[:n]
+            self._nchars = self._nchars[:n]
+            self._colors = self._colors[:n]
+            self._sizes = self._sizes[:n]
+            self._rotations = self._rotations[:n]
+            self._face_colors = self._face_colors[:n]
+            self._face_hatches = self._face_hatches[:n]
+            self._edge_colors = self._edge_colors[:n]
+            self._edge_widths = self._edge_widths[:n]
+            self._edge_styles = self._edge_styles[:n]
+        self._x = np.asarray(x, dtype=np.float64)
+        self._y = np.asarray(y, dtype=np.float64)
+        self._synced = np.zeros(x.size, dtype=np.bool_)
+        self.stale = True
 
     def _plt_get_text_anchor(self) -> Alignment:
         return self._align
 
     def _plt_set_text_anchor(self, anc: Alignment):
         """Set the text position."""
-        v, h = anc.split()
-        va = _VERTICAL_ALIGNMENTS_INV[v]
-        ha = _HORIZONTAL_ALIGNMENTS_INV[h]
-        for child in self.get_children():
-            child.set_verticalalignment(va)
-            child.set_horizontalalignment(ha)
         self._align = anc
+        self._invalidate()
 
     def _plt_get_text_rotation(self) -> NDArray[np.float32]:
-        return np.array(
-            [child.get_rotation() for child in self.get_children()], dtype=np.float32
-        )
+        return self._rotations
 
     def _plt_set_text_rotation(self, rotation: NDArray[np.float32]):
-        for child, rotation0 in zip(self.get_children(), rotation):
-            child.set_rotation(rotation0)
+        self._rotations = np.broadcast_to(
+            np.asarray(rotation, dtype=np.float32), (len(self.get_children()),)
+        ).copy()
+        self._invalidate()
 
     def _plt_get_text_fontfamily(self) -> str:
         return self._font_family
 
     def _plt_set_text_fontfamily(self, fontfamily: str):
-        for child in self.get_children():
-            child.set_fontfamily(fontfamily)
         self._font_family = fontfamily
+        self._invalidate()
 
     ##### HasFaces #####
 
@@ -153,97 +249,54 @@ class Texts(Artist, MplLayer):
         else:
             child.get_bbox_patch().update(bbox_props)
 
+    def _invalidate_bbox(self):
+        self._has_bbox = True
+        self._invalidate()
+
     def _plt_get_face_color(self):
-        out = []
-        for child in self.get_children():
-            patch = child.get_bbox_patch()
-            if patch is None:
-                out.append(np.array([0.0, 0.0, 0.0, 0.0], dtype=np.float32))
-            else:
-                out.append(np.asarray(patch.get_facecolor(), dtype=np.float32))
-        return np.stack(out, axis=0)
+        return self._face_colors
 
     def _plt_set_face_color(self, color):
-        color = as_color_array(color, len(self.get_children()))
-        for child, color0 in zip(self.get_children(), color):
-            self._set_bbox_props(child, facecolor=color0)
-
-    def _plt_get_face_hatch(self) -> Hatch:
-        out = []
-        for child in self.get_children():
-            patch = child.get_bbox_patch()
-            if patch is None:
-                out.append(Hatch.SOLID)
-            else:
-                out.append(Hatch(patch.get_hatch() or ""))
-        return out
+        self._face_colors = as_color_array(color, len(self.get_children()))
+        self._invalidate_bbox()
+
+    def _plt_get_face_hatch(self) -> list[Hatch]:
+        return list(self._face_hatches)
 
     def _plt_set_face_hatch(self, pattern: Hatch | list[Hatch]):
         if isinstance(pattern, Hatch):
-            if pattern is Hatch.SOLID:
-                ptn = [None] * len(self.get_children())
-            else:
-                ptn = [pattern.value] * len(self.get_children())
+            self._face_hatches = [pattern] * len(self.get_children())
         else:
-            ptn = [p.value if p is not Hatch.SOLID else None for p in pattern]
-        for child, ptn0 in zip(self.get_children(), ptn):
-            self._set_bbox_props(child, hatch=ptn0)
+            self._face_hatches = [Hatch(p) for p in pattern]
+        self._invalidate_bbox()
 
     def _plt_get_edge_color(self):
-        out = []
-        for child in self.get_children():
-            patch = child.get_bbox_patch()
-            if patch is None:
-                out.append(np.array([0.0, 0.0, 0.0, 0.0], dtype=np.float32))
-            else:
-                out.append(np.asarray(patch.get_edgecolor(), dtype=np.float32))
-        return np.stack(out, axis=0)
+        return self._edge_colors
 
     def _plt_set_edge_color(self, color):
-        color = as_color_array(color, len(self.get_children()))
-        for child, color0 in zip(self.get_children(), color):
-            self._set_bbox_props(child, edgecolor=color0)
-
-    def _plt_get_edge_width(self) -> float:
-        out = []
-        for child in self.get_children():
-            patch = child.get_bbox_patch()
-            if patch is None:
-                out.append(0)
-            else:
-                out.append(patch.get_linewidth())
-        return np.array(out, dtype=np.float32)
+        self._edge_colors = as_color_array(color, len(self.get_children()))
+        self._invalidate_bbox()
+
+    def _plt_get_edge_width(self) -> NDArray[np.float32]:
+        return self._edge_widths
 
     def _plt_set_edge_width(self, width: float | NDArray[np.floating]):
         if is_real_number(width):
-            width = np.full(len(self.get_children()), width, dtype=np.float32)
-        for child, width0 in zip(self.get_children(), width):
-            self._set_bbox_props(child, linewidth=width0)
-
-    def _plt_get_edge_style(self) -> LineStyle:
-        out = []
-        for child in self.get_children():
-            patch = child.get_bbox_patch()
-            if patch is None:
-                out.append(LineStyle.SOLID)
-            else:
-                style = patch.get_linestyle()
-                if style == "solid":
-                    out.append(LineStyle.SOLID)
-                else:
-                    out.append(LineStyle(style))
-        return out
-
-    def _plt_set_edge_style(self, style: LineStyle):
+            _width = np.full(len(self.get_children()), width, dtype=np.float32)
+        else:
+            _width = np.asarray(width, dtype=np.float32)
+        self._edge_widths = _width
+        self._invalidate_bbox()
+
+    def _plt_get_edge_style(self) -> list[LineStyle]:
+        return list(self._edge_styles)
+
+    def _plt_set_edge_style(self, style: LineStyle | list[LineStyle]):
         if isinstance(style, LineStyle):
-            if style is LineStyle.SOLID:
-                sty = [None] * len(self.get_children())
-            else:
-                sty = [style.value] * len(self.get_children())
+            self._edge_styles = [style] * len(self.get_children())
         else:
-            sty = [s.value if s is not LineStyle.SOLID else None for s in style]
-        for child, sty0 in zip(self.get_children(), sty):
-            self._set_bbox_props(child, linestyle=sty0)
+            self._edge_styles = [LineStyle(s) for s in style]
+        self._invalidate_bbox()
 
 
 _VERTICAL_ALIGNMENTS = {
@@ -261,7 +314,13 @@ _HORIZONTAL_ALIGNMENTS = {
 }
 _HORIZONTAL_ALIGNMENTS_INV = {v: k for k, v in _HORIZONTAL_ALIGNMENTS.items()}
 
+# lower bound of the character width relative to the font size (narrow glyphs
+# such as "i" and "." are about 0.25 em wide)
+_MIN_CHAR_WIDTH = 0.2
+
 
-def _remove_method(this: Texts):
-    for child in this.get_children():
-        child.remove()
+def _make_text() -> mplText:
+    return mplText(
+        0, 0, "", verticalalignment="baseline", horizontalalignment="left",
+        clip_on=True,
+    )  # fmt: skip
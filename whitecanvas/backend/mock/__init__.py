@@ -1,3 +1,4 @@
+from whitecanvas.backend.mock._instrument import BackendReport, instrument
 from whitecanvas.backend.mock.canvas import Canvas, CanvasGrid
 from whitecanvas.backend.mock.layers import (
     Band,
@@ -5,6 +6,7 @@ from whitecanvas.backend.mock.layers import (
     Image,
     Markers,
     MonoLine,
+    MultiBand,
     MultiLine,
     Texts,
     Vectors,
@@ -141,6 +141,18 @@ class MockHasMultiEdges:
         self._edge_width = width
 
 
+def resize_rows(value, ndata: int, default):
+    """Resize per-row properties. New rows inherit the last row, as real backends."""
+    size = len(value)
+    if size >= ndata:
+        return value[:ndata]
+    last = value[-1] if size > 0 else default
+    if isinstance(value, np.ndarray):
+        extra = np.repeat(np.asarray([last], dtype=value.dtype), ndata - size, axis=0)
+        return np.concatenate([value, extra])
+    return list(value) + [last] * (ndata - size)
+
+
 class MockHasMouseEvents:
     def _plt_set_hover_text(self, text: list[str]) -> None:
         pass
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import hashlib
+import inspect
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import wraps
+from timeit import default_timer
+from typing import Any, Callable, Iterator
+
+import numpy as np
+
+from whitecanvas.types import PackedLines
+
+
+@dataclass
+class CallStats:
+    """Statistics of the calls of a backend method."""
+
+    count: int = 0
+    time: float = 0.0
+    nbytes: int = 0
+    redundant: int = 0
+
+
+class BackendReport:
+    """
+    Report of the backend calls recorded by `instrument`.
+
+    Statistics are collected for each pair of backend class name and method name.
+    Times are inclusive, that is, the time of a backend method calling another
+    backend method is counted in both.
+    """
+
+    def __init__(self):
+        self._stats: dict[tuple[str, str], CallStats] = {}
+
+    def __getitem__(self, key: tuple[str, str]) -> CallStats:
+        """Get the statistics of (class name, method name)."""
+        return self._stats.get(key, CallStats())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(\n{self.summary()}\n)"
+
+    def _get_stats(self, key: tuple[str, str]) -> CallStats:
+        if (stats := self._stats.get(key)) is None:
+            stats = self._stats[key] = CallStats()
+        return stats
+
+    @property
+    def stats(self) -> dict[tuple[str, str], CallStats]:
+        """Statistics for each (class name, method name)."""
+        return dict(self._stats)
+
+    @property
+    def draw_count(self) -> int:
+        """Number of times the canvases are redrawn."""
+        return sum(
+            stats.count
+            for (_, method), stats in self._stats.items()
+            if method == "_plt_draw"
+        )
+
+    @property
+    def total_calls(self) -> int:
+        """Total number of backend calls."""
+        return sum(stats.count for stats in self._stats.values())
+
+    @property
+    def total_nbytes(self) -> int:
+        """Total bytes of arrays passed to or returned from the backend."""
+        return sum(stats.nbytes for stats in self._stats.values())
+
+    @property
+    def redundant_calls(self) -> int:
+        """Number of setter calls that set the same value as the previous call."""
+        return sum(stats.redundant for stats in self._stats.values())
+
+    def by_class(self, name: str) -> dict[str, CallStats]:
+        """Statistics of the methods of the backend class of given name."""
+        return {
+            method: stats
+            for (cls_name, method), stats in self._stats.items()
+            if cls_name == name
+        }
+
+    def summary(self, max_rows: int = 20) -> str:
+        """Table of the most time-consuming calls."""
+        rows = sorted(self._stats.items(), key=lambda x: x[1].time, reverse=True)
+        header = ("method", "count", "time (ms)", "bytes", "redundant")
+        lines = ["{:<48}{:>8}{:>12}{:>14}{:>11}".format(*header)]
+        for (cls_name, method), stats in rows[:max_rows]:
+            lines.append(
+                f"{cls_name + '.' + method:<48}{stats.count:>8}"
+                f"{stats.time * 1e3:>12.3f}{stats.nbytes:>14}{stats.redundant:>11}"
+            )
+        if len(rows) > max_rows:
+            lines.append(f"... and {len(rows) - max_rows} more")
+        return "\n".join(lines)
+
+
+def _nbytes(obj: Any) -> int:
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, PackedLines):
+        return obj.coords.nbytes + obj.offsets.nbytes
+    if isinstance(obj, (list, tuple)):
+        return sum(_nbytes(each) for each in obj)
+    if isinstance(obj, dict):
+        return sum(_nbytes(each) for each in obj.values())
+    if isinstance(nbytes := getattr(obj, "nbytes", None), int):
+        return nbytes
+    if hasattr(obj, "__array__"):
+        return np.asarray(obj).nbytes
+    return 0
+
+
+def _fingerprint(obj: Any) -> Any:
+    """Comparable summary of the value passed to a setter."""
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind == "O":
+            return ("object-array", obj.shape, tuple(map(_fingerprint, obj.flat)))
+        buf = np.ascontiguousarray(obj).reshape(-1).view(np.uint8)
+        digest = hashlib.blake2b(buf).digest()
+        return ("array", obj.shape, obj.dtype.str, digest)
+    if isinstance(obj, PackedLines):
+        return ("packed-lines", _fingerprint(obj.coords), _fingerprint(obj.offsets))
+    if isinstance(obj, (list, tuple)):
+        return tuple(_fingerprint(each) for each in obj)
+    if isinstance(obj, dict):
+        return tuple((k, _fingerprint(v)) for k, v in obj.items())
+    if hasattr(obj, "__array__"):
+        return _fingerprint(np.asarray(obj))
+    return obj
+
+
+def _is_same(a: Any, b: Any) -> bool:
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
+def _iter_mock_classes() -> Iterator[type]:
+    """Iterate over the mock classes and the mock mixins they inherit from."""
+    from whitecanvas.backend.mock import canvas, layers
+
+    found: set[type] = set()
+    for mod in [canvas, layers]:
+        for obj in vars(mod).values():
+            if isinstance(obj, type) and obj.__module__ == mod.__name__:
+                for base in obj.__mro__:
+                    if base.__module__.startswith(__package__) and base not in found:
+                        found.add(base)
+                        yield base
+
+
+def _instrumented(
+    func: Callable,
+    name: str,
+    report: BackendReport,
+    last_values: weakref.WeakKeyDictionary,
+    running: set[tuple[int, str]],
+) -> Callable:
+    is_setter = name.startswith("_plt_set_")
+
+    @wraps(func)
+    def _func(self, *args, **kwargs):
+        call_id = (id(self), name)
+        if call_id in running:
+            # an overriding method calling `super()`, which is the same call
+            return func(self, *args, **kwargs)
+        stats = report._get_stats((type(self).__name__, name))
+        if is_setter:
+            values = last_values.setdefault(self, {})
+            value = _fingerprint((args, kwargs))
+            if name in values and _is_same(values[name], value):
+                stats.redundant += 1
+            values[name] = value
+        running.add(call_id)
+        t0 = default_timer()
+        try:
+            out = func(self, *args, **kwargs)
+        finally:
+            running.discard(call_id)
+        stats.time += default_timer() - t0
+        stats.count += 1
+        stats.nbytes += _nbytes(args) + _nbytes(kwargs) + _nbytes(out)
+        return out
+
+    return _func
+
+
+@contextmanager
+def instrument() -> Iterator[BackendReport]:
+    """
+    Record all the calls to the mock backend in this context.
+
+    The number of calls, the time, the bytes of the arrays passed across the
+    protocol boundary and the number of redundant calls (setting the same value as
+    the previous call) are recorded for each `_plt_*` method of each mock class.
+    Calls are recorded under the name of the class of the instance, so inherited
+    methods are counted once, for the subclass.
+
+    >>> from whitecanvas import new_canvas
+    >>> from whitecanvas.backend.mock import instrument
+    >>> with instrument() as report:
+    ...     canvas = new_canvas("mock")
+    ...     layer = canvas.add_markers([0, 1, 2], [3, 2, 1])
+    >>> report["Canvas", "_plt_add_layer"].count
+    1
+    >>> report.draw_count > 0
+    True
+    """
+    report = BackendReport()
+    last_values = weakref.WeakKeyDictionary()
+    running: set[tuple[int, str]] = set()
+    patched: list[tuple[type, str, Callable]] = []
+    try:
+        for cls in _iter_mock_classes():
+            # only wrap the methods where they are defined
+            for name, attr in list(vars(cls).items()):
+                if not (name.startswith("_plt_") and inspect.isfunction(attr)):
+                    continue
+                patched.append((cls, name, attr))
+                wrapped = _instrumented(attr, name, report, last_values, running)
+                setattr(cls, name, wrapped)
+        yield report
+    finally:
+        for cls, name, orig in reversed(patched):
+            setattr(cls, name, orig)
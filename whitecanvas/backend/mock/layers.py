@@ -13,8 +13,9 @@ from whitecanvas.backend.mock._base import (
     MockHasMouseEvents,
     MockHasMultiEdges,
     MockHasMultiFaces,
+    resize_rows,
 )
-from whitecanvas.types import Alignment, Orientation, Symbol
+from whitecanvas.types import Alignment, Hatch, LineStyle, Orientation, Symbol
 from whitecanvas.utils.normalize import as_color_array
 from whitecanvas.utils.type_check import is_real_number
 
@@ -130,6 +131,24 @@ class MultiLine(BaseMockLayer, MockHasMultiEdges, MockHasMouseEvents):
         return len(self._plt_get_data())
 
 
+@protocols.check_protocol(protocols.MultiBandProtocol)
+class MultiBand(
+    BaseMockLayer, MockHasMultiFaces, MockHasMultiEdges, MockHasMouseEvents
+):
+    def __init__(self, data: list[np.ndarray]):
+        super().__init__()
+        self._data = data
+
+    def _plt_get_data(self) -> list[np.ndarray]:
+        return self._data
+
+    def _plt_set_data(self, data: list[np.ndarray]):
+        self._data = data
+
+    def _plt_get_ndata(self) -> int:
+        return len(self._plt_get_data())
+
+
 @protocols.check_protocol(protocols.MarkersProtocol)
 class Markers(MockHasData, MockHasMultiFaces, MockHasMultiEdges, MockHasMouseEvents):
     def __init__(self, xdata, ydata):
@@ -140,6 +159,23 @@ class Markers(MockHasData, MockHasMultiFaces, MockHasMultiEdges, MockHasMouseEve
     def _plt_get_ndata(self) -> int:
         return self._plt_get_data()[0].size
 
+    def _plt_set_data(self, xdata, ydata):
+        ndata = xdata.size
+        if ndata != self._plt_get_ndata():
+            for name, default in [
+                ("_face_color", np.zeros(4, dtype=np.float32)),
+                ("_face_hatch", Hatch.SOLID),
+                ("_edge_color", np.zeros(4, dtype=np.float32)),
+                ("_edge_style", LineStyle.SOLID),
+                ("_edge_width", 1.0),
+                ("_size", 10.0),
+            ]:
+                if hasattr(self, name):
+                    setattr(
+                        self, name, resize_rows(getattr(self, name), ndata, default)
+                    )
+        super()._plt_set_data(xdata, ydata)
+
     def _plt_get_symbol(self) -> Symbol:
         return self._symbol
 
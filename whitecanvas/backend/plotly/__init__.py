@@ -1,5 +1,5 @@
 from whitecanvas.backend.plotly._base import to_html
-from whitecanvas.backend.plotly.band import Band
+from whitecanvas.backend.plotly.band import Band, MultiBand
 from whitecanvas.backend.plotly.bars import Bars
 from whitecanvas.backend.plotly.canvas import Canvas, CanvasGrid
 from whitecanvas.backend.plotly.image import Image
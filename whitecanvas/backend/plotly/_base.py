@@ -55,7 +55,7 @@ class PlotlyHoverableLayer(PlotlyLayer[_O]):
         self._update_hover_texts(fig)
 
     def _plt_set_hover_text(self, text: list[str]):
-        self._hover_texts = text
+        self._hover_texts = list(text)  # format all the lazy texts at once
         fig = self._fig_ref()
         if fig is not None:
             self._update_hover_texts(fig)
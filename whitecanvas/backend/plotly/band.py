@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import warnings
+
 import numpy as np
+from numpy.typing import NDArray
 from plotly import graph_objects as go
 
-from whitecanvas.backend._not_implemented import face_hatch
+from whitecanvas.backend._not_implemented import face_hatch, face_hatches
 from whitecanvas.backend.plotly._base import (
     PlotlyHoverableLayer,
     from_plotly_linestyle,
     to_plotly_linestyle,
 )
-from whitecanvas.protocols import BandProtocol, check_protocol
+from whitecanvas.backend.plotly.line import join_lines
+from whitecanvas.protocols import BandProtocol, MultiBandProtocol, check_protocol
 from whitecanvas.types import LineStyle, Orientation
 from whitecanvas.utils.normalize import arr_color, rgba_str_color
+from whitecanvas.utils.type_check import is_real_number
 
 # NOTE: plotly does not support hover text on the fill area.
 # see https://github.com/plotly/plotly.py/issues/2399
@@ -121,3 +126,134 @@ class Band(PlotlyHoverableLayer[go.Scatter]):
             customdata=self._hover_texts * self._props["x"].size,
             selector={"uid": self._props["uid"]},
         )
+
+
+@check_protocol(MultiBandProtocol)
+class MultiBand(PlotlyHoverableLayer[go.Scatter]):
+    def __init__(self, data: list[NDArray[np.floating]]):
+        # All the polygons are drawn in one trace separated by None. Because fill
+        # properties of a trace are scalar, per-band properties are not supported.
+        self._props = {
+            "mode": "lines",
+            "fill": "toself",
+            "fillcolor": "blue",
+            "type": "scatter",
+            "line": {"color": "blue", "width": 1, "dash": "solid", "simplify": False},
+            "hovertemplate": "%{customdata}<extra></extra>",
+            "showlegend": False,
+            "visible": True,
+        }
+        self._plt_set_data(data)
+        PlotlyHoverableLayer.__init__(self)
+
+    def _plt_get_data(self):
+        return self._data
+
+    def _plt_set_data(self, data: list[NDArray[np.floating]]):
+        xdata, ydata = join_lines(data)
+        self._data = data
+        self._props["x"] = xdata
+        self._props["y"] = ydata
+        self._props["customdata"] = np.full(len(xdata), "", dtype=object)
+        self._nan_indices = np.flatnonzero(np.isnan(xdata))
+
+    def _plt_get_ndata(self) -> int:
+        return len(self._data)
+
+    def _plt_get_face_color(self) -> NDArray[np.float32]:
+        col = arr_color(self._props["fillcolor"])
+        return np.stack([col] * self._plt_get_ndata(), axis=0)
+
+    def _plt_set_face_color(self, color: NDArray[np.float32]):
+        self._props["fillcolor"] = _first_color(color, "face colors")
+
+    _plt_get_face_hatch, _plt_set_face_hatch = face_hatches()
+
+    def _plt_get_edge_color(self) -> NDArray[np.float32]:
+        col = arr_color(self._props["line"]["color"])
+        return np.stack([col] * self._plt_get_ndata(), axis=0)
+
+    def _plt_set_edge_color(self, color: NDArray[np.float32]):
+        self._props["line"]["color"] = _first_color(color, "edge colors")
+
+    def _plt_get_edge_width(self) -> NDArray[np.float32]:
+        width = self._props["line"]["width"]
+        return np.full(self._plt_get_ndata(), width, dtype=np.float32)
+
+    def _plt_set_edge_width(self, width):
+        if is_real_number(width):
+            w = width
+        else:
+            candidates = np.unique(width)
+            if len(candidates) == 1:
+                w = candidates[0]
+            elif len(candidates) == 0:
+                w = 0.0
+            else:
+                _warn_multiple("edge widths")
+                w = width[0]
+        self._props["line"]["width"] = w
+
+    def _plt_get_edge_style(self) -> list[LineStyle]:
+        style = from_plotly_linestyle(self._props["line"]["dash"])
+        return [style] * self._plt_get_ndata()
+
+    def _plt_set_edge_style(self, style: LineStyle | list[LineStyle]):
+        if isinstance(style, LineStyle):
+            self._props["line"]["dash"] = to_plotly_linestyle(style)
+        else:
+            candidates = set(style)
+            if len(candidates) == 1:
+                self._props["line"]["dash"] = to_plotly_linestyle(style[0])
+            elif len(candidates) == 0:
+                self._props["line"]["dash"] = "solid"
+            else:
+                _warn_multiple("edge styles")
+                self._props["line"]["dash"] = to_plotly_linestyle(style[0])
+
+    def _update_hover_texts(self, fig: go.Figure):
+        if self._hover_texts is None:
+            return
+        if len(self._hover_texts) != self._plt_get_ndata():
+            warnings.warn(
+                "The length of the hover text does not match the number of bands. "
+                "Ignoring.",
+                UserWarning,
+                stacklevel=2,
+            )
+            return
+        customdata = []
+        for text, each in zip(self._hover_texts, self._data):
+            customdata.extend([text] * len(each))
+            customdata.append("")
+        if customdata:
+            customdata.pop()
+        fig.update_traces(
+            customdata=customdata,
+            selector={"uid": self._props["uid"]},
+        )
+
+    def _plt_connect_pick_event(self, callback):
+        def _new_cb(indices: list[int]):
+            return callback([np.where(self._nan_indices < i)[0].size for i in indices])
+
+        return super()._plt_connect_pick_event(_new_cb)
+
+
+def _first_color(color: NDArray[np.float32], prop: str) -> str:
+    if color.ndim == 1:
+        return rgba_str_color(color)
+    candidates = np.unique(color, axis=0)
+    if len(candidates) == 0:
+        return "blue"
+    elif len(candidates) > 1:
+        _warn_multiple(prop)
+    return rgba_str_color(color[0])
+
+
+def _warn_multiple(prop: str):
+    return warnings.warn(
+        f"plotly bands do not support multiple {prop}. Set to the first one.",
+        UserWarning,
+        stacklevel=4,
+    )
@@ -8,7 +8,7 @@ from whitecanvas.backend import _not_implemented
 from whitecanvas.backend.plotly._base import PlotlyHoverableLayer
 from whitecanvas.protocols import BarProtocol, check_protocol
 from whitecanvas.types import Hatch
-from whitecanvas.utils.normalize import arr_color, rgba_str_color
+from whitecanvas.utils.normalize import arr_color, rgba_str_color, rgba_str_colors
 
 
 @check_protocol(BarProtocol)
@@ -69,7 +69,7 @@ class Bars(PlotlyHoverableLayer[go.Bar]):
         if color.ndim == 1:
             color = [rgba_str_color(color)] * self._plt_get_ndata()
         else:
-            color = [rgba_str_color(c) for c in color]
+            color = rgba_str_colors(color)
         self._props["marker"]["color"] = color
 
     def _plt_get_face_hatch(self) -> list[Hatch]:
@@ -104,5 +104,5 @@ class Bars(PlotlyHoverableLayer[go.Bar]):
         if color.ndim == 1:
             color = [rgba_str_color(color)] * self._plt_get_ndata()
         else:
-            color = [rgba_str_color(c) for c in color]
+            color = rgba_str_colors(color)
         self._props["marker"]["line"]["color"] = color
@@ -11,7 +11,7 @@ from whitecanvas.backend.plotly._base import (
     to_plotly_marker_symbol,
 )
 from whitecanvas.types import Symbol
-from whitecanvas.utils.normalize import arr_color, as_color_array, rgba_str_color
+from whitecanvas.utils.normalize import arr_color, as_color_array, rgba_str_colors
 from whitecanvas.utils.type_check import is_real_number
 
 
@@ -56,7 +56,7 @@ class Markers3D(PlotlyHoverableLayer[go.Scatter3d]):
 
     def _plt_set_face_color(self, color: NDArray[np.float32]):
         color = as_color_array(color, self._plt_get_ndata())
-        self._props["marker"]["color"] = [rgba_str_color(c) for c in color]
+        self._props["marker"]["color"] = rgba_str_colors(color)
 
     _plt_get_face_hatch, _plt_set_face_hatch = _not_implemented.face_hatches()
 
@@ -93,4 +93,4 @@ class Markers3D(PlotlyHoverableLayer[go.Scatter3d]):
 
     def _plt_set_edge_color(self, color: NDArray[np.float32]):
         color = as_color_array(color, self._plt_get_ndata())
-        self._props["marker"]["line"]["color"] = [rgba_str_color(c) for c in color]
+        self._props["marker"]["line"]["color"] = rgba_str_colors(color)
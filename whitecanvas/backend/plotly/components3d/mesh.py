@@ -6,7 +6,7 @@ from plotly import graph_objects as go
 
 from whitecanvas.backend import _not_implemented
 from whitecanvas.backend.plotly._base import PlotlyHoverableLayer
-from whitecanvas.utils.normalize import arr_color, as_color_array, rgba_str_color
+from whitecanvas.utils.normalize import arr_color, as_color_array, rgba_str_colors
 
 
 class Mesh3D(PlotlyHoverableLayer[go.Mesh3d]):
@@ -55,7 +55,7 @@ class Mesh3D(PlotlyHoverableLayer[go.Mesh3d]):
 
     def _plt_set_face_color(self, color: NDArray[np.float32]):
         color = as_color_array(color, self._faces.shape[0])
-        self._props["facecolor"] = [rgba_str_color(c) for c in color]
+        self._props["facecolor"] = rgba_str_colors(color)
 
     _plt_get_face_hatch, _plt_set_face_hatch = _not_implemented.face_hatches()
     _plt_get_edge_color, _plt_set_edge_color = _not_implemented.edge_color()
@@ -12,7 +12,7 @@ from whitecanvas.backend.plotly._base import (
     to_plotly_linestyle,
 )
 from whitecanvas.protocols import LineProtocol, MultiLineProtocol, check_protocol
-from whitecanvas.types import LineStyle
+from whitecanvas.types import LineStyle, PackedLines
 from whitecanvas.utils.normalize import arr_color, rgba_str_color
 from whitecanvas.utils.type_check import is_real_number
 
@@ -72,16 +72,7 @@ class MonoLine(PlotlyHoverableLayer[go.Scatter]):
 @check_protocol(MultiLineProtocol)
 class MultiLine(PlotlyHoverableLayer[go.Scatter]):
     def __init__(self, data: list[NDArray[np.floating]]):
-        # In plotly, we can break a line into multiple segments by inserting None
-        xdata = []
-        ydata = []
-        for each in data:
-            xdata = xdata + each[:, 0].tolist() + [None]
-            ydata = ydata + each[:, 1].tolist() + [None]
-        # remove last None
-        if len(xdata) > 0:
-            xdata.pop()
-            ydata.pop()
+        xdata, ydata = join_lines(data)
         self._data = data
 
         self._props = {
@@ -97,29 +88,21 @@ class MultiLine(PlotlyHoverableLayer[go.Scatter]):
             "type": "scatter",
             "showlegend": False,
             "visible": True,
-            "customdata": [""] * len(xdata),
+            "customdata": np.full(len(xdata), "", dtype=object),
             "hovertemplate": "%{customdata}<extra></extra>",
         }
-        x = np.array(xdata, dtype=np.float32)
-        self._nan_indices = np.where(np.isnan(x))[0]
+        self._nan_indices = np.flatnonzero(np.isnan(xdata))
         PlotlyHoverableLayer.__init__(self)
 
     def _plt_get_data(self):
         return self._data
 
     def _plt_set_data(self, data: list[NDArray[np.floating]]):
-        xdata = []
-        ydata = []
-        for each in data:
-            xdata = xdata + each[:, 0].tolist() + [None]
-            ydata = ydata + each[:, 1].tolist() + [None]
-        # remove last None
-        if len(xdata) > 0:
-            xdata.pop()
-            ydata.pop()
+        xdata, ydata = join_lines(data)
         self._data = data
         self._props["x"] = xdata
         self._props["y"] = ydata
+        self._nan_indices = np.flatnonzero(np.isnan(xdata))
 
     def _plt_get_ndata(self) -> int:
         return len(self._data)
@@ -218,6 +201,30 @@ class MultiLine(PlotlyHoverableLayer[go.Scatter]):
         return super()._plt_connect_pick_event(_new_cb)
 
 
+def join_lines(data: list[NDArray[np.floating]]) -> tuple[NDArray, NDArray]:
+    """Concatenate lines into x and y arrays, separated by NaN."""
+    # In plotly, we can break a line into multiple segments by inserting NaN. Numpy
+    # arrays are not validated element-wise by plotly, unlike lists with None.
+    if len(data) == 0:
+        return np.zeros(0), np.zeros(0)
+    if isinstance(data, PackedLines):
+        coords = data.coords.astype(np.float64, copy=False)
+        joined = np.insert(coords, data.offsets[1:-1], np.nan, axis=0)
+    elif isinstance(data, np.ndarray):
+        # packed (N, P, 2) array
+        joined = np.full((data.shape[0], data.shape[1] + 1, 2), np.nan)
+        joined[:, :-1] = data
+        joined = joined.reshape(-1, 2)[:-1]
+    else:
+        sep = np.full((1, 2), np.nan)
+        parts = []
+        for each in data:
+            parts.append(each)
+            parts.append(sep)
+        joined = np.concatenate(parts[:-1], axis=0, dtype=np.float64)
+    return joined[:, 0], joined[:, 1]
+
+
 def _warn_multiple(prop: str):
     return warnings.warn(
         f"plotly does not support multiple {prop}. Set to the first one.",
@@ -7,7 +7,7 @@ from plotly import graph_objects as go
 from whitecanvas.backend.plotly._base import PlotlyLayer
 from whitecanvas.protocols import TextProtocol, check_protocol
 from whitecanvas.types import Alignment, Hatch, LineStyle
-from whitecanvas.utils.normalize import arr_color, as_color_array, rgba_str_color
+from whitecanvas.utils.normalize import arr_color, as_color_array, rgba_str_colors
 
 
 @check_protocol(TextProtocol)
@@ -50,7 +50,7 @@ class Texts(PlotlyLayer[go.Scatter]):
 
     def _plt_set_text_color(self, color):
         color = as_color_array(color, len(self._props["text"]))
-        self._props["textfont"]["color"] = [rgba_str_color(c) for c in color]
+        self._props["textfont"]["color"] = rgba_str_colors(color)
 
     def _plt_get_text_size(self) -> NDArray[np.floating]:
         return self._props["textfont"]["size"]
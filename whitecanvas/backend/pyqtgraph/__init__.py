@@ -1,4 +1,4 @@
-from whitecanvas.backend.pyqtgraph.band import Band
+from whitecanvas.backend.pyqtgraph.band import Band, MultiBand
 from whitecanvas.backend.pyqtgraph.bars import Bars
 from whitecanvas.backend.pyqtgraph.canvas import Canvas, CanvasGrid
 from whitecanvas.backend.pyqtgraph.image import Image
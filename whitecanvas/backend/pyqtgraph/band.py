@@ -6,7 +6,7 @@ import numpy as np
 import pyqtgraph as pg
 from numpy.typing import NDArray
 from pyqtgraph.GraphicsScene.mouseEvents import HoverEvent as pgHoverEvent
-from qtpy import QtGui
+from qtpy import QtCore, QtGui
 
 from whitecanvas.backend.pyqtgraph._base import PyQtLayer
 from whitecanvas.backend.pyqtgraph._qt_utils import (
@@ -16,8 +16,10 @@ from whitecanvas.backend.pyqtgraph._qt_utils import (
     to_qt_brush_style,
     to_qt_line_style,
 )
-from whitecanvas.protocols import BandProtocol, check_protocol
+from whitecanvas.protocols import BandProtocol, MultiBandProtocol, check_protocol
 from whitecanvas.types import Hatch, LineStyle, Orientation
+from whitecanvas.utils.normalize import as_color_array
+from whitecanvas.utils.type_check import is_real_number
 
 
 @check_protocol(BandProtocol)
@@ -154,3 +156,162 @@ class Band(pg.FillBetweenItem, PyQtLayer):
         for cb in self._callbacks:
             cb(ev)
         return super().mousePressEvent(ev)
+
+
+@check_protocol(MultiBandProtocol)
+class MultiBand(pg.GraphicsObject, PyQtLayer):
+    clicked = QtCore.Signal(object)
+
+    def __init__(self, data: list[NDArray[np.floating]]):
+        super().__init__()
+        self._data: list[NDArray[np.floating]] = []
+        self._polygons: list[QtGui.QPolygonF] = []
+        self._pens: list[QtGui.QPen] = []
+        self._brushes: list[QtGui.QBrush] = []
+        self._picture: QtGui.QPicture | None = None
+        self._bounding_rect_cache: QtCore.QRectF | None = None
+        self._hover_texts: list[str] = None
+        self._toolTipCleared = True
+        self._plt_set_data(data)
+
+    ##### XYDataProtocol #####
+    def _plt_get_data(self) -> list[NDArray[np.floating]]:
+        return self._data
+
+    def _plt_set_data(self, data: list[NDArray[np.floating]]):
+        ndata = len(data)
+        nitem = len(self._pens)
+        if ndata < nitem:
+            self._pens = self._pens[:ndata]
+            self._brushes = self._brushes[:ndata]
+        for _ in range(nitem, ndata):
+            if nitem > 0:
+                pen, brush = QtGui.QPen(self._pens[-1]), QtGui.QBrush(self._brushes[-1])
+            else:
+                pen = QtGui.QPen(QtGui.QColor(0, 0, 0))
+                pen.setCosmetic(True)
+                brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+            self._pens.append(pen)
+            self._brushes.append(brush)
+        self._polygons = [
+            pg.functions.arrayToQPolygonF(verts[:, 0], verts[:, 1]) for verts in data
+        ]
+        self._data = data
+        self._update_picture()
+
+    def _plt_get_ndata(self) -> int:
+        return len(self._data)
+
+    def _update_picture(self):
+        self.prepareGeometryChange()
+        self._picture = None
+        self._bounding_rect_cache = None
+        self.update()
+
+    def boundingRect(self) -> QtCore.QRectF:
+        if self._bounding_rect_cache is None:
+            rect = QtCore.QRectF()
+            for polygon in self._polygons:
+                rect = rect.united(polygon.boundingRect())
+            self._bounding_rect_cache = rect
+        return self._bounding_rect_cache
+
+    def paint(self, p: QtGui.QPainter, *args):
+        if self._picture is None:
+            # all the polygons are recorded once and replayed on every repaint
+            self._picture = QtGui.QPicture()
+            painter = QtGui.QPainter(self._picture)
+            no_pen = QtGui.QPen(QtCore.Qt.PenStyle.NoPen)
+            for polygon, pen, brush in zip(self._polygons, self._pens, self._brushes):
+                # Qt draws zero-width pens as 1-pixel lines
+                painter.setPen(pen if pen.widthF() > 0 else no_pen)
+                painter.setBrush(brush)
+                painter.drawPolygon(polygon)
+            painter.end()
+        self._picture.play(p)
+
+    ##### HasFace protocol #####
+    def _plt_get_face_color(self) -> NDArray[np.float32]:
+        colors = [brush.color().getRgbF() for brush in self._brushes]
+        return np.array(colors, dtype=np.float32).reshape(-1, 4)
+
+    def _plt_set_face_color(self, color: NDArray[np.float32]):
+        color = as_color_array(color, self._plt_get_ndata())
+        for brush, c in zip(self._brushes, color):
+            brush.setColor(array_to_qcolor(c))
+        self._update_picture()
+
+    def _plt_get_face_hatch(self) -> list[Hatch]:
+        return [from_qt_brush_style(brush.style()) for brush in self._brushes]
+
+    def _plt_set_face_hatch(self, pattern: Hatch | list[Hatch]):
+        if isinstance(pattern, Hatch):
+            pattern = [pattern] * self._plt_get_ndata()
+        for brush, ptn in zip(self._brushes, pattern):
+            brush.setStyle(to_qt_brush_style(ptn))
+        self._update_picture()
+
+    ##### HasEdges protocol #####
+    def _plt_get_edge_color(self) -> NDArray[np.float32]:
+        colors = [pen.color().getRgbF() for pen in self._pens]
+        return np.array(colors, dtype=np.float32).reshape(-1, 4)
+
+    def _plt_set_edge_color(self, color: NDArray[np.float32]):
+        color = as_color_array(color, self._plt_get_ndata())
+        for pen, c in zip(self._pens, color):
+            pen.setColor(array_to_qcolor(c))
+        self._update_picture()
+
+    def _plt_get_edge_width(self) -> NDArray[np.floating]:
+        return np.array([pen.widthF() for pen in self._pens], dtype=np.float32)
+
+    def _plt_set_edge_width(self, width: float | NDArray[np.floating]):
+        if is_real_number(width):
+            width = np.full(self._plt_get_ndata(), width)
+        for pen, w in zip(self._pens, width):
+            pen.setWidthF(w)
+        self._update_picture()
+
+    def _plt_get_edge_style(self) -> list[LineStyle]:
+        return [from_qt_line_style(pen.style()) for pen in self._pens]
+
+    def _plt_set_edge_style(self, style: LineStyle | list[LineStyle]):
+        if isinstance(style, LineStyle):
+            style = [style] * self._plt_get_ndata()
+        for pen, s in zip(self._pens, style):
+            pen.setStyle(to_qt_line_style(s))
+        self._update_picture()
+
+    def _plt_set_hover_text(self, texts: list[str]):
+        self._hover_texts = texts
+
+    def _plt_connect_pick_event(self, callback):
+        def cb(ev: QtGui.QMouseEvent):
+            if idx := self._bands_under_cursor(ev.pos()):
+                callback(idx)
+
+        self.clicked.connect(cb)
+
+    def _bands_under_cursor(self, pos: QtCore.QPointF) -> list[int]:
+        if not self.boundingRect().contains(pos):
+            return []
+        fill_rule = QtCore.Qt.FillRule.OddEvenFill
+        return [
+            i for i, polygon in enumerate(self._polygons)
+            if polygon.containsPoint(pos, fill_rule)
+        ]  # fmt: skip
+
+    def hoverEvent(self, ev: pgHoverEvent):
+        vb = self.getViewBox()
+        if vb is not None and self._hover_texts is not None:
+            if idx := self._bands_under_cursor(ev.pos()):
+                self._toolTipCleared = False
+                vb.setToolTip(self._hover_texts[idx[-1]])
+            else:
+                if not self._toolTipCleared:
+                    vb.setToolTip("")
+                    self._toolTipCleared = True
+
+    def mousePressEvent(self, ev: QtGui.QMouseEvent):
+        super().mousePressEvent(ev)
+        self.clicked.emit(ev)
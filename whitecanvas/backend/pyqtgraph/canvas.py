@@ -224,6 +224,9 @@ class Canvas:
     def _plt_draw(self):
         pass  # pyqtgraph has its own draw mechanism
 
+    def _plt_call_later(self, msec: int, callback: Callable[[], None]):
+        QtCore.QTimer.singleShot(msec, callback)
+
     def _plt_make_legend(
         self,
         items: list[tuple[str, LegendItem]],
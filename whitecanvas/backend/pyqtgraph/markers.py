@@ -36,7 +36,8 @@ class Markers(pg.ScatterPlotItem, PyQtLayer):
             useCache=False,  # NOTE: should be True eventually, but pyqtgraph has
             # a bug in caching
         )
-        self.opts["tip"] = "{data}".format
+        self._hover_texts: list[str] | None = None
+        self.opts["tip"] = self._format_tip
 
     ##### XYDataProtocol #####
     def _plt_get_data(self):
@@ -55,8 +56,8 @@ class Markers(pg.ScatterPlotItem, PyQtLayer):
                 size=self.data["size"][:ndata],
             )
         else:
-            new_pen = [QtGui.QPen(pens[-1])] * (ndata - len(pens))
-            new_brush = [QtGui.QBrush(brushes[-1])] * (ndata - len(brushes))
+            new_pen = [QtGui.QPen(pens[-1]) for _ in range(ndata - len(pens))]
+            new_brush = [QtGui.QBrush(brushes[-1]) for _ in range(ndata - len(brushes))]
             new_size = np.full(ndata - len(self.data["size"]), self.data["size"][-1])
             self.setData(
                 xdata,
@@ -165,5 +166,12 @@ class Markers(pg.ScatterPlotItem, PyQtLayer):
         self.sigClicked.connect(cb)
 
     def _plt_set_hover_text(self, text: list[str]):
-        self.data["data"] = text
+        # spot data are the indices, texts are only looked up when hovered
+        self._hover_texts = text
+        self.data["data"] = np.arange(len(text))
         self.opts["hoverable"] = True
+
+    def _format_tip(self, x, y, data) -> str:
+        if self._hover_texts is None or data is None:
+            return ""
+        return self._hover_texts[data]
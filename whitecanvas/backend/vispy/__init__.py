@@ -1,4 +1,4 @@
-from whitecanvas.backend.vispy.band import Band
+from whitecanvas.backend.vispy.band import Band, MultiBand
 from whitecanvas.backend.vispy.bars import Bars
 from whitecanvas.backend.vispy.canvas import Canvas, CanvasGrid, as_overlay
 from whitecanvas.backend.vispy.image import Image
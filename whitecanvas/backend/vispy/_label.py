@@ -88,6 +88,7 @@ class Axis(scene.AxisWidget):
                 camera.set_range(x=limits, y=ylim, margin=margin)
         camera.set_default_state()
         camera.reset()
+        self._canvas_ref()._update_layer_views()
 
     def _plt_get_color(self):
         return np.array(self.axis.axis_color).ravel()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import warnings
+
 import numpy as np
 from numpy.typing import NDArray
 from vispy.color import Color as vispyColor
@@ -7,8 +9,10 @@ from vispy.gloo import set_state
 from vispy.scene import visuals
 
 from whitecanvas.backend import _not_implemented
-from whitecanvas.protocols import BandProtocol, check_protocol
+from whitecanvas.protocols import BandProtocol, MultiBandProtocol, check_protocol
 from whitecanvas.types import LineStyle, Orientation
+from whitecanvas.utils.normalize import as_color_array
+from whitecanvas.utils.type_check import is_real_number
 
 
 # vispy's Polygon is not well implemented. Use custom class.
@@ -181,3 +185,141 @@ class Band(VispyBand):
 
     def _plt_connect_pick_event(self, callback):
         pass
+
+
+@check_protocol(MultiBandProtocol)
+class MultiBand(visuals.Compound):
+    """All the bands are drawn as one mesh and one line visual."""
+
+    def __init__(self, data: list[NDArray[np.floating]]):
+        self._mesh = visuals.Mesh()
+        self._border = visuals.Line(method="gl", connect="segments")
+        self._data = data
+        ndata = len(data)
+        self._face_colors = np.zeros((ndata, 4), dtype=np.float32)
+        self._edge_colors = np.zeros((ndata, 4), dtype=np.float32)
+        self._edge_width = 0.0
+        super().__init__([self._mesh, self._border])
+        self._mesh.set_gl_state(polygon_offset_fill=True, polygon_offset=(1, 1))
+        self.unfreeze()
+        self._update_mesh()
+        self._update_border()
+
+    def _update_mesh(self):
+        set_state(polygon_offset_fill=False)
+        if len(self._data) == 0:
+            self._mesh.set_data(vertices=None, faces=None)
+            return
+        faces = []
+        offset = 0
+        for verts in self._data:
+            faces.append(_strip_faces(verts.shape[0]) + offset)
+            offset += verts.shape[0]
+        faces = np.concatenate(faces, axis=0)
+        nfaces = np.array([max(v.shape[0] - 2, 0) for v in self._data])
+        self._mesh.set_data(
+            vertices=np.concatenate(self._data, axis=0),
+            faces=faces,
+            face_colors=np.repeat(self._face_colors, nfaces, axis=0),
+        )
+
+    def _update_border(self):
+        if len(self._data) == 0 or self._edge_width <= 0:
+            self._border.visible = False
+            return
+        # each polygon is closed by connecting its last vertex to the first one
+        pos = np.concatenate([np.roll(v, -1, axis=0) for v in self._data], axis=0)
+        start = np.concatenate(self._data, axis=0)
+        seg = np.empty((start.shape[0] * 2, 2), dtype=np.float32)
+        seg[0::2] = start
+        seg[1::2] = pos
+        sizes = np.array([v.shape[0] for v in self._data])
+        colors = np.repeat(self._edge_colors, sizes * 2, axis=0)
+        self._border.set_data(pos=seg, color=colors, width=self._edge_width)
+        self._border.visible = True
+
+    ##### LayerProtocol #####
+    def _plt_get_visible(self) -> bool:
+        return self.visible
+
+    def _plt_set_visible(self, visible: bool):
+        self.visible = visible
+
+    ##### DataProtocol #####
+    def _plt_get_data(self) -> list[NDArray[np.floating]]:
+        return self._data
+
+    def _plt_set_data(self, data: list[NDArray[np.floating]]):
+        ndata = len(data)
+        self._face_colors = _resize_rows(self._face_colors, ndata)
+        self._edge_colors = _resize_rows(self._edge_colors, ndata)
+        self._data = data
+        self._update_mesh()
+        self._update_border()
+
+    def _plt_get_ndata(self) -> int:
+        return len(self._data)
+
+    ##### HasMultiFaces protocol #####
+    def _plt_get_face_color(self) -> NDArray[np.float32]:
+        return self._face_colors
+
+    def _plt_set_face_color(self, color: NDArray[np.float32]):
+        self._face_colors = as_color_array(color, len(self._data))
+        self._update_mesh()
+
+    _plt_get_face_hatch, _plt_set_face_hatch = _not_implemented.face_hatches()
+
+    ##### HasMultiEdges protocol #####
+    def _plt_get_edge_color(self) -> NDArray[np.float32]:
+        return self._edge_colors
+
+    def _plt_set_edge_color(self, color: NDArray[np.float32]):
+        self._edge_colors = as_color_array(color, len(self._data))
+        self._update_border()
+
+    def _plt_get_edge_width(self) -> NDArray[np.floating]:
+        return np.full(len(self._data), self._edge_width, dtype=np.float32)
+
+    def _plt_set_edge_width(self, width):
+        if is_real_number(width):
+            self._edge_width = float(width)
+        else:
+            candidates = np.unique(width)
+            if len(candidates) == 0:
+                return
+            elif len(candidates) > 1:
+                warnings.warn(
+                    "vispy backend does not support different edge width for each "
+                    "band. The first value is used for all bands",
+                    UserWarning,
+                    stacklevel=2,
+                )
+            self._edge_width = float(width[0])
+        self._update_border()
+
+    _plt_get_edge_style, _plt_set_edge_style = _not_implemented.edge_styles()
+
+    def _plt_set_hover_text(self, text: list[str]):
+        # TODO: not used yet
+        self._hover_texts = text
+
+    def _plt_connect_pick_event(self, callback):
+        pass
+
+
+def _strip_faces(npos: int) -> NDArray[np.uint32]:
+    """Triangulate a (2N, 2) band outline the same way as `VispyBand`."""
+    _index = np.arange(npos // 2 - 1, dtype=np.uint32)
+    _index_inv = npos - _index
+    faces0 = np.stack([_index, _index + 1, _index_inv - 1], axis=1)
+    faces1 = np.stack([_index + 1, _index_inv - 1, _index_inv - 2], axis=1)
+    return np.concatenate([faces0, faces1], axis=0)
+
+
+def _resize_rows(arr: NDArray[np.float32], n: int) -> NDArray[np.float32]:
+    if arr.shape[0] >= n:
+        return arr[:n]
+    if arr.shape[0] == 0:
+        return np.zeros((n, arr.shape[1]), dtype=arr.dtype)
+    return np.concatenate([arr, np.repeat(arr[-1:], n - arr.shape[0], axis=0)])
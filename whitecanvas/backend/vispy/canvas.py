@@ -9,6 +9,7 @@ import numpy as np
 from numpy.typing import NDArray
 from psygnal import Signal
 from vispy import use as vispy_use
+from vispy.app import Timer
 from vispy.scene import PanZoomCamera, SceneCanvas, ViewBox, visuals
 from vispy.util import keys
 
@@ -40,6 +41,7 @@ class Canvas:
         grid.spacing = 0
         _viewbox = grid.add_view(row=1, col=1, camera=Camera())
         self._viewbox: ViewBox = _viewbox
+        self._timers: set[Timer] = set()
 
         title = TextLabel("")
         title.height_max = 40
@@ -85,6 +87,11 @@ class Canvas:
         self._mouse_move_callbacks: list[Callable[[MouseEvent], None]] = []
         self._mouse_double_click_callbacks: list[Callable[[MouseEvent], None]] = []
         self._mouse_release_callbacks: list[Callable[[MouseEvent], None]] = []
+        self._pickable_layers: list[visuals.visuals.Visual] = []
+        self._tooltip: visuals.Text | None = None
+        # layers that load their data depending on the visible region
+        self._view_dependent_layers: list[visuals.visuals.Visual] = []
+        self._camera.changed.connect(self._update_layer_views)
 
     def _set_scene_ref(self, scene):
         self._viewbox.unfreeze()
@@ -147,10 +154,49 @@ class Canvas:
             blend_equation="func_add",
         )
         layer.parent = self._viewbox.scene
+        if hasattr(layer, "_pick_at"):
+            self._pickable_layers.append(layer)
+        if hasattr(layer, "_update_view"):
+            self._view_dependent_layers.append(layer)
+            layer._update_view(self._view_rect())
 
     def _plt_remove_layer(self, layer):
         """Remove layer from the canvas"""
         layer.parent = None
+        if layer in self._pickable_layers:
+            self._pickable_layers.remove(layer)
+        if layer in self._view_dependent_layers:
+            self._view_dependent_layers.remove(layer)
+
+    def _update_tooltip(self, pos: NDArray[np.floating], scale: NDArray[np.floating]):
+        """Show the hover text of the layer under the position."""
+        for layer in reversed(self._pickable_layers):
+            if not hasattr(layer, "_hover_text_at"):
+                continue
+            if text := layer._hover_text_at(pos, scale):
+                if self._tooltip is None:
+                    self._tooltip = visuals.Text(
+                        color="black", font_size=8, anchor_x="left",
+                        anchor_y="bottom", parent=self._viewbox.scene,
+                    )  # fmt: skip
+                    self._tooltip.order = 10000
+                self._tooltip.text = text
+                self._tooltip.pos = pos
+                self._tooltip.visible = True
+                return
+        if self._tooltip is not None:
+            self._tooltip.visible = False
+
+    def _view_rect(self) -> tuple[float, float, float, float]:
+        rect = self._camera.rect
+        return rect.left, rect.right, rect.bottom, rect.top
+
+    def _update_layer_views(self):
+        if not self._view_dependent_layers:
+            return
+        rect = self._view_rect()
+        for layer in self._view_dependent_layers:
+            layer._update_view(rect)
 
     def _plt_get_visible(self) -> bool:
         """Get visibility of canvas"""
@@ -199,6 +245,15 @@ class Canvas:
     def _plt_draw(self):
         pass  # vispy has its own draw mechanism
 
+    def _plt_call_later(self, msec: int, callback: Callable[[], None]):
+        def _cb(event):
+            self._timers.discard(timer)
+            callback()
+
+        timer = Timer(interval=msec / 1000, connect=_cb, iterations=1)
+        self._timers.add(timer)  # keep a reference until it fires
+        timer.start()
+
     def _plt_make_legend(self, *args, **kwargs):
         warnings.warn(
             "Legend is not supported in vispy backend",
@@ -305,6 +360,11 @@ class SceneCanvasExt(SceneCanvas):
             )
             for callback in canvas._mouse_click_callbacks:
                 callback(ev)
+            if canvas._pickable_layers:
+                # size of a screen pixel in the data coordinates
+                scale = np.abs(tr.map(np.asarray(event.pos) + 1)[:2] - pos)
+                for layer in reversed(canvas._pickable_layers):
+                    layer._pick_at(pos, scale)
 
     def on_mouse_move(self, event: vispyMouseEvent):
         visual = self.visual_at(event.pos)
@@ -321,6 +381,10 @@ class SceneCanvasExt(SceneCanvas):
 
             for callback in canvas._mouse_move_callbacks:
                 callback(ev)
+            if canvas._pickable_layers and ev.button is MouseButton.NONE:
+                # size of a screen pixel in the data coordinates
+                scale = np.abs(tr.map(np.asarray(event.pos) + 1)[:2] - pos)
+                canvas._update_tooltip(pos, scale)
 
     def on_mouse_double_click(self, event: vispyMouseEvent):
         visual = self.visual_at(event.pos)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import math
+from collections import OrderedDict
+
 import numpy as np
 from cmap import Colormap
 from numpy.typing import NDArray
@@ -8,17 +11,150 @@ from vispy.visuals.transforms import STTransform
 
 from whitecanvas.protocols import ImageProtocol, check_protocol
 
+# images larger than this are split into tiles of this size
+_TILE_SIZE = 2048
+# maximum size of the downsampled image shown when the tiles are not loaded
+_OVERVIEW_SIZE = 2048
+# maximum number of bytes of the full-resolution tiles kept in the GPU memory
+_TILE_MEMORY_BUDGET = 512 * 1024**2
+
+
+def _as_texture_data(data: np.ndarray) -> np.ndarray:
+    # GPU does not support f64
+    if data.dtype in (np.float64, np.int32, np.int64, np.uint32, np.uint64):
+        return data.astype(np.float32)
+    return data
+
 
 @check_protocol(ImageProtocol)
 class Image(visuals.Image):
+    """
+    Image visual with tiled rendering for large images.
+
+    An image larger than `_TILE_SIZE` is drawn as a downsampled overview. The
+    full-resolution tiles covering the visible region are uploaded as child visuals
+    when the view changes, and the off-screen tiles are evicted when they exceed
+    `_TILE_MEMORY_BUDGET`. Contrast limits and colormaps are applied in the shader,
+    so changing them never re-uploads the data.
+    """
+
     def __init__(self, data: np.ndarray):
         self._cmap_obj = Colormap("gray")
-        # GPU does not support f64
-        if data.dtype in (np.float64, np.int32, np.int64, np.uint32, np.uint64):
-            data = data.astype(np.float32)
-        super().__init__(data, cmap="gray")
-        tr = STTransform()
-        self.transform = tr
+        self._data_orig = data
+        self._stride = self._get_stride(data)
+        self._gl_state_kwargs: dict = {}
+        self._tiles: OrderedDict[tuple[int, int], visuals.Image] = OrderedDict()
+        super().__init__(self._overview(), cmap="gray", texture_format="auto")
+        self.unfreeze()
+        self._logical_transform = STTransform()
+        self._view_rect: tuple[float, float, float, float] | None = None
+        self._sync_transform()
+
+    @staticmethod
+    def _get_stride(data: np.ndarray) -> int:
+        return math.ceil(max(*data.shape[:2], 1) / _OVERVIEW_SIZE)
+
+    @property
+    def _is_tiled(self) -> bool:
+        return max(self._data_orig.shape[:2]) > _TILE_SIZE
+
+    def _overview(self) -> np.ndarray:
+        return _as_texture_data(self._data_orig[:: self._stride, :: self._stride])
+
+    def _overview_scale(self) -> tuple[float, float]:
+        """Size of an overview pixel in the original pixel coordinates."""
+        h, w = self._data_orig.shape[:2]
+        oh, ow = self._data.shape[:2]
+        return w / max(ow, 1), h / max(oh, 1)
+
+    def _sync_transform(self):
+        """Update the transform of the overview and the tiles."""
+        tr = self._logical_transform
+        sx, sy = self._overview_scale()
+        self.transform = STTransform(
+            scale=(tr.scale[0] * sx, tr.scale[1] * sy, 1, 1), translate=tr.translate
+        )
+        for (r0, c0), tile in self._tiles.items():
+            tile.transform = STTransform(
+                scale=(1 / sx, 1 / sy, 1, 1), translate=(c0 / sx, r0 / sy, 0, 0)
+            )
+        self.update()
+
+    def set_gl_state(self, preset=None, **kwargs):
+        super().set_gl_state(preset, **kwargs)
+        self._gl_state_kwargs = {"preset": preset, **kwargs}
+        for tile in self._tiles.values():
+            tile.set_gl_state(preset, **kwargs)
+
+    def _update_view(self, rect: tuple[float, float, float, float]):
+        """Load the tiles visible in the (left, right, bottom, top) rectangle."""
+        self._view_rect = rect
+        if not self._is_tiled:
+            return
+        tr = self._logical_transform
+        left, right, bottom, top = rect
+        (c_start, c_stop), (r_start, r_stop) = (
+            sorted(((left - tr.translate[0]) / tr.scale[0],
+                    (right - tr.translate[0]) / tr.scale[0])),
+            sorted(((bottom - tr.translate[1]) / tr.scale[1],
+                    (top - tr.translate[1]) / tr.scale[1])),
+        )  # fmt: skip
+        h, w = self._data_orig.shape[:2]
+        rows = range(
+            max(int(r_start // _TILE_SIZE), 0),
+            min(int(r_stop // _TILE_SIZE) + 1, math.ceil(h / _TILE_SIZE)),
+        )
+        cols = range(
+            max(int(c_start // _TILE_SIZE), 0),
+            min(int(c_stop // _TILE_SIZE) + 1, math.ceil(w / _TILE_SIZE)),
+        )
+        keys = [(r * _TILE_SIZE, c * _TILE_SIZE) for r in rows for c in cols]
+        # the overview has the same dtype as the tiles
+        itemsize = self._data.itemsize * self._nchannels()
+        if len(keys) * _TILE_SIZE**2 * itemsize > _TILE_MEMORY_BUDGET:
+            keys = []  # too zoomed out, the overview is enough
+        visible = set(keys)
+        for key, tile in self._tiles.items():
+            tile.visible = key in visible
+        for key in keys:
+            if key in self._tiles:
+                self._tiles.move_to_end(key)
+            else:
+                self._tiles[key] = self._create_tile(*key)
+        self._evict_tiles(visible)
+        self._sync_transform()
+
+    def _nchannels(self) -> int:
+        return 1 if self._data_orig.ndim == 2 else self._data_orig.shape[2]
+
+    def _create_tile(self, r0: int, c0: int) -> visuals.Image:
+        sl = slice(r0, r0 + _TILE_SIZE), slice(c0, c0 + _TILE_SIZE)
+        tile = visuals.Image(
+            _as_texture_data(self._data_orig[sl]),
+            cmap=self.cmap,
+            clim=self.clim,
+            texture_format="auto",
+            parent=self,
+        )
+        tile.set_gl_state(**self._gl_state_kwargs)
+        return tile
+
+    def _evict_tiles(self, keep: set[tuple[int, int]]):
+        """Remove the least recently used tiles until the memory budget is met."""
+        nbytes = sum(tile._data.nbytes for tile in self._tiles.values())
+        for key in list(self._tiles.keys()):
+            if nbytes <= _TILE_MEMORY_BUDGET:
+                break
+            if key in keep:
+                continue
+            tile = self._tiles.pop(key)
+            nbytes -= tile._data.nbytes
+            tile.parent = None
+
+    def _clear_tiles(self):
+        for tile in self._tiles.values():
+            tile.parent = None
+        self._tiles.clear()
 
     def _plt_get_visible(self) -> bool:
         return self.visible
@@ -27,16 +163,24 @@ class Image(visuals.Image):
         self.visible = visible
 
     def _plt_get_data(self) -> np.ndarray:
-        return self._data
+        return self._data_orig
 
     def _plt_set_data(self, data: np.ndarray):
-        self.set_data(data)
+        self._clear_tiles()
+        self._data_orig = data
+        self._stride = self._get_stride(data)
+        self.set_data(self._overview())
+        self._sync_transform()
+        if self._view_rect is not None:
+            self._update_view(self._view_rect)
 
     def _plt_get_colormap(self) -> Colormap:
         return self._cmap_obj
 
     def _plt_set_colormap(self, cmap: Colormap):
         self.cmap = cmap.to_vispy()
+        for tile in self._tiles.values():
+            tile.cmap = self.cmap
         self._cmap_obj = cmap
 
     def _plt_get_clim(self) -> tuple[float, float]:
@@ -44,6 +188,8 @@ class Image(visuals.Image):
 
     def _plt_set_clim(self, clim: tuple[float, float]):
         self.clim = clim
+        for tile in self._tiles.values():
+            tile.clim = clim
 
     def _plt_get_translation(self) -> NDArray[np.floating]:
         tr = self._plt_get_transform()
@@ -56,8 +202,7 @@ class Image(visuals.Image):
         dx, dy = translation
         sx, sy = self._plt_get_scale()
         tr.translate = dx - 0.5 * sx, dy - 0.5 * sy, 0.0, 0.0
-        self.transform = tr
-        self.update()
+        self._sync_transform()
 
     def _plt_get_scale(self) -> NDArray[np.floating]:
         tr = self._plt_get_transform()
@@ -70,11 +215,7 @@ class Image(visuals.Image):
         sx, sy = scale[0], scale[1]
         tr.scale = (sx, sy, 1, 1)
         tr.translate = dx - 0.5 * sx, dy - 0.5 * sy, 0.0, 0.0
-        self.transform = tr
-        self.update()
+        self._sync_transform()
 
     def _plt_get_transform(self) -> STTransform:
-        tr = self.transform
-        if not isinstance(tr, STTransform):
-            raise TypeError(f"Unexpected transform type: {type(tr)}")
-        return tr
+        return self._logical_transform
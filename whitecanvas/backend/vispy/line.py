@@ -8,6 +8,7 @@ from vispy.scene import visuals
 
 from whitecanvas.backend import _not_implemented
 from whitecanvas.protocols import LineProtocol, MultiLineProtocol, check_protocol
+from whitecanvas.types import PackedLines
 from whitecanvas.utils.normalize import as_color_array
 from whitecanvas.utils.type_check import is_real_number
 
@@ -63,26 +64,43 @@ class MonoLine(visuals.Line):
         pass
 
 
+def _line_lengths(data: list[NDArray[np.number]]) -> NDArray[np.intp]:
+    if isinstance(data, PackedLines):
+        return data.lengths
+    if isinstance(data, np.ndarray):
+        # packed (N, P, 2) array
+        return np.full(data.shape[0], data.shape[1], dtype=np.intp)
+    return np.array([len(seg) for seg in data], dtype=np.intp)
+
+
 def _make_connection(data: NDArray[np.number]):
     if len(data) == 0:
         return np.empty((0, 2), dtype=np.uint32)
-    connections = []
-    npoints = 0
-    for seg in data:
-        conn = np.column_stack(
-            [
-                np.arange(npoints, npoints + len(seg) - 1, dtype=np.uint32),
-                np.arange(npoints + 1, npoints + len(seg), dtype=np.uint32),
-            ]
-        )
-        connections.append(conn)
-        npoints += len(seg)
-    return np.concatenate(connections)
+    lengths = _line_lengths(data)
+    ends = np.cumsum(lengths)
+    # connect every point to the next one unless it is the last point of a line
+    is_last = np.zeros(ends[-1], dtype=np.bool_)
+    is_last[ends[lengths > 0] - 1] = True
+    start = np.flatnonzero(~is_last).astype(np.uint32)
+    return np.stack([start, start + 1], axis=1)
+
+
+def _same_layout(old, new) -> bool:
+    """True if the lines of `old` and `new` have the same number of points."""
+    if isinstance(old, np.ndarray) and isinstance(new, np.ndarray):
+        return old.shape == new.shape
+    if isinstance(old, PackedLines) and isinstance(new, PackedLines):
+        return np.array_equal(old.offsets, new.offsets)
+    return False
 
 
 def _safe_concat(data: list[NDArray[np.floating]]):
     if len(data) == 0:
         return None
+    if isinstance(data, PackedLines):
+        return data.coords
+    if isinstance(data, np.ndarray):
+        return data.reshape(-1, data.shape[-1])
     return np.concatenate(data, axis=0)
 
 
@@ -113,9 +131,13 @@ class MultiLine(visuals.Line):
         return self._data_raw
 
     def _plt_set_data(self, data: list[NDArray[np.floating]]):
-        connections = _make_connection(data)
+        old = self._data_raw
         self._data_raw = data
-        self.set_data(pos=_safe_concat(data), connect=connections)
+        if _same_layout(old, data):
+            # only the vertices moved, connections and colors are unchanged
+            self.set_data(pos=_safe_concat(data))
+        else:
+            self.set_data(pos=_safe_concat(data), connect=_make_connection(data))
 
     ##### HasEdges #####
     def _plt_get_edge_width(self) -> NDArray[np.floating]:
@@ -148,10 +170,9 @@ class MultiLine(visuals.Line):
     def _plt_set_edge_color(self, color: NDArray[np.float32]):
         ndata = len(self._data_raw)
         colors = as_color_array(color, ndata)
-        raw_colors = []
-        for color, seg in zip(colors, self._data_raw):
-            raw_colors.append(np.repeat(color[np.newaxis], len(seg), axis=0))
-        self.set_data(color=_safe_concat(raw_colors))
+        if ndata > 0:
+            lengths = _line_lengths(self._data_raw)
+            self.set_data(color=np.repeat(colors, lengths, axis=0))
         self._seg_colors = colors
 
     def _plt_get_antialias(self) -> bool:
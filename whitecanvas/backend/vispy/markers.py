@@ -10,8 +10,11 @@ from whitecanvas.backend import _not_implemented
 from whitecanvas.protocols import MarkersProtocol, check_protocol
 from whitecanvas.types import Symbol
 from whitecanvas.utils.normalize import as_color_array
+from whitecanvas.utils.spatial import GridIndex
 from whitecanvas.utils.type_check import is_real_number
 
+_VALUE_TO_SYMBOL = {v: k for k, v in visuals.Markers._symbol_shader_values.items()}
+
 
 @check_protocol(MarkersProtocol)
 class Markers(visuals.Markers):
@@ -19,13 +22,50 @@ class Markers(visuals.Markers):
         pos = np.stack([xdata, ydata], axis=1)
         super().__init__(pos=pos, edge_width=0, face_color="blue")
         self.unfreeze()
+        # `self._data` is always a view of the first N rows of `self._buffer`. The
+        # rest of the buffer is filled with invisible markers so that the vertex
+        # buffer does not have to be reallocated every time a marker is added.
+        self._buffer: np.ndarray = self._data
         self._hover_texts: list[str] | None = None
+        self._pick_callbacks = []
+        self._index: GridIndex | None = None
         # self._picking_filter = MarkerPickingFilter()
         # self.attach(self._picking_filter)
 
     def _plt_get_ndata(self):
         return len(self._data["a_position"])
 
+    def _reserve(self, size: int) -> bool:
+        """Make sure the buffer can hold `size` markers, return True if resized."""
+        capacity = self._buffer.shape[0]
+        if size <= capacity:
+            return False
+        # grow with some headroom to avoid reallocation on every append
+        new_capacity = max(size, capacity + capacity // 2)
+        buffer = np.zeros(new_capacity, dtype=self._buffer.dtype)
+        buffer[:capacity] = self._buffer
+        self._buffer = buffer
+        self._data = buffer[: self._plt_get_ndata()]
+        return True
+
+    def _upload(self, stop: int, resized: bool = False):
+        """Upload the first `stop` rows of the buffer to the GPU."""
+        if resized:
+            self._vbo.set_data(self._buffer)
+            self.shared_program.bind(self._vbo)
+        elif stop > 0:
+            self._vbo.set_subdata(self._buffer[:stop])
+        self.events.data_updated()
+        self.update()
+
+    def _set_field(self, name: str, value):
+        """Update one attribute of all the markers."""
+        ndata = self._plt_get_ndata()
+        if ndata == 0:
+            return
+        self._data[name] = value
+        self._upload(ndata)
+
     ##### LayerProtocol #####
     def _plt_get_visible(self) -> bool:
         return self.visible
@@ -35,45 +75,46 @@ class Markers(visuals.Markers):
 
     ##### XYDataProtocol #####
     def _plt_get_data(self):
+        # copy, so that the returned arrays are not updated in place later
         data = self._data["a_position"]
-        return data[:, 0], data[:, 1]
+        return data[:, 0].copy(), data[:, 1].copy()
 
     def _plt_set_data(self, xdata, ydata):
+        self._set_positions(xdata, ydata)
+        self._index = None
+
+    def _set_positions(self, *coords: NDArray[np.number]):
         ndata = self._plt_get_ndata()
-        size = self._plt_get_symbol_size()
-        edge_width = self._plt_get_edge_width()
-        face_color = self._plt_get_face_color()
-        edge_color = self._plt_get_edge_color()
-        if xdata.size > ndata:
-            size = np.concatenate([size, np.full(xdata.size - ndata, size[-1])])
-            edge_width = np.concatenate(
-                [edge_width, np.full(xdata.size - ndata, edge_width[-1])]
-            )
-            face_color = np.concatenate(
-                [face_color, np.full((xdata.size - ndata, 4), face_color[-1])]
-            )
-            edge_color = np.concatenate(
-                [edge_color, np.full((xdata.size - ndata, 4), edge_color[-1])]
-            )
-        elif xdata.size < ndata:
-            size = size[: xdata.size]
-            edge_width = edge_width[: xdata.size]
-            face_color = face_color[: xdata.size]
-            edge_color = edge_color[: xdata.size]
-        self.set_data(
-            pos=np.stack([xdata, ydata], axis=1),
-            size=size,
-            edge_width=edge_width,
-            face_color=face_color,
-            edge_color=edge_color,
-            symbol=self.symbol[0],
-        )
+        size = coords[0].size
+        resized = self._reserve(size)
+        buffer = self._buffer
+        if size > ndata:
+            if ndata > 0:
+                # new markers inherit the properties of the last one
+                buffer[ndata:size] = buffer[ndata - 1]
+            else:
+                buffer[:size] = self._default_record()
+        elif size < ndata:
+            # hide the removed markers
+            buffer[size:ndata] = np.zeros(1, dtype=buffer.dtype)
+        pos = buffer["a_position"]
+        for i, each in enumerate(coords):
+            pos[:size, i] = each
+        self._data = buffer[:size]
+        self._upload(max(size, ndata), resized)
+
+    def _default_record(self) -> np.ndarray:
+        record = np.zeros(1, dtype=self._buffer.dtype)
+        record["a_fg_color"] = (0.0, 0.0, 0.0, 1.0)
+        record["a_bg_color"] = (0.0, 0.0, 1.0, 1.0)
+        record["a_size"] = 10.0
+        return record
 
     ##### HasSymbol protocol #####
     def _plt_get_symbol(self) -> Symbol:
         if self._data["a_position"].shape[0] == 0:
             return Symbol.CIRCLE
-        sym = self.symbol[0]
+        sym = _VALUE_TO_SYMBOL.get(float(self._data["a_symbol"][0]))
         if sym == "clobber":
             return Symbol.TRIANGLE_LEFT
         elif sym == "diamond":
@@ -86,14 +127,19 @@ class Markers(visuals.Markers):
 
     def _plt_set_symbol(self, symbol: Symbol):
         if symbol is Symbol.DIAMOND:
-            self.symbol = "diamond"
+            sym = "diamond"
         elif symbol is Symbol.HBAR:
-            self.symbol = "-"
+            sym = "-"
         elif symbol is Symbol.TRIANGLE_LEFT:
             # NOTE: vispy does not have "<"
-            self.symbol = "clobber"
+            sym = "clobber"
         else:
-            self.symbol = symbol.value
+            sym = symbol.value
+        try:
+            value = self._symbol_shader_values[sym]
+        except KeyError:
+            raise ValueError(f"symbols must one of {self.symbols}") from None
+        self._set_field("a_symbol", value)
 
     def _plt_get_symbol_size(self) -> NDArray[np.floating]:
         return self._data["a_size"]
@@ -103,14 +149,7 @@ class Markers(visuals.Markers):
             size = np.full(self._plt_get_ndata(), size)
         if size.shape[0] == 0:
             return
-        self.set_data(
-            pos=self._data["a_position"],
-            size=size,
-            edge_width=self._plt_get_edge_width(),
-            face_color=self._plt_get_face_color(),
-            edge_color=self._plt_get_edge_color(),
-            symbol=self.symbol,
-        )
+        self._set_field("a_size", size)
 
     ##### HasFace protocol #####
     def _plt_get_face_color(self) -> NDArray[np.float32]:
@@ -120,14 +159,7 @@ class Markers(visuals.Markers):
         color = as_color_array(color, self._plt_get_ndata())
         if color.shape[0] == 0:
             return
-        self.set_data(
-            pos=self._data["a_position"],
-            size=self._plt_get_symbol_size(),
-            edge_width=self._plt_get_edge_width(),
-            face_color=color,
-            edge_color=self._plt_get_edge_color(),
-            symbol=self.symbol,
-        )
+        self._set_field("a_bg_color", color)
 
     _plt_get_face_hatch, _plt_set_face_hatch = _not_implemented.face_hatches()
 
@@ -139,41 +171,71 @@ class Markers(visuals.Markers):
         color = as_color_array(color, self._plt_get_ndata())
         if color.shape[0] == 0:
             return
-        self.set_data(
-            pos=self._data["a_position"],
-            size=self._plt_get_symbol_size(),
-            edge_width=self._plt_get_edge_width(),
-            face_color=self._plt_get_face_color(),
-            edge_color=color,
-            symbol=self.symbol,
-        )
+        self._set_field("a_fg_color", color)
 
     def _plt_get_edge_width(self) -> NDArray[np.floating]:
         return self._data["a_edgewidth"]
 
     def _plt_set_edge_width(self, width: float):
-        if isinstance(width, float):
+        if is_real_number(width):
             width = np.full(self._plt_get_ndata(), width)
         if width.shape[0] == 0:
             return
-        self.set_data(
-            pos=self._data["a_position"],
-            size=self._plt_get_symbol_size(),
-            edge_width=width,
-            face_color=self._plt_get_face_color(),
-            edge_color=self._plt_get_edge_color(),
-            symbol=self.symbol,
-        )
+        if np.any(width < 0):
+            raise ValueError("edge_width cannot be negative")
+        self._set_field("a_edgewidth", width)
 
     _plt_get_edge_style, _plt_set_edge_style = _not_implemented.edge_styles()
 
     def _plt_connect_pick_event(self, callback):
-        # TODO: implement this
-        # https://github.com/napari/napari/blob/main/napari/layers/points/points.py#L1617
-        pass
+        self._pick_callbacks.append(callback)
+
+    def _hit_test(
+        self, pos: NDArray[np.floating], scale: NDArray[np.floating]
+    ) -> list[int]:
+        """
+        Indices of the markers under the given position, nearest first.
+
+        `scale` is the size of a screen pixel in the data coordinates.
+        """
+        if not self.visible:
+            return []
+        data = self._data["a_position"]
+        if data is None or data.shape[0] == 0:
+            return []
+        if self._index is None:
+            self._index = GridIndex(data[:, 0], data[:, 1])
+        radius = self._data["a_size"] / 2 + self._data["a_edgewidth"]  # in pixels
+        r_max = radius.max()
+        (x0, y0), (dx, dy) = pos, scale * r_max
+        cand = self._index.query_rect(x0 - dx, x0 + dx, y0 - dy, y0 + dy)
+        if cand.size == 0:
+            return []
+        dist = np.hypot(
+            (data[cand, 0] - x0) / scale[0], (data[cand, 1] - y0) / scale[1]
+        )
+        hit = dist <= radius[cand]
+        return cand[hit][np.argsort(dist[hit], kind="stable")].tolist()
+
+    def _pick_at(self, pos: NDArray[np.floating], scale: NDArray[np.floating]):
+        """Emit pick callbacks for the markers under the given position."""
+        if not self._pick_callbacks:
+            return
+        if indices := self._hit_test(pos, scale):
+            for callback in self._pick_callbacks:
+                callback(indices)
+
+    def _hover_text_at(
+        self, pos: NDArray[np.floating], scale: NDArray[np.floating]
+    ) -> str | None:
+        """Hover text of the nearest marker under the given position."""
+        if not self._hover_texts:
+            return None
+        if indices := self._hit_test(pos, scale):
+            return self._hover_texts[indices[0]]
+        return None
 
     def _plt_set_hover_text(self, text: list[str]):
-        # TODO: not used yet
         self._hover_texts = text
 
     def _compute_bounds(self, axis, view):
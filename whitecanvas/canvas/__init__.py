@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING, Any
+
 from whitecanvas.canvas._base import Canvas, CanvasBase
 from whitecanvas.canvas._grid import (
     CanvasGrid,
@@ -5,9 +7,11 @@ from whitecanvas.canvas._grid import (
     CanvasVGrid,
     SingleCanvas,
 )
-from whitecanvas.canvas._joint import JointGrid
 from whitecanvas.canvas._linker import link_axes
 
+if TYPE_CHECKING:
+    from whitecanvas.canvas._joint import JointGrid
+
 __all__ = [
     "CanvasBase",
     "Canvas",
@@ -18,3 +22,13 @@ __all__ = [
     "SingleCanvas",
     "link_axes",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # JointGrid imports the tabular layers, which are not needed for simple plots.
+    if name == "JointGrid":
+        from whitecanvas.canvas._joint import JointGrid
+
+        globals()[name] = JointGrid
+        return JointGrid
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
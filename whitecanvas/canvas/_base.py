@@ -23,7 +23,6 @@ from whitecanvas import layers as _l
 from whitecanvas import protocols, theme
 from whitecanvas.backend import Backend, patch_dummy_backend
 from whitecanvas.canvas import _namespaces as _ns
-from whitecanvas.canvas import dataframe as _df
 from whitecanvas.canvas import layerlist as _ll
 from whitecanvas.canvas._between import BetweenPlotter
 from whitecanvas.canvas._dims import Dims
@@ -58,6 +57,8 @@ from whitecanvas.utils.type_check import is_real_number
 if TYPE_CHECKING:
     from typing_extensions import Concatenate, ParamSpec, Self
 
+    from whitecanvas.canvas import dataframe as _df
+
     _P = ParamSpec("_P")
     _DF = TypeVar("_DF")
 
@@ -557,6 +558,8 @@ class CanvasBase(CanvasNDBase):
         CatPlotter
             Plotter object.
         """
+        from whitecanvas.canvas import dataframe as _df
+
         plotter = _df.CatPlotter(self, data, x, y, update_labels=update_labels)
         return plotter
 
@@ -593,6 +596,8 @@ class CanvasBase(CanvasNDBase):
         XCatPlotter
             Plotter object.
         """
+        from whitecanvas.canvas import dataframe as _df
+
         return _df.XCatPlotter(self, data, x, y, update_labels, numeric=numeric_axis)
 
     def cat_y(
@@ -628,6 +633,8 @@ class CanvasBase(CanvasNDBase):
         YCatPlotter
             Plotter object
         """
+        from whitecanvas.canvas import dataframe as _df
+
         return _df.YCatPlotter(self, data, y, x, update_labels, numeric=numeric_axis)
 
     def cat_xy(
@@ -658,6 +665,8 @@ class CanvasBase(CanvasNDBase):
         XYCatPlotter
             Plotter object
         """
+        from whitecanvas.canvas import dataframe as _df
+
         return _df.XYCatPlotter(self, data, x, y, update_labels)
 
     def stack_over(self, layer: _L0) -> StackOverPlotter[Self, _L0]:
@@ -2067,6 +2076,14 @@ class CanvasBase(CanvasNDBase):
             # TODO: check if connecting LayerGroup is necessary
             fn(l._backend, _canvas)
             layer._connect_canvas(self)
+        self._set_animated(layer)
+
+    def _set_animated(self, layer: _l.Layer):
+        """Mark the layer as frequently updated, if the backend supports it."""
+        _canvas = self._canvas()
+        if hasattr(_canvas, "_plt_set_animated"):
+            for l in _iter_layers(layer):
+                _canvas._plt_set_animated(l._backend)
 
     def _cb_layer_grouped(self, group: _l.LayerGroup):
         indices: list[int] = []  # layers to remove
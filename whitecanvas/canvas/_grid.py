@@ -121,7 +121,13 @@ class CanvasGrid(_Serializable):
         """The (row, col) shape of the grid"""
         return self._canvas_array.shape
 
-    def link_x(self, *, future: bool = True, hide_ticks: bool = True) -> Self:
+    def link_x(
+        self,
+        *,
+        future: bool = True,
+        hide_ticks: bool = True,
+        msec: int = 0,
+    ) -> Self:
         """
         Link all the x-axes of the canvases in the grid.
 
@@ -133,6 +139,11 @@ class CanvasGrid(_Serializable):
         future : bool, default True
             If Ture, all the canvases added in the future will also be linked. Only link
             the existing canvases if False.
+        hide_ticks : bool, default True
+            If True, hide the tick labels of the inner canvases.
+        msec : int, default 0
+            If positive, limit changes within this interval are merged and applied to
+            all the canvases at once, which is much faster for a large grid.
         """
         if self._x_linker_ref is not None:
             self._x_linker_ref.unlink_all()  # initialize linker
@@ -141,14 +152,20 @@ class CanvasGrid(_Serializable):
             to_link.append(_canvas.x)
             if hide_ticks and _r != self.shape[0] - 1:
                 _canvas.x.ticks.visible = False
-        self._x_linker_ref = link_axes(to_link)
+        self._x_linker_ref = link_axes(to_link, msec=msec)
         if future:
             self._x_linked = True
             if hide_ticks:
                 self._backend_object._plt_set_spacings(6, 6)
         return self
 
-    def link_y(self, *, future: bool = True, hide_ticks: bool = True) -> Self:
+    def link_y(
+        self,
+        *,
+        future: bool = True,
+        hide_ticks: bool = True,
+        msec: int = 0,
+    ) -> Self:
         """
         Link all the y-axes of the canvases in the grid.
 
@@ -160,6 +177,11 @@ class CanvasGrid(_Serializable):
         future : bool, default True
             If Ture, all the canvases added in the future will also be linked. Only link
             the existing canvases if False.
+        hide_ticks : bool, default True
+            If True, hide the tick labels of the inner canvases.
+        msec : int, default 0
+            If positive, limit changes within this interval are merged and applied to
+            all the canvases at once, which is much faster for a large grid.
         """
         if self._y_linker_ref is not None:
             self._y_linker_ref.unlink_all()
@@ -168,7 +190,7 @@ class CanvasGrid(_Serializable):
             to_link.append(_canvas.y)
             if hide_ticks and _c != 0:
                 _canvas.y.ticks.visible = False
-        self._y_linker_ref = link_axes(to_link)
+        self._y_linker_ref = link_axes(to_link, msec=msec)
         if future:
             self._y_linked = True
             if hide_ticks:
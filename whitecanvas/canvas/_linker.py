@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import warnings
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
 from weakref import WeakSet
 
+from whitecanvas.types import MouseEvent, MouseEventType
+from whitecanvas.utils.throttle import Throttled, call_later
+
 if TYPE_CHECKING:
     from whitecanvas.canvas._namespaces import AxisNamespace
 
@@ -11,14 +14,19 @@ if TYPE_CHECKING:
 class AxisLinker:
     _GLOBAL_LINKERS: ClassVar[set[AxisLinker]] = set()
 
-    def __new__(cls):
-        self = super().__new__(cls)
-        cls._GLOBAL_LINKERS.add(self)
-        return self
-
-    def __init__(self):
+    def __init__(self, msec: int = 0):
+        self.__class__._GLOBAL_LINKERS.add(self)
         self._axis_set = WeakSet["AxisNamespace"]()
         self._updating = False
+        self._pending_limits: tuple[float, float] | None = None
+        if msec > 0:
+            self._apply = Throttled(
+                self._apply_pending, msec=msec, call_later=self._call_later
+            )
+        else:
+            self._apply = self._apply_pending
+        # keep the bound method to disconnect it later
+        self._on_mouse_event = self._flush_on_mouse_event
 
     def link(self, axis: AxisNamespace):
         """Link an axis."""
@@ -28,6 +36,8 @@ class AxisLinker:
             return
         self._axis_set.add(axis)
         axis.events.lim.connect(self.set_limits, max_args=1)
+        if isinstance(self._apply, Throttled) and (canvas := axis._canvas_ref()):
+            canvas.mouse.moved.connect(self._on_mouse_event, msec=0)
 
     def unlink(self, axis: AxisNamespace):
         """Unlink an axis."""
@@ -35,6 +45,8 @@ class AxisLinker:
             warnings.warn(f"Axis {axis} was not linked", RuntimeWarning, stacklevel=2)
         self._axis_set.discard(axis)
         axis.events.lim.disconnect(self.set_limits)
+        if isinstance(self._apply, Throttled) and (canvas := axis._canvas_ref()):
+            canvas.mouse.moved.disconnect(self._on_mouse_event)
 
     def unlink_all(self) -> None:
         """Unlink all axes."""
@@ -50,17 +62,51 @@ class AxisLinker:
     def set_limits(self, limits: tuple[float, float]):
         if self._updating:
             return
+        self._pending_limits = limits
+        self._apply()
+
+    def flush(self) -> None:
+        """Apply the pending limits immediately if the linker is throttled."""
+        if isinstance(self._apply, Throttled):
+            self._apply.flush()
+
+    def _call_later(self, msec: int, callback: Callable[[], Any]) -> None:
+        # the trailing limits are applied in the event loop of a linked canvas
+        for axis in list(self._axis_set):
+            if canvas := axis._canvas_ref():
+                return call_later(canvas._canvas(), msec, callback)
+        return None
+
+    def _flush_on_mouse_event(self, ev: MouseEvent) -> None:
+        # apply the last limits of panning/zooming when the mouse is released
+        if ev.type is not MouseEventType.MOVE:
+            self.flush()
+
+    def _apply_pending(self) -> None:
+        limits = self._pending_limits
+        if limits is None:
+            return
+        self._pending_limits = None
+        low, high = limits
+        canvases = {}
         self._updating = True
         try:
-            for axis in self._axis_set:
-                axis.lim = limits
+            for axis in list(self._axis_set):
+                if tuple(axis.lim) == (low, high):
+                    continue  # such as the axis that emitted the change
+                axis._unsafe_set_lim(low, high)
+                if canvas := axis._canvas_ref():
+                    canvases[id(canvas)] = canvas
         finally:
             self._updating = False
+        # draw each canvas only once, after all the limits are updated
+        for canvas in canvases.values():
+            canvas._draw_canvas()
 
     @classmethod
-    def link_axes(cls, *axes: AxisNamespace):
+    def link_axes(cls, *axes: AxisNamespace, msec: int = 0):
         """Link multiple axes."""
-        self = cls()
+        self = cls(msec)
         if len(axes) == 1 and hasattr(axes[0], "__iter__"):
             axes = axes[0]
         for axis in axes:
@@ -91,8 +137,28 @@ class AxisLinkerRef:
         """Unlink all axes."""
         self._get_linker().unlink_all()
 
-
-def link_axes(*axes: AxisNamespace):
-    """Link multiple axes."""
-    linker = AxisLinker.link_axes(*axes)
+    def flush(self) -> None:
+        """Apply the pending limits immediately."""
+        self._get_linker().flush()
+
+
+def link_axes(*axes: AxisNamespace, msec: int = 0):
+    """
+    Link multiple axes.
+
+    >>> link_axes(canvas0.x, canvas1.x)
+    >>> link_axes([canvas.x for canvas in canvases], msec=16)  # throttled
+
+    Parameters
+    ----------
+    *axes : AxisNamespace
+        Axes to be linked.
+    msec : int, default 0
+        If positive, limit changes that come faster than this interval (such as
+        those during panning) are merged and applied to all the linked axes at once.
+        The last change is always applied, at most `msec` later in the event loop of
+        the canvas (or immediately on mouse release or by `flush()`). Limits are
+        propagated synchronously if 0.
+    """
+    linker = AxisLinker.link_axes(*axes, msec=msec)
     return AxisLinkerRef(linker)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Generic,
     Iterable,
     Sequence,
@@ -27,6 +28,7 @@ from whitecanvas.types import (
     Point,
 )
 from whitecanvas.utils.normalize import arr_color
+from whitecanvas.utils.throttle import call_later
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -432,6 +434,25 @@ class MouseNamespace(Namespace):
     def enabled(self, enabled: bool):
         self._get_canvas()._plt_set_mouse_enabled(enabled)
 
+    def _call_later(self, msec: int, callback: Callable[[], Any]) -> None:
+        call_later(self._get_canvas(), msec, callback)
+
+    @property
+    def move_interval(self) -> int:
+        """
+        Minimum interval of the mouse move callbacks in milliseconds.
+
+        If positive, mouse move events that come faster than this interval are merged
+        and only the latest one is passed to the callbacks (including the selection
+        tools). This is useful for high-frequency mice. Callbacks connected with an
+        explicit `msec` are not affected.
+        """
+        return self.moved.interval
+
+    @move_interval.setter
+    def move_interval(self, msec: int):
+        self.moved.interval = msec
+
     def emulate_click(
         self,
         position: tuple[float, float],
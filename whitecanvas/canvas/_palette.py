@@ -25,6 +25,7 @@ class ColorPalette:
                 pos = [0, 0.3, 0.6, 0.9, 0.2, 0.5, 0.8, 0.1, 0.4, 0.7, 1.0]
         self._cmap: Colormap = _cmap
         self._pos: list[float] = pos
+        self._colors: list[Color] | None = None  # colors at the positions
         self._n_generated = 0
 
     @property
@@ -33,10 +34,12 @@ class ColorPalette:
 
     def next(self, update: bool = True) -> Color:
         """Generate the next color."""
-        pos = self._pos[self._n_generated % self.ncolors]
+        if self._colors is None:
+            self._colors = [self._cmap(pos) for pos in self._pos]
+        color = self._colors[self._n_generated % self.ncolors]
         if update:
             self._n_generated += 1
-        return self._cmap(pos)
+        return color
 
     def init(self):
         """Initialize the palette."""
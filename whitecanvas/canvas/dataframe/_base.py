@@ -100,6 +100,13 @@ class CatIterator(Generic[_DF]):
             "sort_func": self._sort_func,
         }
 
+    def with_df(self, df: DataFrameWrapper[_DF]) -> CatIterator[_DF]:
+        """Return a new iterator of another data frame with the same category map."""
+        sort_func = None if self._numeric else self._sort_func
+        new = CatIterator(df, self._offsets, self._numeric, sort_func)
+        new._cat_map_cache = self._cat_map_cache.copy()
+        return new
+
     def category_map(self, columns: tuple[str, ...]) -> dict[tuple, int]:
         """Calculate how to map category columns to integers."""
         columns = tuple(columns)
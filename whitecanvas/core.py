@@ -10,7 +10,6 @@ from whitecanvas.canvas import (
     CanvasGrid,
     CanvasHGrid,
     CanvasVGrid,
-    JointGrid,
     SingleCanvas,
 )
 from whitecanvas.types import ColormapType
@@ -21,6 +20,7 @@ if TYPE_CHECKING:
     import pandas as pd
     import polars as pl
 
+    from whitecanvas.canvas._joint import JointGrid
     from whitecanvas.canvas.canvas3d._base import SingleCanvas3D
 
     _0_or_1 = Literal[0, 1]
@@ -174,6 +174,8 @@ def new_jointgrid(
     JointGrid
         Joint grid object.
     """
+    from whitecanvas.canvas._joint import JointGrid
+
     joint = JointGrid(loc, palette=palette, backend=backend)
     if size is not None:
         joint.size = size
@@ -247,6 +249,8 @@ def read_jointgrid(path: str | Path) -> JointGrid:
     JointGrid
         Joint grid object.
     """
+    from whitecanvas.canvas._joint import JointGrid
+
     return JointGrid.read_json(path)
 
 
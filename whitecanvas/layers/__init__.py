@@ -16,6 +16,7 @@ from whitecanvas.layers._primitive import (
     Line,
     LineStep,
     Markers,
+    MultiBand,
     MultiLine,
     Rects,
     Rug,
@@ -39,6 +40,7 @@ __all__ = [
     "Spans",
     "Errorbars",
     "Band",
+    "MultiBand",
     "Rug",
     "InfLine",
     "InfCurve",
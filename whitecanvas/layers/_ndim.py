@@ -14,6 +14,7 @@ from whitecanvas.layers import _primitive
 from whitecanvas.layers._base import DataBoundLayer, LayerWrapper
 from whitecanvas.layers._deserialize import construct_layer
 from whitecanvas.types import XYData, XYTextData, XYYData
+from whitecanvas.utils.clim import stack_contrast_limits
 from whitecanvas.utils.normalize import decode_array, encode_array
 
 if TYPE_CHECKING:
@@ -173,6 +174,17 @@ class TextLayerStack(LayerStack[XYTextData]):
 
 
 class ImageLayerStack(LayerStack[NDArray[np.number]]):
+    def __init__(
+        self,
+        base_layer: _primitive.Image,
+        data: Slicable[NDArray[np.number]],
+        axis_names: list[str] | None = None,
+    ):
+        super().__init__(base_layer, data, axis_names)
+        # (percentiles, sample_size) of the per-slice autoscaling
+        self._autoscale_params: tuple[tuple[float, float], int | None] | None = None
+        self._clim_cache: dict[tuple[Any, ...], tuple[float, float]] = {}
+
     @classmethod
     def from_layer_class(
         cls,
@@ -191,6 +203,55 @@ class ImageLayerStack(LayerStack[NDArray[np.number]]):
         im = stack.slice_at(sl)
         return cls(constructor(im, *args, **kwargs), stack)
 
+    def autoscale(
+        self,
+        percentiles: tuple[float, float] = (0.0, 100.0),
+        *,
+        sample_size: int | None = None,
+        over_stack: bool = True,
+    ) -> Self:
+        """
+        Set the contrast limits to the percentiles of the image data.
+
+        Parameters
+        ----------
+        percentiles : (float, float), default (0, 100)
+            Percentiles of the lower and upper limits.
+        sample_size : int, optional
+            If given, the limits are calculated from a strided subsample of about this
+            size, which is much faster for large stacks.
+        over_stack : bool, default True
+            If True, the limits are calculated once over the whole stack and fixed.
+            Otherwise, the limits are updated for each slice when the slice changes.
+        """
+        percentiles = tuple(percentiles)
+        if over_stack:
+            self._autoscale_params = None
+            key = ("stack", percentiles, sample_size)
+            if (lims := self._clim_cache.get(key)) is None:
+                lims = stack_contrast_limits(
+                    _iter_arrays(self._data_stack), percentiles, sample_size
+                )
+                self._clim_cache[key] = lims
+            self.base.clim = lims
+        else:
+            self._autoscale_params = (percentiles, sample_size)
+            self.base.autoscale(percentiles, sample_size=sample_size)
+        return self
+
+    def _update_layer_data(self, index: dict[str, int]) -> None:
+        super()._update_layer_data(index)
+        if self._autoscale_params is None:
+            return None
+        sl = tuple(index[a] for a in self._axis_names)
+        key = (sl, *self._autoscale_params)
+        if (lims := self._clim_cache.get(key)) is None:
+            # limits of each slice are cached for scrubbing back and forth
+            lims = self.base._contrast_limits(*self._autoscale_params)
+            self._clim_cache[key] = lims
+        self.base.clim = lims
+        return None
+
 
 class SpansLayerStack(LayerStack[NDArray[np.number]]):
     @classmethod
@@ -207,6 +268,15 @@ class SpansLayerStack(LayerStack[NDArray[np.number]]):
         return cls(constructor(spans, *args, **kwargs), stack)
 
 
+def _iter_arrays(data: Slicable[NDArray[np.number]]) -> list[NDArray[np.number]]:
+    """List of the arrays in the stack."""
+    if isinstance(data, (ConstArray, GridArray)):
+        return [data._obj]
+    elif isinstance(data, NonuniformArray):
+        return list(data._obj.ravel())
+    raise TypeError(f"Cannot iterate over arrays of {data!r}.")
+
+
 def _norm_one(data, dim: int = 1, dtype=np.float32) -> Slicable[NDArray[np.number]]:
     try:
         arr = np.asarray(data, dtype=dtype)
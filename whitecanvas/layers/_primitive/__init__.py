@@ -1,4 +1,4 @@
-from whitecanvas.layers._primitive.band import Band
+from whitecanvas.layers._primitive.band import Band, MultiBand
 from whitecanvas.layers._primitive.bars import Bars
 from whitecanvas.layers._primitive.errorbars import Errorbars
 from whitecanvas.layers._primitive.image import Image
@@ -18,6 +18,7 @@ __all__ = [
     "Bars",
     "Markers",
     "Band",
+    "MultiBand",
     "Spans",
     "Errorbars",
     "Rug",
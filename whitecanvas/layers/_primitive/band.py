@@ -1,15 +1,23 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterable, TypeVar
 
+import numpy as np
+from numpy.typing import NDArray
 from psygnal import Signal
 
 from whitecanvas.backend import Backend
 from whitecanvas.layers import _legend
-from whitecanvas.layers._base import DataBoundLayer
-from whitecanvas.layers._mixin import FaceEdgeMixin, FaceEdgeMixinEvents
+from whitecanvas.layers._base import DataBoundLayer, HoverableDataBoundLayer
+from whitecanvas.layers._mixin import (
+    EdgeNamespace,
+    FaceEdgeMixin,
+    FaceEdgeMixinEvents,
+    FaceNamespace,
+    MultiFaceEdgeMixin,
+)
 from whitecanvas.layers._sizehint import xyy_size_hint
-from whitecanvas.protocols import BandProtocol
+from whitecanvas.protocols import BandProtocol, MultiBandProtocol
 from whitecanvas.types import (
     ArrayLike1D,
     ColorType,
@@ -19,7 +27,8 @@ from whitecanvas.types import (
     XYYData,
     _Void,
 )
-from whitecanvas.utils.normalize import as_array_1d
+from whitecanvas.utils.normalize import as_array_1d, parse_texts
+from whitecanvas.utils.template import HoverTexts
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -30,6 +39,8 @@ class BandEvents(FaceEdgeMixinEvents):
 
 
 _void = _Void()
+_Face = TypeVar("_Face", bound=FaceNamespace)
+_Edge = TypeVar("_Edge", bound=EdgeNamespace)
 
 
 class Band(DataBoundLayer[BandProtocol, XYYData], FaceEdgeMixin):
@@ -146,3 +157,169 @@ class Band(DataBoundLayer[BandProtocol, XYYData], FaceEdgeMixin):
         face = _legend.FaceInfo(self.face.color, self.face.hatch)
         edge = _legend.EdgeInfo(self.edge.color, self.edge.width, self.edge.style)
         return _legend.BarLegendItem(face, edge)
+
+
+class MultiBandEvents(FaceEdgeMixinEvents):
+    clicked = Signal(int)
+
+
+class MultiBand(
+    HoverableDataBoundLayer[MultiBandProtocol, "list[XYYData]"],
+    MultiFaceEdgeMixin[_Face, _Edge],
+):
+    """
+    Layer that represents multiple bands drawn as a single artist.
+
+    Attributes
+    ----------
+    face : `whitecanvas.layers._mixin.FaceNamespace`
+        Face properties of the bands.
+    edge : `whitecanvas.layers._mixin.EdgeNamespace`
+        Edge properties of the bands.
+    """
+
+    events: MultiBandEvents
+    _events_class = MultiBandEvents
+
+    def __init__(
+        self,
+        data: Iterable[tuple[ArrayLike1D, ArrayLike1D, ArrayLike1D]],
+        orient: OrientationLike = "vertical",
+        *,
+        name: str | None = None,
+        color: ColorType = "blue",
+        alpha: float | _Void = _void,
+        hatch: str | Hatch = Hatch.SOLID,
+        backend: Backend | str | None = None,
+    ):
+        ori = Orientation.parse(orient)
+        xyys = _norm_xyy_list(data)
+        MultiFaceEdgeMixin.__init__(self)
+        super().__init__(name=name if name is not None else "MultiBand")
+        self._orient = ori
+        polygons = [_xyy_to_polygon(xyy, ori) for xyy in xyys]
+        self._backend = self._create_backend(Backend(backend), polygons)
+        self._x_hint, self._y_hint = _multi_xyy_size_hint(xyys, ori)
+        self.face.update(color=color, alpha=alpha, hatch=hatch)
+        self.edge.width = 0.0
+        self._init_events()
+        self._backend._plt_connect_pick_event(self.events.clicked.emit)
+
+    @property
+    def orient(self) -> Orientation:
+        """Orientation of the bands."""
+        return self._orient
+
+    @property
+    def nbands(self) -> int:
+        """Number of bands."""
+        return len(self._backend._plt_get_data())
+
+    ndata = nbands
+
+    def _get_layer_data(self) -> list[XYYData]:
+        """Current data of the layer."""
+        return [
+            _polygon_to_xyy(verts, self._orient)
+            for verts in self._backend._plt_get_data()
+        ]
+
+    def _norm_layer_data(self, data: Any) -> list[XYYData]:
+        return _norm_xyy_list(data)
+
+    def _set_layer_data(self, data: list[XYYData]):
+        polygons = [_xyy_to_polygon(xyy, self._orient) for xyy in data]
+        self._backend._plt_set_data(polygons)
+        self._x_hint, self._y_hint = _multi_xyy_size_hint(data, self._orient)
+
+    def with_hover_template(self, template: str, extra: Any | None = None) -> Self:
+        """Add hover template to the bands."""
+        if self._backend_name in ("plotly", "bokeh"):  # conversion for HTML
+            template = template.replace("\n", "<br>")
+        params = parse_texts(template, self.nbands, extra)
+        # set default format keys
+        if "i" not in params:
+            params["i"] = np.arange(self.nbands)
+        texts = HoverTexts(template, params, self.nbands)
+        return self.with_hover_text(texts)
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any], backend: Backend | str | None = None) -> Self:
+        """Create a MultiBand from a dictionary."""
+        self = cls(
+            [XYYData.from_dict(each) for each in d["data"]], orient=d["orient"],
+            name=d["name"], backend=backend,
+        )  # fmt: skip
+        return self._update_face_edge_from_dict(d)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the layer."""
+        return {
+            "type": f"{self.__module__}.{self.__class__.__name__}",
+            "data": [xyy.to_dict() for xyy in self._get_layer_data()],
+            "orient": self._orient.value,
+            "name": self.name,
+            "visible": self.visible,
+            "face": self.face.to_dict(),
+            "edge": self.edge.to_dict(),
+        }
+
+    def _update_face_edge_from_dict(self, d: dict[str, Any]) -> Self:
+        face, edge = d["face"], d["edge"]
+        if np.ndim(face["color"]) > 1:
+            self.with_face_multi(color=face["color"], hatch=face["hatch"])
+        else:
+            self.with_face(color=face["color"], hatch=face["hatch"])
+        if np.ndim(edge["color"]) > 1:
+            self.with_edge_multi(
+                color=edge["color"], width=edge["width"], style=edge["style"]
+            )
+        else:
+            self.with_edge(
+                color=edge["color"], width=edge["width"], style=edge["style"]
+            )
+        return self
+
+    def _as_legend_item(self) -> _legend.BarLegendItem:
+        return _legend.BarLegendItem(
+            self.face._as_legend_info(), self.edge._as_legend_info()
+        )
+
+
+def _norm_xyy_list(data: Iterable[Any]) -> list[XYYData]:
+    out: list[XYYData] = []
+    for each in data:
+        t, y0, y1 = (as_array_1d(a) for a in each)
+        if t.size != y0.size or t.size != y1.size:
+            raise ValueError(
+                "Expected xdata, ydata0, ydata1 to have the same size, "
+                f"got {t.size}, {y0.size}, {y1.size}"
+            )
+        out.append(XYYData(t, y0, y1))
+    return out
+
+
+def _xyy_to_polygon(xyy: XYYData, orient: Orientation) -> NDArray[np.number]:
+    """Convert a band into the (2N, 2) vertices of its outline."""
+    t, y0, y1 = xyy
+    verts = np.concatenate(
+        [np.stack([t, y0], axis=1), np.stack([t[::-1], y1[::-1]], axis=1)], axis=0
+    )
+    if not orient.is_vertical:
+        verts = verts[:, ::-1]
+    return verts
+
+
+def _polygon_to_xyy(verts: NDArray[np.number], orient: Orientation) -> XYYData:
+    """Inverse of `_xyy_to_polygon`."""
+    if not orient.is_vertical:
+        verts = verts[:, ::-1]
+    n = verts.shape[0] // 2
+    return XYYData(verts[:n, 0], verts[:n, 1], verts[n:, 1][::-1])
+
+
+def _multi_xyy_size_hint(xyys: list[XYYData], orient: Orientation):
+    if len(xyys) == 0:
+        return None, None
+    x, y0, y1 = (np.concatenate(arrs) for arrs in zip(*xyys))
+    return xyy_size_hint(x, y0, y1, orient)
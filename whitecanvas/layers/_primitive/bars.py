@@ -34,6 +34,7 @@ from whitecanvas.types import (
     _Void,
 )
 from whitecanvas.utils.normalize import as_array_1d, parse_texts
+from whitecanvas.utils.template import HoverTexts
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -460,10 +461,7 @@ class Bars(
         params.setdefault("y", ys)
         if "i" not in params:
             params["i"] = np.arange(xs.size)
-        texts = [
-            template.format(**{k: v[i] for k, v in params.items()})
-            for i in range(xs.size)
-        ]
+        texts = HoverTexts(template, params, xs.size)
         self._backend._plt_set_hover_text(texts)
         return self
 
@@ -323,13 +323,12 @@ def _yxx_to_segments(
     return _to_segments(starts, ends, capsize)
 
 
-def _to_segments(starts, ends, capsize: float):
+def _to_segments(starts, ends, capsize: float) -> NDArray[np.number]:
+    """Return a packed (N, 2, 2) array of the bars followed by the caps."""
     segments = np.stack([starts, ends], axis=1)
     if capsize > 0:
         _c = np.array([capsize / 2, 0])
         cap0 = np.stack([starts - _c, starts + _c], axis=1)
         cap1 = np.stack([ends - _c, ends + _c], axis=1)
-    else:
-        cap0 = []
-        cap1 = []
-    return list(segments) + list(cap0) + list(cap1)
+        segments = np.concatenate([segments, cap0, cap1], axis=0)
+    return segments
@@ -23,6 +23,8 @@ from whitecanvas.types import (
     Rect,
     _Void,
 )
+from whitecanvas.utils.clim import contrast_limits
+from whitecanvas.utils.lut import map_colors
 from whitecanvas.utils.normalize import as_array_1d, decode_array, encode_array
 from whitecanvas.utils.type_check import is_real_number
 
@@ -85,6 +87,8 @@ class Image(DataBoundLayer[ImageProtocol, NDArray[np.number]]):
         if img.ndim == 3:
             cmap = clim = _void
         self._x_hint = self._y_hint = None
+        # (percentiles, sample_size) -> contrast limits of the current data
+        self._clim_cache: dict[tuple[Any, ...], tuple[float, float]] = {}
         self.update(cmap=cmap, clim=clim, shift=shift, scale=scale)
 
     def _get_layer_data(self) -> NDArray[np.number]:
@@ -97,6 +101,7 @@ class Image(DataBoundLayer[ImageProtocol, NDArray[np.number]]):
     def _set_layer_data(self, data: NDArray[np.number]):
         """Set the data of the layer."""
         self._backend._plt_set_data(data)
+        self._clim_cache.clear()
 
     @property
     def cmap(self) -> Colormap:
@@ -120,13 +125,51 @@ class Image(DataBoundLayer[ImageProtocol, NDArray[np.number]]):
             low, high = None, None
         else:
             low, high = clim
-        if low is None:
-            low = self.data.min()
-        if high is None:
-            high = self.data.max()
+        if low is None or high is None:
+            data_min, data_max = self._contrast_limits()
+            if low is None:
+                low = data_min
+            if high is None:
+                high = data_max
         self._backend._plt_set_clim((low, high))
         self.events.clim.emit((low, high))
 
+    def autoscale(
+        self,
+        percentiles: tuple[float, float] = (0.0, 100.0),
+        *,
+        sample_size: int | None = None,
+    ) -> Self:
+        """
+        Set the contrast limits to the percentiles of the image data.
+
+        >>> image.autoscale()  # min and max
+        >>> image.autoscale((0.1, 99.9), sample_size=100000)  # robust and fast
+
+        Parameters
+        ----------
+        percentiles : (float, float), default (0, 100)
+            Percentiles of the lower and upper limits.
+        sample_size : int, optional
+            If given, the limits are calculated from a strided subsample of about this
+            size, which is much faster for large images.
+        """
+        if self.is_rgba:
+            raise ValueError("Cannot set contrast limits for an RGBA image.")
+        self.clim = self._contrast_limits(percentiles, sample_size)
+        return self
+
+    def _contrast_limits(
+        self,
+        percentiles: tuple[float, float] = (0.0, 100.0),
+        sample_size: int | None = None,
+    ) -> tuple[float, float]:
+        key = (tuple(percentiles), sample_size)
+        if (lims := self._clim_cache.get(key)) is None:
+            lims = contrast_limits(self.data, percentiles, sample_size)
+            self._clim_cache[key] = lims
+        return lims
+
     @property
     def shape(self) -> tuple[int, int]:
         """The visual shape of the image (shape without the color axis)."""
@@ -140,10 +183,8 @@ class Image(DataBoundLayer[ImageProtocol, NDArray[np.number]]):
         """The colored image data (N, M, 4) mapped by the colormap."""
         if self.is_rgba:
             return self.data
-        # normalize data to [0, 1]
-        cmin, cmax = self.clim
-        data_norm = (self.data - cmin) / (cmax - cmin)
-        return self.cmap(data_norm)
+        # the LUT of the colormap is cached and reused for any contrast limits
+        return map_colors(self.cmap, self.data, self.clim)
 
     @property
     def shift(self) -> tuple[float, float]:
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import inspect
 import math
-from typing import TYPE_CHECKING, Any, Callable, Generic
+from typing import TYPE_CHECKING, Any, Callable, Generic, NamedTuple
 
 import numpy as np
 from typing_extensions import Concatenate, ParamSpec
@@ -58,6 +58,9 @@ class InfCurve(LineMixin[LineProtocol], Generic[_P]):
         self._args = ()
         self._kwargs = {}
         self._linspace_num = 256
+        self._hover_text: str | None = None
+        self._sampling: _AdaptiveSampling | None = None
+        self._sample_cache = _SampleCache()
 
     def update_params(self, *args: _P.args, **kwargs: _P.kwargs) -> Self:
         """Set the parameters of the model function."""
@@ -65,6 +68,7 @@ class InfCurve(LineMixin[LineProtocol], Generic[_P]):
         ydata = self._model(xdata, *args, **kwargs)
         self._backend._plt_set_data(xdata, ydata)
         self._args, self._kwargs = args, kwargs
+        self._sample_cache.clear()
         if not self._params_ready:
             self._params_ready = True
             if canvas := self._canvas_ref():
@@ -84,6 +88,49 @@ class InfCurve(LineMixin[LineProtocol], Generic[_P]):
     def calculate(self, xdata: np.ndarray) -> np.ndarray:
         return self._model(xdata, *self._args, **self._kwargs)
 
+    def set_adaptive_sampling(
+        self,
+        tolerance: float | None = 1e-3,
+        *,
+        max_points: int = 2048,
+    ) -> Self:
+        """
+        Enable or disable adaptive sampling of the curve.
+
+        By default, the model is evaluated at 256 evenly spaced points every time the
+        x-limits change. In the adaptive mode, the curve is first evaluated on a
+        coarse grid, and the intervals where the linear interpolation deviates from
+        the curve are bisected until the error is below the tolerance. The grid is
+        aligned to powers of two so that the samples evaluated before are reused when
+        the view is panned or slightly zoomed.
+
+        >>> canvas.add_infcurve(lambda x: np.sin(1 / x)).set_adaptive_sampling(1e-3)
+
+        Parameters
+        ----------
+        tolerance : float or None, default 1e-3
+            Maximum error of the linear interpolation relative to the height of the
+            y-limits. Note that 1e-3 is about a pixel for a 1000-pixel-high canvas.
+            Set None to disable adaptive sampling.
+        max_points : int, default 2048
+            Maximum number of the evaluated points for each view.
+        """
+        if tolerance is None:
+            self._sampling = None
+        else:
+            if tolerance <= 0:
+                raise ValueError(f"tolerance must be positive, got {tolerance!r}.")
+            if max_points < _ADAPTIVE_INITIAL_NUM:
+                raise ValueError(
+                    f"max_points must be at least {_ADAPTIVE_INITIAL_NUM}, got "
+                    f"{max_points!r}."
+                )
+            self._sampling = _AdaptiveSampling(tolerance, max_points)
+        self._sample_cache.clear()
+        if canvas := self._canvas_ref():
+            self._recalculate_line(canvas.x.lim)
+        return self
+
     @classmethod
     def from_dict(cls, d: dict[str, Any], backend: Backend | str | None = None) -> Self:
         """Create a Line from a dictionary."""
@@ -112,7 +159,9 @@ class InfCurve(LineMixin[LineProtocol], Generic[_P]):
     def with_hover_text(self, text: str) -> Self:
         if not isinstance(text, str):
             raise TypeError(f"Hover text must be str, got {type(text)}.")
-        self._backend._plt_set_hover_text([text] * self._linspace_num)
+        self._hover_text = text
+        xdata, _ = self._backend._plt_get_data()
+        self._backend._plt_set_hover_text([text] * xdata.size)
         return self
 
     def _connect_canvas(self, canvas: Canvas):
@@ -131,13 +180,106 @@ class InfCurve(LineMixin[LineProtocol], Generic[_P]):
         x1 = min(x1, b1)
         if x0 >= x1:
             xdata, ydata = np.array([]), np.array([])
-        else:
+        elif not self._params_ready:
+            return
+        elif self._sampling is None:
             xdata = np.linspace(x0, x1, self._linspace_num)
-            if self._params_ready:
-                ydata = self._model(xdata, *self._args, **self._kwargs)
-            else:
-                return
+            ydata = self._model(xdata, *self._args, **self._kwargs)
+        else:
+            xdata, ydata = self._sample_adaptive(x0, x1)
         self._backend._plt_set_data(xdata, ydata)
+        if self._hover_text is not None:
+            self._backend._plt_set_hover_text([self._hover_text] * xdata.size)
+
+    def _sample_adaptive(self, x0: float, x1: float) -> tuple[np.ndarray, np.ndarray]:
+        sampling = self._sampling
+        cache = self._sample_cache
+
+        def _evaluate(x: np.ndarray) -> np.ndarray:
+            return cache.evaluate(self.calculate, x)
+
+        # dyadic grid aligned to the origin, so that panning gives the same x values
+        step = 2.0 ** math.floor(math.log2((x1 - x0) / _ADAPTIVE_INITIAL_NUM))
+        grid = np.arange(math.ceil(x0 / step), math.floor(x1 / step) + 1) * step
+        xdata = np.unique(np.concatenate([[x0], grid, [x1]]))
+        ydata = _evaluate(xdata)
+        if canvas := self._canvas_ref():
+            y0, y1 = canvas.y.lim
+            yspan = y1 - y0
+        else:
+            finite = ydata[np.isfinite(ydata)]
+            yspan = finite.max() - finite.min() if finite.size > 0 else 0.0
+        if not (np.isfinite(yspan) and yspan > 0):
+            yspan = 1.0
+        min_width = (x1 - x0) / sampling.max_points
+        errors = np.full(xdata.size - 1, np.inf)
+        while xdata.size < sampling.max_points:
+            refine = (errors > sampling.tolerance) & (np.diff(xdata) > min_width)
+            if not refine.any():
+                break
+            indices = np.flatnonzero(refine)
+            budget = sampling.max_points - xdata.size
+            if indices.size > budget:  # refine the worst intervals first
+                worst = np.argsort(-errors[indices], kind="stable")[:budget]
+                indices = np.sort(indices[worst])
+            xmid = (xdata[indices] + xdata[indices + 1]) / 2
+            ymid = _evaluate(xmid)
+            err = np.abs(ymid - (ydata[indices] + ydata[indices + 1]) / 2) / yspan
+            err[np.isnan(err)] = 0.0
+            new_errors = np.zeros(errors.size)
+            new_errors[indices] = err
+            # both halves of a bisected interval inherit the error of the parent
+            errors = np.insert(new_errors, indices + 1, err)
+            xdata = np.insert(xdata, indices + 1, xmid)
+            ydata = np.insert(ydata, indices + 1, ymid)
+        return xdata, ydata
+
+
+_ADAPTIVE_INITIAL_NUM = 64
+
+
+class _AdaptiveSampling(NamedTuple):
+    tolerance: float
+    max_points: int
+
+
+class _SampleCache:
+    """Cache of the evaluated (x, y) samples of a model with the current parameters."""
+
+    def __init__(self, max_size: int = 16384):
+        self._max_size = max_size
+        self.clear()
+
+    def clear(self) -> None:
+        self._x = np.zeros(0, dtype=np.float64)
+        self._y = np.zeros(0, dtype=np.float64)
+
+    def evaluate(
+        self,
+        func: Callable[[np.ndarray], np.ndarray],
+        x: np.ndarray,
+    ) -> np.ndarray:
+        """Evaluate `func` at sorted `x`, calling it only for the new values."""
+        y = np.empty(x.size, dtype=np.float64)
+        if self._x.size > 0:
+            idx = np.minimum(np.searchsorted(self._x, x), self._x.size - 1)
+            hit = self._x[idx] == x
+            y[hit] = self._y[idx[hit]]
+            miss = ~hit
+        else:
+            miss = np.ones(x.size, dtype=np.bool_)
+        if not miss.any():
+            return y
+        xmiss = x[miss]
+        y[miss] = np.broadcast_to(func(xmiss), xmiss.shape)
+        if self._x.size + xmiss.size > self._max_size:
+            self._x, self._y = x.copy(), y.copy()
+        else:
+            xall = np.concatenate([self._x, xmiss])
+            order = np.argsort(xall, kind="stable")
+            self._x = xall[order]
+            self._y = np.concatenate([self._y, y[miss]])[order]
+        return y
 
 
 def _try_init_ydata(
@@ -26,6 +26,7 @@ from whitecanvas.types import (
     LineStyle,
     Orientation,
     OrientationLike,
+    PackedLines,
     StepStyle,
     Symbol,
     XYData,
@@ -38,6 +39,7 @@ from whitecanvas.utils.normalize import (
     normalize_xy,
     parse_texts,
 )
+from whitecanvas.utils.template import HoverTexts
 from whitecanvas.utils.type_check import is_real_number
 
 if TYPE_CHECKING:
@@ -649,10 +651,7 @@ class Line(_SingleLine):
         params.setdefault("y", ys)
         if "i" not in params:
             params["i"] = np.arange(xs.size)
-        texts = [
-            template.format(**{k: v[i] for k, v in params.items()})
-            for i in range(xs.size)
-        ]
+        texts = HoverTexts(template, params, xs.size)
         self._backend._plt_set_hover_text(texts)
         return self
 
@@ -828,7 +827,7 @@ class MultiLineEvents(LayerEvents):
     clicked = Signal(int)
 
 
-class MultiLine(HoverableDataBoundLayer[MultiLineProtocol, "list[NDArray[np.number]]"]):
+class MultiLine(HoverableDataBoundLayer[MultiLineProtocol, PackedLines]):
     events: MultiLineEvents
     _events_class = MultiLineEvents
 
@@ -853,13 +852,31 @@ class MultiLine(HoverableDataBoundLayer[MultiLineProtocol, "list[NDArray[np.numb
         )
         self._backend._plt_connect_pick_event(self.events.clicked.emit)
 
-    def _get_layer_data(self) -> list[NDArray[np.number]]:
+    @property
+    def data(self) -> PackedLines:
+        """
+        Data for this layer.
+
+        Lines are returned as a `PackedLines`, a sequence of (N, 2) arrays that are
+        views of one coordinate buffer, instead of a list of arrays. The views are
+        read-only; use `list(layer.data)` to get a list, and set `layer.data` to
+        update the lines.
+        """
+        return self._get_layer_data()
+
+    @data.setter
+    def data(self, data):
+        """Set the data for this layer."""
+        data_normed = self._norm_layer_data(data)
+        self._set_layer_data(data_normed)
+        self.events.data.emit(data_normed)
+
+    def _get_layer_data(self) -> PackedLines:
         """Current data of the layer."""
         return self._backend._plt_get_data()
 
-    def _set_layer_data(self, data: list[NDArray[np.number]]):
+    def _set_layer_data(self, data: list[ArrayLike] | PackedLines):
         data_norm, x_hint, y_hint = _norm_data(data)
-        self._backend._plt_set_data(data)
         self._backend._plt_set_data(data_norm)
         self._x_hint, self._y_hint = x_hint, y_hint
 
@@ -971,10 +988,7 @@ class MultiLine(HoverableDataBoundLayer[MultiLineProtocol, "list[NDArray[np.numb
         # set default format keys
         if "i" not in params:
             params["i"] = np.arange(self.nlines)
-        texts = [
-            template.format(**{k: v[i] for k, v in params.items()})
-            for i in range(self.nlines)
-        ]
+        texts = HoverTexts(template, params, self.nlines)
         self._backend._plt_set_hover_text(texts)
         return self
 
@@ -990,7 +1004,7 @@ class MultiLine(HoverableDataBoundLayer[MultiLineProtocol, "list[NDArray[np.numb
         """Return a dictionary representation of the layer."""
         return {
             "type": f"{self.__module__}.{self.__class__.__name__}",
-            "data": self._get_layer_data(),
+            "data": list(self._get_layer_data()),
             "name": self.name,
             "visible": self.visible,
             "color": self.color,
@@ -1005,23 +1019,28 @@ class MultiLine(HoverableDataBoundLayer[MultiLineProtocol, "list[NDArray[np.numb
         return _legend.LineLegendItem(self.color[0], self.width[0], self.style[0])
 
 
-def _norm_data(data: list[NDArray[np.number]]) -> NDArray[np.number]:
-    data_normed: list[NDArray[np.number]] = []
-    xmins, xmaxs, ymins, ymaxs = [], [], [], []
-    for each in data:
-        arr = np.asarray(each)
-        if arr.dtype.kind not in "uif":
-            raise ValueError(f"Expected data to be numeric, got {arr.dtype}")
-        if arr.ndim != 2 or arr.shape[1] != 2:
-            raise ValueError(f"Expected data to be (N, 2), got {arr.shape}")
-        data_normed.append(arr)
-        xmins.append(arr[:, 0].min())
-        xmaxs.append(arr[:, 0].max())
-        ymins.append(arr[:, 1].min())
-        ymaxs.append(arr[:, 1].max())
-    if len(data) > 0:
-        xhint = min(xmins), max(xmaxs)
-        yhint = min(ymins), max(ymaxs)
+def _norm_data(
+    data: list[ArrayLike] | NDArray[np.number] | PackedLines,
+) -> tuple[PackedLines, tuple[float, float] | None, tuple[float, float] | None]:
+    if isinstance(data, PackedLines):
+        packed = data
+    elif isinstance(data, np.ndarray) and data.ndim == 3:
+        # packed (N, P, 2) array of N lines with P points each
+        if data.shape[2] != 2:
+            raise ValueError(f"Expected data to be (N, P, 2), got {data.shape}")
+        packed = PackedLines.from_array(data)
     else:
-        xhint = yhint = None
-    return data_normed, xhint, yhint
+        lines = [np.asarray(each) for each in data]
+        for arr in lines:
+            if arr.ndim != 2 or arr.shape[1] != 2:
+                raise ValueError(f"Expected data to be (N, 2), got {arr.shape}")
+        packed = PackedLines.from_lines(lines)
+    coords = packed.coords
+    if coords.dtype.kind not in "uif":
+        raise ValueError(f"Expected data to be numeric, got {coords.dtype}")
+    if coords.shape[1] != 2:
+        raise ValueError(f"Expected data to be (N, 2), got {coords.shape}")
+    if coords.shape[0] == 0:
+        return packed, None, None
+    xs, ys = coords[:, 0], coords[:, 1]
+    return packed, (xs.min(), xs.max()), (ys.min(), ys.max())
@@ -29,11 +29,15 @@ from whitecanvas.types import (
     LineStyle,
     Orientation,
     OrientationLike,
+    Rect,
     Symbol,
     XYData,
     _Void,
 )
+from whitecanvas.utils.lut import map_colors
 from whitecanvas.utils.normalize import as_array_1d, normalize_xy, parse_texts
+from whitecanvas.utils.spatial import GridIndex
+from whitecanvas.utils.template import HoverTexts
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -84,6 +88,7 @@ class Markers(
         super().__init__(name=name)
         self._backend = self._create_backend(Backend(backend), xdata, ydata)
         self._size_is_array = False
+        self._spatial_index: GridIndex | None = None
         self.update(symbol=symbol, size=size, color=color, hatch=hatch, alpha=alpha)
         self.edge.color = color
         if not self.symbol.has_face():
@@ -124,6 +129,7 @@ class Markers(
     def _set_layer_data(self, data: XYData):
         x0, y0 = data
         self._backend._plt_set_data(x0, y0)
+        self._spatial_index = None  # rebuilt lazily on the next query
         if self._size_is_array:
             pad_r = self.size.mean() / 400
         else:
@@ -141,6 +147,54 @@ class Markers(
             ydata = self.data.y
         self.data = XYData(xdata, ydata)
 
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        k: int = 1,
+        max_dist: float = np.inf,
+    ) -> NDArray[np.intp]:
+        """
+        Return the indices of the data points nearest to (x, y).
+
+        The query uses a spatial index built lazily from the data. Only markers have
+        this index; the other data-bound layers rely on the hit testing of each
+        backend for hover and picking.
+
+        >>> markers.nearest(1.0, 2.0, k=3, max_dist=0.5)
+
+        Parameters
+        ----------
+        x, y : float
+            Coordinates of the query point in the data space.
+        k : int, default 1
+            Maximum number of points to return.
+        max_dist : float, optional
+            Points farther than this distance (in the data space) are not returned.
+
+        Returns
+        -------
+        np.ndarray
+            Indices of at most `k` points, sorted by the distance.
+        """
+        return self._get_spatial_index().nearest(x, y, k=k, max_dist=max_dist)[0]
+
+    def query_rect(
+        self, rect: Rect | tuple[float, float, float, float]
+    ) -> NDArray[np.intp]:
+        """
+        Return the indices of the data points inside the rectangle.
+
+        >>> markers.query_rect((left, right, bottom, top))
+        """
+        left, right, bottom, top = Rect.with_sort(*rect)
+        return self._get_spatial_index().query_rect(left, right, bottom, top)
+
+    def _get_spatial_index(self) -> GridIndex:
+        if self._spatial_index is None:
+            self._spatial_index = GridIndex(*self.data)
+        return self._spatial_index
+
     @classmethod
     def from_dict(cls, d: dict[str, Any], backend: Backend | str | None = None) -> Self:
         """Create a Band from a dictionary."""
@@ -250,7 +304,7 @@ class Markers(
         xy = np.vstack([xydata.x, xydata.y])
         density = gaussian_kde(xy)(xy)
         normed = density / density.max()
-        self.with_face_multi(color=Colormap(cmap)(normed))
+        self.with_face_multi(color=map_colors(Colormap(cmap), normed))
         if width is not None:
             self.width = width
         return self
@@ -301,10 +355,7 @@ class Markers(
         params.setdefault("y", ys)
         if "i" not in params:
             params["i"] = np.arange(xs.size)
-        texts = [
-            template.format(**{k: v[i] for k, v in params.items()})
-            for i in range(xs.size)
-        ]
+        texts = HoverTexts(template, params, xs.size)
         self._backend._plt_set_hover_text(texts)
         return self
 
@@ -515,19 +566,16 @@ class Markers(
             width = self.edge.width
         if style is _void:
             style = self.edge.style
-        segs = []
         nodes = self.data.stack()
-        for i0, i1 in edges:
-            segs.append(np.stack([nodes[i0], nodes[i1]], axis=0))
         edges_layer = MultiLine(
-            segs, name="edges", color=color, width=width, style=style,
+            nodes[edges], name="edges", color=color, width=width, style=style,
             antialias=antialias, backend=self._backend_name
         )  # fmt: skip
         texts = Texts(
             nodes[:, 0], nodes[:, 1], [""] * nodes.shape[0], name="texts",
             backend=self._backend_name,
         )  # fmt: skip
-        return Graph(self, edges_layer, texts, name=self.name)
+        return Graph(self, edges_layer, texts, name=self.name, connections=edges)
 
     def with_stem(
         self,
@@ -22,6 +22,7 @@ from whitecanvas.layers._mixin import (
 from whitecanvas.protocols import BarProtocol
 from whitecanvas.types import ColorType, Hatch, LineStyle, Rect, _Void
 from whitecanvas.utils.normalize import parse_texts
+from whitecanvas.utils.template import HoverTexts
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -202,10 +203,7 @@ class Rects(
         params.setdefault("top", coords[:, 3])
         if "i" not in params:
             params["i"] = np.arange(coords.shape[0])
-        texts = [
-            template.format(**{k: v[i] for k, v in params.items()})
-            for i in range(coords.shape[0])
-        ]
+        texts = HoverTexts(template, params, coords.shape[0])
         self._backend._plt_set_hover_text(texts)
         return self
 
@@ -24,6 +24,7 @@ from whitecanvas.types import (
     XYYData,
     _Void,
 )
+from whitecanvas.utils.lut import map_colors
 from whitecanvas.utils.normalize import as_array_1d
 from whitecanvas.utils.type_check import is_real_number
 
@@ -68,9 +69,8 @@ class Rug(MultiLine, HoverableDataBoundLayer[MultiLineProtocol, NDArray[np.numbe
         self._orient = Orientation.parse(orient)
 
     def _get_layer_data(self) -> NDArray[np.number]:
-        segs = super()._get_layer_data()
         idx = 0 if self.orient.is_vertical else 1
-        return np.array([seg[0, idx] for seg in segs])
+        return self._segments()[:, 0, idx]
 
     def _norm_layer_data(self, data: Any) -> NDArray[np.number]:
         return as_array_1d(data)
@@ -101,14 +101,17 @@ class Rug(MultiLine, HoverableDataBoundLayer[MultiLineProtocol, NDArray[np.numbe
         super()._set_layer_data(segs)
         self.events.data.emit(segs)
 
+    def _segments(self) -> NDArray[np.number]:
+        """The (N, 2, 2) view of the rug lines."""
+        return MultiLine._get_layer_data(self).coords.reshape(-1, 2, 2)
+
     @property
     def data_full(self) -> XYYData:
-        segs = MultiLine._get_layer_data(self)
-        seg_stack = np.stack(segs, axis=2)
+        segs = self._segments()
         idx = 1 if self.orient.is_vertical else 0
-        low = seg_stack[0, idx, :]
-        high = seg_stack[1, idx, :]
-        _t = seg_stack[0, 1 - idx, :]
+        low = segs[:, 0, idx]
+        high = segs[:, 1, idx]
+        _t = segs[:, 0, 1 - idx]
         return XYYData(x=_t, y0=low, y1=high)
 
     @data_full.setter
@@ -226,7 +229,7 @@ class Rug(MultiLine, HoverableDataBoundLayer[MultiLineProtocol, NDArray[np.numbe
         events = self.data
         density = gaussian_kde(events, band_width)(events)
         normed = density / density.max()
-        self.color = Colormap(cmap)(normed)
+        self.color = map_colors(Colormap(cmap), normed)
         return self
 
     def scale_by_density(
@@ -295,9 +298,7 @@ def _norm_input(
     if ori.is_vertical:
         start = np.stack([_t, y0], axis=1)
         stop = np.stack([_t, y1], axis=1)
-        segs = np.stack([start, stop], axis=0)
     else:
         start = np.stack([y0, _t], axis=1)
         stop = np.stack([y1, _t], axis=1)
-        segs = np.stack([start, stop], axis=0)
-    return events, np.moveaxis(segs, 1, 0), orient
+    return events, np.stack([start, stop], axis=1), orient
@@ -1,26 +1,48 @@
 from __future__ import annotations
 
-from typing import Any, Iterable, Literal
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Literal
 
 import numpy as np
-from numpy.typing import ArrayLike
+from numpy.typing import ArrayLike, NDArray
 
 from whitecanvas.backend import Backend
-from whitecanvas.layers._mixin import CollectionFaceEdgeMixin
-from whitecanvas.layers._primitive import Band
+from whitecanvas.layers._mixin import CollectionFaceEdgeMixin, MultiEdge, MultiFace
+from whitecanvas.layers._primitive import Band, MultiBand
 from whitecanvas.layers.group._cat_utils import check_array_input
 from whitecanvas.layers.group._collections import (
     LayerCollection,
     RichContainerEvents,
 )
-from whitecanvas.types import Orientation, XYYData
-from whitecanvas.utils.normalize import as_array_1d, parse_texts
+from whitecanvas.types import (
+    ColorType,
+    Hatch,
+    LineStyle,
+    Orientation,
+    OrientationLike,
+    XYYData,
+    _Void,
+)
+from whitecanvas.utils.normalize import arr_color, as_array_1d, parse_texts
+from whitecanvas.utils.template import HoverTexts
+from whitecanvas.utils.type_check import is_real_number
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+_void = _Void()
 
 
 class BandCollection(
     LayerCollection[Band],
     CollectionFaceEdgeMixin,
 ):
+    """
+    Collection of independent band layers.
+
+    Each band is a separate `Band` layer that can be added, removed or styled on its
+    own. Use `MultiBand` to draw many bands of fixed style as a single artist.
+    """
+
     events: RichContainerEvents
     _events_class = RichContainerEvents
 
@@ -87,26 +109,269 @@ class BandCollection(
         # set default format keys
         if "i" not in params:
             params["i"] = np.arange(len(self))
-        texts = [
-            template.format(**{k: v[i] for k, v in params.items()})
-            for i in range(len(self))
-        ]
+        texts = HoverTexts(template, params, len(self))
         return self.with_hover_text(texts)
 
 
-class ViolinPlot(BandCollection):
+class ViolinItem:
+    """
+    One violin of a violin plot.
+
+    Violins are not separate layers. This is a view of the violin at the given
+    index, so that iterating over a violin plot gives objects with the `data`,
+    `face`, `edge` and `visible` attributes, as the bands of a band collection.
+    Reading and writing them reads and writes the per-violin arrays of the
+    violin plot.
+    """
+
+    def __init__(self, layer: ViolinPlot, index: int):
+        self._layer = layer
+        self._index = index
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._layer.name!r}, index={self._index})"
+
+    @property
+    def data(self) -> XYYData:
+        """Data of the violin."""
+        return self._layer.data[self._index]
+
+    @data.setter
+    def data(self, data: tuple[ArrayLike, ArrayLike, ArrayLike]):
+        all_data = self._layer.data
+        all_data[self._index] = XYYData(*data)
+        self._layer.data = all_data
+
+    @property
+    def face(self) -> ViolinItemFace:
+        """Face properties of the violin."""
+        return ViolinItemFace(self)
+
+    @property
+    def edge(self) -> ViolinItemEdge:
+        """Edge properties of the violin."""
+        return ViolinItemEdge(self)
+
+    @property
+    def visible(self) -> bool:
+        """
+        Visibility of the violin.
+
+        A violin is hidden by setting its face and edge alpha to 0, because all the
+        violins are drawn by one artist. The alpha values are restored when the
+        violin is shown again.
+        """
+        return self._layer.visible and self._index not in self._layer._hidden_alphas
+
+    @visible.setter
+    def visible(self, visible: bool):
+        hidden = self._layer._hidden_alphas
+        if visible and self._index in hidden:
+            self.face.alpha, self.edge.alpha = hidden.pop(self._index)
+        elif not visible and self._index not in hidden:
+            hidden[self._index] = (self.face.alpha, self.edge.alpha)
+            self.face.alpha = self.edge.alpha = 0.0
+
+    def with_face(
+        self,
+        *,
+        color: ColorType | _Void = _void,
+        hatch: Hatch | str | _Void = _void,
+        alpha: float | _Void = _void,
+    ) -> Self:
+        """Update the face properties of the violin."""
+        self.face.update(color=color, hatch=hatch, alpha=alpha)
+        return self
+
+    def with_edge(
+        self,
+        *,
+        color: ColorType | _Void = _void,
+        width: float | _Void = _void,
+        style: LineStyle | str | _Void = _void,
+        alpha: float | _Void = _void,
+    ) -> Self:
+        """Update the edge properties of the violin."""
+        self.edge.update(color=color, width=width, style=style, alpha=alpha)
+        return self
+
+    def with_hover_text(self, text: str) -> Self:
+        """Set the hover text of the violin."""
+        texts = list(self._layer._hover_texts)
+        texts[self._index] = text
+        self._layer.with_hover_text(texts)
+        return self
+
+
+class ViolinItemFace:
+    """Face properties of one violin, backed by the face arrays of the plot."""
+
+    def __init__(self, item: ViolinItem):
+        self._face = item._layer.face
+        self._index = item._index
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(color={self.color!r}, hatch={self.hatch!r}, "
+            f"alpha={self.alpha!r})"
+        )
+
+    @property
+    def color(self) -> NDArray[np.floating]:
+        """Face color of the violin."""
+        return self._face.color[self._index]
+
+    @color.setter
+    def color(self, color: ColorType):
+        colors = self._face.color.copy()
+        colors[self._index] = arr_color(color)
+        self._face.color = colors
+
+    @property
+    def hatch(self) -> Hatch:
+        """Face hatch of the violin."""
+        return Hatch(self._face.hatch[self._index])
+
+    @hatch.setter
+    def hatch(self, hatch: Hatch | str):
+        hatches = list(self._face.hatch)
+        hatches[self._index] = Hatch(hatch)
+        self._face.hatch = hatches
+
+    @property
+    def alpha(self) -> float:
+        """Face alpha of the violin."""
+        return float(self.color[3])
+
+    @alpha.setter
+    def alpha(self, value: float):
+        if not 0 <= value <= 1:
+            raise ValueError(f"Alpha must be between 0 and 1, got {value!r}")
+        self.color = (*self.color[:3], value)
+
+    def update(
+        self,
+        *,
+        color: ColorType | _Void = _void,
+        hatch: Hatch | str | _Void = _void,
+        alpha: float | _Void = _void,
+    ):
+        if color is not _void:
+            self.color = color
+        if hatch is not _void:
+            self.hatch = hatch
+        if alpha is not _void:
+            self.alpha = alpha
+
+
+class ViolinItemEdge:
+    """Edge properties of one violin, backed by the edge arrays of the plot."""
+
+    def __init__(self, item: ViolinItem):
+        self._edge = item._layer.edge
+        self._index = item._index
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(color={self.color!r}, width={self.width!r}, "
+            f"style={self.style!r}, alpha={self.alpha!r})"
+        )
+
+    @property
+    def color(self) -> NDArray[np.floating]:
+        """Edge color of the violin."""
+        return self._edge.color[self._index]
+
+    @color.setter
+    def color(self, color: ColorType):
+        colors = self._edge.color.copy()
+        colors[self._index] = arr_color(color)
+        self._edge.color = colors
+
+    @property
+    def width(self) -> float:
+        """Edge width of the violin."""
+        return float(self._edge.width[self._index])
+
+    @width.setter
+    def width(self, width: float):
+        if width < 0:
+            raise ValueError(f"Edge width must be non-negative, got {width!r}")
+        widths = np.array(self._edge.width, dtype=np.float32)
+        widths[self._index] = width
+        self._edge.width = widths
+
+    @property
+    def style(self) -> LineStyle:
+        """Edge style of the violin."""
+        return LineStyle(self._edge.style[self._index])
+
+    @style.setter
+    def style(self, style: LineStyle | str):
+        styles = list(self._edge.style)
+        styles[self._index] = LineStyle(style)
+        self._edge.style = styles
+
+    @property
+    def alpha(self) -> float:
+        """Edge alpha of the violin."""
+        return float(self.color[3])
+
+    @alpha.setter
+    def alpha(self, value: float):
+        if not 0 <= value <= 1:
+            raise ValueError(f"Alpha must be between 0 and 1, got {value!r}")
+        self.color = (*self.color[:3], value)
+
+    def update(
+        self,
+        *,
+        color: ColorType | _Void = _void,
+        width: float | _Void = _void,
+        style: LineStyle | str | _Void = _void,
+        alpha: float | _Void = _void,
+    ):
+        if color is not _void:
+            self.color = color
+        if width is not _void:
+            self.width = width
+        if style is not _void:
+            self.style = style
+        if alpha is not _void:
+            self.alpha = alpha
+
+
+class ViolinPlot(MultiBand[MultiFace, MultiEdge]):
+    """
+    Violin plot layer.
+
+    All the violins are drawn as a single multi-band artist, and the face and edge
+    properties are always given per violin. Iterating over or indexing a violin
+    plot gives `ViolinItem` objects, views of the data, face, edge, visibility and
+    hover text of each violin.
+    """
+
     def __init__(
         self,
-        bands: list[Band],
+        data: Iterable[tuple[ArrayLike, ArrayLike, ArrayLike]],
         *,
         name: str | None = None,
         shape: Literal["both", "left", "right"] = "both",
         extent: float = 0.5,
-        orient: Orientation = Orientation.VERTICAL,
+        orient: OrientationLike = Orientation.VERTICAL,
+        backend: str | Backend | None = None,
     ):
-        super().__init__(bands, name=name, orient=orient)
+        ori = Orientation.parse(orient)
+        super().__init__(data, orient=ori.transpose(), name=name, backend=backend)
+        self.with_face_multi().with_edge_multi(width=0.0)
         self._shape = shape
         self._extent = extent
+        # unscaled KDE curves and offsets, cached for incremental updates
+        self._kde_curves: list[XYYData] | None = None
+        self._kde_offsets: NDArray[np.floating] | None = None
+        # face and edge alpha of the violins hidden by `ViolinItem.visible`
+        self._hidden_alphas: dict[int, tuple[float, float]] = {}
+        self._hover_texts: list[str] = [""] * self.nbands
 
     @classmethod
     def from_arrays(
@@ -121,51 +386,75 @@ class ViolinPlot(BandCollection):
         kde_band_width: float | str = "scott",
         backend: str | Backend | None = None,
     ):
-        ori = Orientation.parse(orient)
-        new_vals = cls._convert_data(
-            x, data, shape=shape, extent=extent, kde_band_width=kde_band_width
-        )
-        return cls(
-            [
-                Band(*each, orient=orient.transpose(), backend=backend)
-                for each in new_vals
-            ],
-            name=name,
-            shape=shape,
-            extent=extent,
-            orient=ori.transpose(),
-        )
+        if extent <= 0:
+            raise ValueError(f"extent must be positive, got {extent}")
+        x, data = check_array_input(x, data)
+        curves = cls._calc_kde_curves(x, data, shape, kde_band_width)
+        new_vals = cls._scale_curves(x, curves, shape=shape, extent=extent)
+        self = cls(
+            new_vals, name=name, shape=shape, extent=extent, orient=orient,
+            backend=backend,
+        )  # fmt: skip
+        self._kde_curves = curves
+        self._kde_offsets = x
+        return self
 
     @classmethod
     def from_dict(
         cls, d: dict[str, Any], backend: Backend | str | None = None
     ) -> ViolinPlot:
         """Create a ViolinPlot from a dictionary."""
-        return cls(
-            [Band.from_dict(b, backend=backend) for b in d["children"]],
-            name=d["name"],
-            shape=d["shape"],
-            extent=d["extent"],
-            orient=d["orient"],
-        )
+        if "children" in d:
+            d = _violin_dict_from_children(d)
+        self = cls(
+            [XYYData.from_dict(each) for each in d["data"]], name=d["name"],
+            shape=d["shape"], extent=d["extent"], orient=d["orient"],
+            backend=backend,
+        )  # fmt: skip
+        return self._update_face_edge_from_dict(d)
 
     def to_dict(self) -> dict[str, Any]:
         return {
             **super().to_dict(),
             "shape": self._shape,
             "extent": self._extent,
-            "orient": self._orient.value,
+            "orient": self.orient.value,
         }
 
+    def __len__(self) -> int:
+        return self.nbands
+
+    def __getitem__(self, index: int) -> ViolinItem:
+        nbands = self.nbands
+        if not -nbands <= index < nbands:
+            raise IndexError(f"Index {index} out of range for {nbands} violins.")
+        return ViolinItem(self, index % nbands)
+
+    def __iter__(self) -> Iterator[ViolinItem]:
+        for i in range(self.nbands):
+            yield ViolinItem(self, i)
+
+    def with_hover_text(self, text: str | Iterable[Any]) -> Self:
+        """Set hover text for each violin."""
+        if isinstance(text, str):
+            texts = [text] * self.nbands
+        else:
+            texts = [str(t) for t in text]
+        super().with_hover_text(texts)
+        self._hover_texts = texts
+        return self
+
+    def _set_layer_data(self, data: list[XYYData]):
+        if len(data) != self.nbands:
+            self._hidden_alphas.clear()
+            self._hover_texts = [""] * len(data)
+        super()._set_layer_data(data)
+
     @property
     def orient(self) -> Orientation:
         """Orientation of the violin plot (perpendicular to the fill orientation)."""
         return self._orient.transpose()
 
-    @property
-    def ndata(self) -> int:
-        return len(self)
-
     @property
     def extent(self):
         return self._extent
@@ -175,42 +464,79 @@ class ViolinPlot(BandCollection):
         if width <= 0:
             raise ValueError(f"extent must be positive, got {width}")
         factor = width / self.extent
-        for band in self:
-            bd = band.data
+        new_vals: list[XYYData] = []
+        for bd in self.data:
             ycenter = bd.ycenter
             y0 = (bd.y0 - ycenter) * factor + ycenter
             y1 = (bd.y1 - ycenter) * factor + ycenter
-            band.set_data(bd.x, y0, y1)
+            new_vals.append(XYYData(bd.x, y0, y1))
+        self.data = new_vals
         self._extent = width
 
+    def with_face(
+        self,
+        *,
+        color: ColorType | _Void = _void,
+        hatch: Hatch | str = Hatch.SOLID,
+        alpha: float = 1,
+    ) -> Self:
+        """Update the face properties."""
+        return self.with_face_multi(color=color, hatch=hatch, alpha=alpha)
+
+    def with_edge(
+        self,
+        *,
+        color: ColorType | None = None,
+        width: float = 1.0,
+        style: LineStyle | str = LineStyle.SOLID,
+        alpha: float = 1,
+    ) -> Self:
+        """Update the edge properties."""
+        return self.with_edge_multi(color=color, width=width, style=style, alpha=alpha)
+
+    def _update_arrays(
+        self,
+        data: list[ArrayLike],
+        indices: Iterable[int] | None = None,
+        kde_band_width: float | str = "scott",
+    ) -> None:
+        """
+        Update the violins using new data.
+
+        Only the KDE of the violins at the given indices are recalculated. Other
+        violins are only rescaled.
+        """
+        if self._kde_curves is None or self._kde_offsets is None:
+            raise ValueError("Violin plot was not created from arrays.")
+        if len(data) != len(self._kde_curves):
+            raise ValueError(
+                f"Expected {len(self._kde_curves)} arrays, got {len(data)}."
+            )
+        if indices is None:
+            indices = range(len(data))
+        indices = list(indices)
+        curves = self._calc_kde_curves(
+            self._kde_offsets[indices], [data[i] for i in indices], self._shape,
+            kde_band_width,
+        )  # fmt: skip
+        for i, curve in zip(indices, curves):
+            self._kde_curves[i] = curve
+        self.data = self._scale_curves(
+            self._kde_offsets, self._kde_curves, shape=self._shape, extent=self._extent
+        )
+
     @staticmethod
-    def _convert_data(
-        x: list[float],
+    def _calc_kde_curves(
+        offsets: NDArray[np.floating],
         data: list[ArrayLike],
         shape: Literal["both", "left", "right"] = "both",
-        extent: float = 0.5,
         kde_band_width: float | str = "scott",
-    ):
-        from whitecanvas.utils.kde import gaussian_kde
-
-        if extent <= 0:
-            raise ValueError(f"extent must be positive, got {extent}")
-        x, data = check_array_input(x, data)
-        xyy_values: list[XYYData] = []
-        for offset, values in zip(x, data):
-            arr = as_array_1d(values)
-            if arr.size > 1:
-                kde = gaussian_kde(arr, bw_method=kde_band_width)
-                sigma = np.sqrt(kde.covariance[0, 0])
-                pad = sigma * 2.5
-                x_ = np.linspace(arr.min() - pad, arr.max() + pad, 100)
-                y = kde(x_)
-            elif arr.size == 1:
-                x_ = np.array([arr[0]])
-                y = np.array([1.0])
-            else:
-                x_ = np.array([])
-                y = np.array([])
+    ) -> list[XYYData]:
+        """Calculate the unscaled KDE curves of the violins."""
+        out: list[XYYData] = []
+        arrays = [as_array_1d(values) for values in data]
+        densities = _batched_kde(arrays, kde_band_width)
+        for offset, (x_, y) in zip(offsets, densities):
             if shape in ("both", "left"):
                 y0 = -y + offset
             else:
@@ -219,20 +545,147 @@ class ViolinPlot(BandCollection):
                 y1 = y + offset
             else:
                 y1 = np.zeros_like(y) + offset
+            out.append(XYYData(x_, y0, y1))
+        return out
 
-            data = XYYData(x_, y0, y1)
-            xyy_values.append(data)
-
+    @staticmethod
+    def _scale_curves(
+        x: ArrayLike,
+        xyy_values: list[XYYData],
+        shape: Literal["both", "left", "right"] = "both",
+        extent: float = 0.5,
+    ) -> list[XYYData]:
+        """Scale the KDE curves so that the widest violin fits the extent."""
         half_widths: list[float] = []
         for xyy in xyy_values:
+            if xyy.x.size == 0:
+                continue
             half_width = np.max(np.abs(xyy.ydiff))
             if shape == "both":
                 half_width /= 2
             half_widths.append(half_width)
-        factor = extent / np.max(half_widths) / 2
+        if len(half_widths) == 0:
+            factor = 1.0
+        else:
+            factor = extent / np.max(half_widths) / 2
         new_vals: list[XYYData] = []
         for xyy, xoffset in zip(xyy_values, x):
             y0 = (xyy.y0 - xoffset) * factor + xoffset
             y1 = (xyy.y1 - xoffset) * factor + xoffset
             new_vals.append(XYYData(xyy.x, y0, y1))
         return new_vals
+
+
+_KDE_NUM_POINTS = 100
+_KDE_CHUNK_SIZE = 1 << 20  # max number of (sample, grid point) pairs per chunk
+
+
+def _batched_kde(
+    arrays: list[NDArray[np.number]],
+    kde_band_width: float | str = "scott",
+) -> list[tuple[NDArray[np.floating], NDArray[np.floating]]]:
+    """
+    Evaluate the Gaussian KDE of each array.
+
+    The result is the same as evaluating `gaussian_kde(arr, bw_method=...)` on
+    `linspace(min - 2.5 * sigma, max + 2.5 * sigma, 100)` for each array, but the
+    grids of all the groups are derived from one shared normalized grid and the
+    kernels are summed in a few vectorized passes over all the samples.
+    """
+    out: list[tuple[NDArray[np.floating], NDArray[np.floating]]] = []
+    batch: list[int] = []
+    for i, arr in enumerate(arrays):
+        if arr.size > 1:
+            batch.append(i)
+            out.append(None)
+        elif arr.size == 1:
+            out.append((np.array([arr[0]]), np.array([1.0])))
+        else:
+            out.append((np.array([]), np.array([])))
+    if len(batch) == 0:
+        return out
+    values = [arrays[i].astype(np.float64, copy=False) for i in batch]
+    sizes = np.array([arr.size for arr in values])
+    if isinstance(kde_band_width, str):
+        if kde_band_width == "scott":
+            factor = np.power(sizes, -1 / 5)
+        elif kde_band_width == "silverman":
+            factor = np.power(sizes * 0.75, -1 / 5)
+        else:
+            raise ValueError(
+                "`bw_method` should be 'scott', 'silverman', a scalar or a callable."
+            )
+    elif is_real_number(kde_band_width):
+        factor = np.full(sizes.size, float(kde_band_width))
+    else:  # callable band width depends on the gaussian_kde instance
+        for i, arr in zip(batch, values):
+            out[i] = _single_kde(arr, kde_band_width)
+        return out
+
+    concat = np.concatenate(values)
+    starts = np.cumsum(sizes) - sizes
+    means = np.add.reduceat(concat, starts) / sizes
+    group_ids = np.repeat(np.arange(sizes.size), sizes)
+    sq_dev = np.add.reduceat((concat - means[group_ids]) ** 2, starts)
+    cov = sq_dev / (sizes - 1) * factor**2
+
+    # singular covariance is not supported by gaussian_kde
+    is_singular = cov <= 0
+    for i in np.flatnonzero(is_singular):
+        out[batch[i]] = _single_kde(values[i], kde_band_width)
+    pad = np.sqrt(cov) * 2.5
+    low = np.minimum.reduceat(concat, starts) - pad
+    high = np.maximum.reduceat(concat, starts) + pad
+    unit_grid = np.linspace(0, 1, _KDE_NUM_POINTS)
+    grids = low[:, np.newaxis] + (high - low)[:, np.newaxis] * unit_grid
+    grids[:, -1] = high
+    inv_cov = np.where(is_singular, 0.0, 1 / np.where(is_singular, 1.0, cov))
+
+    density = np.zeros((sizes.size, _KDE_NUM_POINTS), dtype=np.float64)
+    chunk = max(_KDE_CHUNK_SIZE // _KDE_NUM_POINTS, 1)
+    for start in range(0, concat.size, chunk):
+        gid = group_ids[start : start + chunk]
+        diff = grids[gid] - concat[start : start + chunk, np.newaxis]
+        kernel = np.exp(-0.5 * diff**2 * inv_cov[gid, np.newaxis])
+        # samples are sorted by group, so each group is a contiguous block
+        bounds = np.flatnonzero(np.diff(gid, prepend=-1))
+        density[gid[bounds]] += np.add.reduceat(kernel, bounds, axis=0)
+    density /= (sizes * np.sqrt(2 * np.pi * np.where(is_singular, 1.0, cov)))[
+        :, np.newaxis
+    ]
+    for k, i in enumerate(batch):
+        if not is_singular[k]:
+            out[i] = (grids[k], density[k])
+    return out
+
+
+def _single_kde(arr: NDArray[np.number], kde_band_width: Any):
+    from whitecanvas.utils.kde import gaussian_kde
+
+    kde = gaussian_kde(arr, bw_method=kde_band_width)
+    sigma = np.sqrt(kde.covariance[0, 0])
+    pad = sigma * 2.5
+    x_ = np.linspace(arr.min() - pad, arr.max() + pad, _KDE_NUM_POINTS)
+    return x_, kde(x_)
+
+
+def _violin_dict_from_children(d: dict[str, Any]) -> dict[str, Any]:
+    """Convert the dict of the violin plot saved as a collection of bands."""
+    children = d["children"]
+    faces = [child["face"] for child in children]
+    edges = [child["edge"] for child in children]
+    return {
+        **d,
+        "data": [child["data"] for child in children],
+        # the orientation of the bands was saved
+        "orient": Orientation.parse(d["orient"]).transpose().value,
+        "face": {
+            "color": [face["color"] for face in faces],
+            "hatch": [face["hatch"] for face in faces],
+        },
+        "edge": {
+            "color": [edge["color"] for edge in edges],
+            "width": [edge["width"] for edge in edges],
+            "style": [edge["style"] for edge in edges],
+        },
+    }
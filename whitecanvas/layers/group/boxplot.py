@@ -26,7 +26,9 @@ from whitecanvas.types import (
     LineStyle,
     Orientation,
     OrientationLike,
+    PackedLines,
 )
+from whitecanvas.utils.grouped import GroupedArray
 from whitecanvas.utils.normalize import as_any_1d_array, as_color_array
 
 
@@ -119,10 +121,7 @@ class BoxPlot(LayerContainer, AbstractFaceEdgeMixin["BoxFace", "BoxEdge"]):
         x, data = check_array_input(x, data)
         ori = Orientation.parse(orient)
         color = as_color_array(color, len(x))
-        agg_values: list[NDArray[np.number]] = []
-        for d in data:
-            agg_values.append(np.quantile(d, [0, 0.25, 0.5, 0.75, 1]))
-        agg_arr = np.stack(agg_values, axis=1)
+        agg_arr = GroupedArray.from_arrays(data).quantile([0, 0.25, 0.5, 0.75, 1])
         box = Bars(
             x, agg_arr[3] - agg_arr[1], agg_arr[1], name=name, orient=ori,
             extent=extent, backend=backend,
@@ -133,18 +132,11 @@ class BoxPlot(LayerContainer, AbstractFaceEdgeMixin["BoxFace", "BoxEdge"]):
             segs = _xyy_to_segments(
                 x, agg_arr[0], agg_arr[1], agg_arr[3], agg_arr[4], capsize
             )
-            medsegs = [
-                [(x0 - extent / 2, y0), (x0 + extent / 2, y0)]
-                for x0, y0 in zip(x, agg_arr[2])
-            ]
         else:
             segs = _yxx_to_segments(
                 x, agg_arr[0], agg_arr[1], agg_arr[3], agg_arr[4], capsize
             )
-            medsegs = [
-                [(x0, y0 - extent / 2), (x0, y0 + extent / 2)]
-                for x0, y0 in zip(x, agg_arr[2])
-            ]
+        medsegs = _median_segments(x, agg_arr[2], extent, ori)
         whiskers = MultiLine(
             segs, name=name, style=LineStyle.SOLID, alpha=alpha, backend=backend,
             color="black",
@@ -164,23 +156,12 @@ class BoxPlot(LayerContainer, AbstractFaceEdgeMixin["BoxFace", "BoxEdge"]):
         """Move the layer by the given shift."""
         self.boxes.set_data(xdata=self.boxes.data.x + shift)
         if self.orient.is_vertical:
-            _wdata = []
-            for seg in self.whiskers.data:
-                _wdata.append(np.stack([seg[:, 0] + shift, seg[:, 1]], axis=0))
-            self.whiskers.data = _wdata
-            _mdata = []
-            for seg in self.medians.data:
-                _mdata.append(np.stack([seg[:, 0] + shift, seg[:, 1]], axis=0))
-            self.medians.data = _mdata
+            _shift = np.array([shift, 0])
         else:
-            _wdata = []
-            for seg in self.whiskers.data:
-                _wdata.append(np.stack([seg[:, 0], seg[:, 1] + shift], axis=0))
-            self.whiskers.data = _wdata
-            _mdata = []
-            for seg in self.medians.data:
-                _mdata.append(np.stack([seg[:, 0], seg[:, 1] + shift], axis=0))
-            self.medians.data = _mdata
+            _shift = np.array([0, shift])
+        for layer in (self.whiskers, self.medians):
+            segs = layer.data
+            layer.data = PackedLines(segs.coords + _shift, segs.offsets)
         if autoscale and (canvas := self._canvas_ref()):
             canvas._autoscale_for_layer(self, pad_rel=0.025)
         return self
@@ -193,31 +174,24 @@ class BoxPlot(LayerContainer, AbstractFaceEdgeMixin["BoxFace", "BoxEdge"]):
             segs = _xyy_to_segments(
                 x, agg_arr[0], agg_arr[1], agg_arr[3], agg_arr[4], self._capsize
             )
-            medsegs = [
-                np.array([(x0 - extent / 2, y0), (x0 + extent / 2, y0)])
-                for x0, y0 in zip(x, agg_arr[2])
-            ]
         else:
             segs = _yxx_to_segments(
                 x, agg_arr[0], agg_arr[1], agg_arr[3], agg_arr[4], self._capsize
             )
-            medsegs = [
-                np.array([(x0, y0 - extent / 2), (x0, y0 + extent / 2)])
-                for x0, y0 in zip(x, agg_arr[2])
-            ]
         self.whiskers.data = segs
-        self.medians.data = medsegs
+        self.medians.data = _median_segments(x, agg_arr[2], extent, self.orient)
         return None
 
     def _get_sep_values(self) -> NDArray[np.number]:
         """(5, N) array of min, 25%, 50%, 75%, max."""
         idx = 1 if self.orient.is_vertical else 0
         stop = self.boxes.ndata
-        _min = [seg[0, idx] for seg in self.whiskers.data[:stop]]
+        whiskers = self.whiskers.data.coords.reshape(-1, 2, 2)
+        _min = whiskers[:stop, 0, idx]
         _p25 = self.boxes.bottom
-        _median = [seg[0, idx] for seg in self.medians.data]
+        _median = self.medians.data.coords.reshape(-1, 2, 2)[:, 0, idx]
         _p75 = self.boxes.top
-        _max = [seg[1, idx] for seg in self.whiskers.data[stop : stop * 2]]
+        _max = whiskers[stop : stop * 2, 1, idx]
         return np.stack([_min, _p25, _median, _p75, _max], axis=0)
 
     def _make_sure_hatch_visible(self):
@@ -255,16 +229,7 @@ def _xyy_to_segments(
     v1 = np.stack([x, y1], axis=1)
     v2 = np.stack([x, y2], axis=1)
     v3 = np.stack([x, y3], axis=1)
-    segments_0 = [np.stack([s0, s1]) for s0, s1 in zip(v0, v1)]
-    segments_1 = [np.stack([s2, s3]) for s2, s3 in zip(v2, v3)]
-    if capsize > 0:
-        _c = np.array([capsize / 2, 0])
-        cap0 = [np.stack([s0 - _c, s0 + _c]) for s0 in v0]
-        cap1 = [np.stack([s3 - _c, s3 + _c]) for s3 in v3]
-    else:
-        cap0 = []
-        cap1 = []
-    return segments_0 + segments_1 + cap0 + cap1
+    return _to_segments(v0, v1, v2, v3, np.array([capsize / 2, 0]))
 
 
 def _yxx_to_segments(
@@ -286,17 +251,34 @@ def _yxx_to_segments(
     v1 = np.stack([x1, y], axis=1)
     v2 = np.stack([x2, y], axis=1)
     v3 = np.stack([x3, y], axis=1)
-    segments_0 = [np.stack([s0, s1]) for s0, s1 in zip(v0, v1)]
-    segments_1 = [np.stack([s2, s3]) for s2, s3 in zip(v2, v3)]
+    return _to_segments(v0, v1, v2, v3, np.array([0, capsize / 2]))
+
+
+def _to_segments(v0, v1, v2, v3, cap: NDArray[np.number]) -> NDArray[np.number]:
+    """Packed (N, 2, 2) array of the lower and upper whiskers followed by caps."""
+    parts = [np.stack([v0, v1], axis=1), np.stack([v2, v3], axis=1)]
+    if np.any(cap > 0):
+        parts.append(np.stack([v0 - cap, v0 + cap], axis=1))
+        parts.append(np.stack([v3 - cap, v3 + cap], axis=1))
+    return np.concatenate(parts, axis=0)
 
-    if capsize > 0:
-        _c = np.array([0, capsize / 2])
-        cap0 = [np.stack([s0 - _c, s0 + _c]) for s0 in v0]
-        cap1 = [np.stack([s3 - _c, s3 + _c]) for s3 in v3]
+
+def _median_segments(
+    x: ArrayLike1D,
+    y: ArrayLike1D,
+    extent: float,
+    orient: Orientation,
+) -> NDArray[np.number]:
+    """Packed (N, 2, 2) array of the median lines."""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if orient.is_vertical:
+        start = np.stack([x - extent / 2, y], axis=1)
+        stop = np.stack([x + extent / 2, y], axis=1)
     else:
-        cap0 = []
-        cap1 = []
-    return segments_0 + segments_1 + cap0 + cap1
+        start = np.stack([x, y - extent / 2], axis=1)
+        stop = np.stack([x, y + extent / 2], axis=1)
+    return np.stack([start, stop], axis=1)
 
 
 class BoxFace(MultiPropertyFaceBase):
@@ -11,6 +11,7 @@ from whitecanvas.layers._deserialize import construct_layers
 from whitecanvas.layers._primitive import Image
 from whitecanvas.layers.group._collections import LayerContainer
 from whitecanvas.types import ColormapType, Orientation
+from whitecanvas.utils.lut import LUT_SIZE, colormap_lut
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -116,7 +117,7 @@ class Colorbar(LayerContainer):
 
 
 def _cmap_to_image(cmap: Colormap, orient: Orientation):
-    lut = cmap.lut()  # (N, 4)
+    lut = colormap_lut(cmap)[:: LUT_SIZE // 256]  # (256, 4)
     width = 50
     if orient.is_vertical:
         arr = np.repeat(lut[:, np.newaxis, :], width, axis=1)
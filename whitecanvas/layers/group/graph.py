@@ -25,11 +25,15 @@ class Graph(LayerContainer):
         texts: Texts,
         name: str | None = None,
         offset: TextOffset | None = None,
+        connections: NDArray[np.intp] | None = None,
     ):
         if offset is None:
             offset = NoOffset()
         super().__init__([nodes, edges, texts], name=name)
         self._text_offset: TextOffset = offset
+        if connections is not None:
+            connections = np.asarray(connections, dtype=np.intp).reshape(-1, 2)
+        self._connections = connections
 
     def _default_ordering(self, n: int) -> list[int]:
         assert n == 3
@@ -65,13 +69,28 @@ class Graph(LayerContainer):
         self._text_offset = _offset
         return self
 
+    @property
+    def connections(self) -> NDArray[np.intp] | None:
+        """The (N, 2) array of node indices connected by the edges, if known."""
+        return self._connections
+
     def set_graph(self, nodes: NDArray[np.floating], edges: NDArray[np.intp]):
         """Set the graph data."""
+        edges = np.asarray(edges, dtype=np.intp).reshape(-1, 2)
+        self._connections = edges
+        self.set_nodes(nodes)
+
+    def set_nodes(self, nodes: NDArray[np.floating]):
+        """Move the nodes while keeping the connections between them."""
+        if self._connections is None:
+            raise ValueError("Connections of the graph are unknown. Use `set_graph`.")
+        nodes = np.asarray(nodes)
         self.nodes.data = nodes
-        edge_data: list[np.ndarray] = []
-        for edge in edges:
-            edge_data.append(np.stack([nodes[i] for i in edge], axis=0))
-        self.edges.data = edge_data
+        # (N, 2, 2) array of all the edge segments
+        self.edges.data = nodes[self._connections]
+        if self.texts.ndata > 0:
+            xoff, yoff = self._text_offset._asarray()
+            self.texts.set_pos(nodes[:, 0] + xoff, nodes[:, 1] + yoff)
 
     def with_text(
         self,
@@ -110,13 +129,19 @@ class Graph(LayerContainer):
         children = construct_layers(d["children"], backend=backend)
         if isinstance(offset := d.get("offset"), dict):
             offset = parse_offset_dict(offset)
-        return cls(*children, name=d.get("name"), offset=offset)
+        return cls(
+            *children, name=d.get("name"), offset=offset,
+            connections=d.get("connections"),
+        )  # fmt: skip
 
     def to_dict(self) -> dict[str, Any]:
-        return {
+        out = {
             **super().to_dict(),
             "offset": self._text_offset.to_dict(),
         }
+        if self._connections is not None:
+            out["connections"] = self._connections.tolist()
+        return out
 
     def _as_legend_item(self):
         line = self.edges._as_legend_item()
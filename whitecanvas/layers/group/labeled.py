@@ -30,6 +30,7 @@ from whitecanvas.types import (
     Rect,
     XYData,
 )
+from whitecanvas.utils.grouped import GroupedArray
 from whitecanvas.utils.normalize import as_any_1d_array, as_color_array
 
 if TYPE_CHECKING:
@@ -305,21 +306,9 @@ def _init_mean_sd(x, data: list[ArrayLike1D], color):
     x, data = check_array_input(x, data)
     color = as_color_array(color, len(x))
 
-    est_data = []
-    err_data = []
-
-    for each in data:
-        sub_data = np.asarray(each)
-        _mean = np.mean(sub_data)
-        if sub_data.size == 1:
-            _sd = 0
-        else:
-            _sd = np.std(sub_data, ddof=1)
-        est_data.append(_mean)
-        err_data.append(_sd)
-
-    est_data = np.array(est_data)
-    err_data = np.array(err_data)
+    grouped = GroupedArray.from_arrays(data)
+    est_data = grouped.mean()
+    err_data = grouped.std(ddof=1)
     return x, est_data, err_data
 
 
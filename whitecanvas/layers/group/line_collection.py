@@ -11,6 +11,7 @@ from whitecanvas.layers._primitive import Line, Markers
 from whitecanvas.layers.group._collections import LayerCollection
 from whitecanvas.types import Hatch, LineStyle, Symbol, XYData
 from whitecanvas.utils.normalize import as_any_1d_array, as_color_array, parse_texts
+from whitecanvas.utils.template import HoverTexts
 from whitecanvas.utils.type_check import is_real_number
 
 if TYPE_CHECKING:
@@ -113,10 +114,7 @@ class LineCollection(LayerCollection[Line]):
         # set default format keys
         if "i" not in params:
             params["i"] = np.arange(len(self))
-        texts = [
-            template.format(**{k: v[i] for k, v in params.items()})
-            for i in range(len(self))
-        ]
+        texts = HoverTexts(template, params, len(self))
         return self.with_hover_texts(texts)
 
     def _prep_markers(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import deque
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, overload
 
 import numpy as np
@@ -23,7 +24,12 @@ from whitecanvas.types import (
     OrientationLike,
     XYData,
 )
-from whitecanvas.utils.hist import get_hist_edges, histograms
+from whitecanvas.utils.hist import (
+    HistogramTuple,
+    bin_counts,
+    get_hist_edges,
+    histograms,
+)
 from whitecanvas.utils.normalize import as_array_1d
 
 if TYPE_CHECKING:
@@ -84,7 +90,7 @@ class LineFillBase(LayerContainer, Generic[_L]):
 class Histogram(LineFillBase[Line]):
     def __init__(
         self,
-        data: NDArray[np.number],
+        data: NDArray[np.number] | None,
         edges: NDArray[np.number],
         limits: tuple[float, float] | None,
         line: Line,
@@ -92,29 +98,45 @@ class Histogram(LineFillBase[Line]):
         shape: HistogramShape = HistogramShape.bars,
         kind: HistogramKind = HistogramKind.count,
         name: str | None = None,
+        counts: NDArray[np.number] | None = None,
     ):
         if name is None:
             name = "histogram"
         super().__init__(line, fill, name=name)
+        edges = as_array_1d(edges)
+        if counts is None:
+            if data is None:
+                raise ValueError("Either data or counts must be given.")
+            counts = self._calculate_counts(data, edges, limits).counts[0]
         self._data = data
+        self._counts = np.asarray(counts)
         self._shape = shape
         self._kind = kind
         self._edges = edges
         self._limits = limits
+        self._batches: deque[NDArray[np.number]] | None = None
 
     @property
-    def data(self) -> NDArray[np.number]:
-        """The data used to plot the histogram."""
+    def data(self) -> NDArray[np.number] | None:
+        """
+        The data used to plot the histogram.
+
+        None if values are added by `accumulate`, as raw values are not stored.
+        """
         return self._data
 
     @data.setter
     def data(self, data: NDArray[np.number]):
         data = as_array_1d(data)
-        xdata, ydata, _ = self._calculate_xy(
-            data, self._edges, self._shape, self._kind, self._limits, clip=True
-        )  # fmt: skip
-        self._update_internal(xdata, ydata)
+        hist = self._calculate_counts(data, self._edges, self._limits)
+        self._update_counts(hist.counts[0])
         self._data = data
+        self._batches = None
+
+    @property
+    def counts(self) -> NDArray[np.number]:
+        """The counts of each bin."""
+        return self._counts
 
     @classmethod
     def from_dict(cls, d: dict[str, Any], backend: Backend | str | None = None) -> Self:
@@ -124,12 +146,16 @@ class Histogram(LineFillBase[Line]):
         children = construct_layers(d["children"], backend=backend)
         shape = HistogramShape(d.get("shape", "bars"))
         kind = HistogramKind(d.get("kind", "count"))
-        return cls(data, edges, limits, *children, shape, kind, name=d.get("name"))
+        return cls(
+            data, edges, limits, *children, shape, kind, name=d.get("name"),
+            counts=d.get("counts"),
+        )  # fmt: skip
 
     def to_dict(self) -> dict[str, Any]:
         return {
             **super().to_dict(),
             "data": self.data,
+            "counts": self.counts,
             "edges": self.edges,
             "limits": self.limits,
             "shape": self.shape.value,
@@ -143,6 +169,83 @@ class Histogram(LineFillBase[Line]):
             self.line.data = ydata, xdata
         self.fill.data = xdata, _prep_bottom(ydata), ydata
 
+    def _update_counts(self, counts: NDArray[np.number]):
+        hist = HistogramTuple(self._edges, [counts])
+        xdata, ydata = self._counts_to_xy(hist, self._shape, self._kind)
+        self._update_internal(xdata, ydata)
+        self._counts = counts
+
+    def _raw_data_or_raise(self) -> NDArray[np.number]:
+        if self._data is None:
+            raise ValueError(
+                "Bins of a histogram cannot be changed after `accumulate` because "
+                "the raw data is not stored."
+            )
+        return self._data
+
+    def accumulate(
+        self,
+        values: ArrayLike1D,
+        *,
+        decay: float | None = None,
+        window: int | None = None,
+    ) -> Self:
+        """
+        Add values to the histogram without recomputing it for all the data.
+
+        The values are counted in the current bins and added to the cached counts.
+        The values are not stored, so `data` will be None and the bins cannot be
+        changed after this method is called.
+
+        >>> hist = canvas.add_hist([], bins=50, limits=(0, 1))
+        >>> hist.accumulate(np.random.random(1000))  # cumulative
+        >>> hist.accumulate(np.random.random(1000), decay=0.9)  # exponential decay
+        >>> hist.accumulate(np.random.random(1000), window=10)  # last 10 batches
+
+        Parameters
+        ----------
+        values : array-like
+            1D array of new values.
+        decay : float, optional
+            If given, the current counts are multiplied by this factor before the new
+            counts are added, so that older values are exponentially forgotten.
+        window : int, optional
+            If given, only the counts of the last `window` batches are kept. Counts
+            before the first call with `window` are considered as one batch. Counts
+            of each batch are remembered until `accumulate` is called without
+            `window`.
+        """
+        if decay is not None and window is not None:
+            raise TypeError("Cannot specify both decay and window.")
+        values = as_array_1d(values)
+        if self._limits is not None:
+            values = np.clip(values, *self._limits)
+        new = bin_counts(values, self._edges)
+        counts = self._counts
+        if decay is not None:
+            if not 0 <= decay <= 1:
+                raise ValueError(f"decay must be in [0, 1], got {decay!r}.")
+            counts = counts * decay + new
+            self._batches = None
+        elif window is not None:
+            if window < 1:
+                raise ValueError(f"window must be positive, got {window!r}.")
+            if self._batches is None:
+                self._batches = deque([counts], maxlen=window)
+            elif self._batches.maxlen != window:
+                self._batches = deque(self._batches, maxlen=window)
+                counts = np.sum(self._batches, axis=0)
+            if len(self._batches) == window:
+                counts = counts - self._batches[0]
+            counts = counts + new
+            self._batches.append(new)
+        else:
+            counts = counts + new
+            self._batches = None
+        self._update_counts(counts)
+        self._data = None
+        return self
+
     @property
     def shape(self) -> HistogramShape:
         """The shape of the histogram."""
@@ -151,9 +254,8 @@ class Histogram(LineFillBase[Line]):
     @shape.setter
     def shape(self, shape: str | HistogramShape):
         shape = HistogramShape(shape)
-        xdata, ydata, _ = self._calculate_xy(
-            self._data, self._edges, shape, self._kind, self._limits
-        )  # fmt: skip
+        hist = HistogramTuple(self._edges, [self._counts])
+        xdata, ydata = self._counts_to_xy(hist, shape, self._kind)
         self._update_internal(xdata, ydata)
         self._shape = shape
 
@@ -165,9 +267,8 @@ class Histogram(LineFillBase[Line]):
     @kind.setter
     def kind(self, kind: str | HistogramKind):
         kind = HistogramKind(kind)
-        xdata, ydata, _ = self._calculate_xy(
-            self._data, self._edges, self._shape, kind, self._limits
-        )  # fmt: skip
+        hist = HistogramTuple(self._edges, [self._counts])
+        xdata, ydata = self._counts_to_xy(hist, self._shape, kind)
         self._update_internal(xdata, ydata)
         self._kind = kind
 
@@ -178,10 +279,10 @@ class Histogram(LineFillBase[Line]):
 
     @limits.setter
     def limits(self, limits: tuple[float, float] | None):
-        xdata, ydata, _ = self._calculate_xy(
-            self._data, self._edges, self._shape, self._kind, limits
-        )
+        hist = self._calculate_counts(self._raw_data_or_raise(), self._edges, limits)
+        xdata, ydata = self._counts_to_xy(hist, self._shape, self._kind)
         self._update_internal(xdata, ydata)
+        self._counts = hist.counts[0]
         self._limits = limits
 
     @property
@@ -192,11 +293,11 @@ class Histogram(LineFillBase[Line]):
     @edges.setter
     def edges(self, edges: NDArray[np.number]):
         edges = as_array_1d(edges)
-        xdata, ydata, _ = self._calculate_xy(
-            self._data, edges, self._shape, self._kind, self._limits
-        )
+        hist = self._calculate_counts(self._raw_data_or_raise(), edges, self._limits)
+        xdata, ydata = self._counts_to_xy(hist, self._shape, self._kind)
         self._update_internal(xdata, ydata)
-        self._edges = edges
+        self._counts = hist.counts[0]
+        self._edges = hist.edges
 
     @overload
     def update_edges(
@@ -215,7 +316,7 @@ class Histogram(LineFillBase[Line]):
         """
         if limits is not None and not isinstance(bins, (int, np.number)):
             raise TypeError("bins must be an integer when limits are specified.")
-        edges = get_hist_edges([self._data], bins, limits)
+        edges = get_hist_edges([self._raw_data_or_raise()], bins, limits)
         self.edges = edges
 
     @classmethod
@@ -237,7 +338,8 @@ class Histogram(LineFillBase[Line]):
         shape = HistogramShape(shape)
         kind = HistogramKind(kind)
         ori = Orientation.parse(orient)
-        xdata, ydata, edges = cls._calculate_xy(data, bins, shape, kind, limits)
+        hist = cls._calculate_counts(data, bins, limits)
+        xdata, ydata = cls._counts_to_xy(hist, shape, kind)
         if ori.is_vertical:
             line = Line(
                 xdata, ydata, color=color, style=style, width=width, backend=backend
@@ -250,20 +352,27 @@ class Histogram(LineFillBase[Line]):
             xdata, _prep_bottom(ydata), ydata, color=color, alpha=0.2, orient=ori,
             backend=backend,
         )  # fmt: skip
-        return cls(data, edges, limits, line, fill, shape, kind, name=name)
+        return cls(
+            data, hist.edges, limits, line, fill, shape, kind, name=name,
+            counts=hist.counts[0],
+        )  # fmt: skip
 
     @staticmethod
-    def _calculate_xy(
+    def _calculate_counts(
         data,
         bins: HistBinType,
-        shape: HistogramShape,
-        kind: HistogramKind,
         limits: tuple[float, float] | None = None,
-        clip: bool = True,
-    ) -> tuple[NDArray[np.number], NDArray[np.number], NDArray[np.number]]:
-        if clip and limits is not None:
+    ) -> HistogramTuple:
+        if limits is not None:
             data = np.clip(data, *limits)
-        hist = histograms([data], bins, limits)
+        return histograms([data], bins, limits)
+
+    @staticmethod
+    def _counts_to_xy(
+        hist: HistogramTuple,
+        shape: HistogramShape,
+        kind: HistogramKind,
+    ) -> tuple[NDArray[np.number], NDArray[np.number]]:
         shape = HistogramShape(shape)
         kind = HistogramKind(kind)
         if kind is HistogramKind.count:
@@ -293,7 +402,7 @@ class Histogram(LineFillBase[Line]):
             ydata[1::3] = ydata[2::3] = heights
         else:
             raise ValueError(f"Unknown shape {shape!r}.")
-        return xdata, ydata, hist.edges
+        return xdata, ydata
 
 
 def _prep_bottom(ydata: NDArray[np.number]) -> NDArray[np.number]:
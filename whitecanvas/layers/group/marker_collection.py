@@ -37,6 +37,7 @@ from whitecanvas.utils.normalize import (
     as_color_array,
     parse_texts,
 )
+from whitecanvas.utils.template import HoverTexts
 from whitecanvas.utils.type_check import is_real_number
 
 if TYPE_CHECKING:
@@ -445,19 +446,60 @@ class MarkerCollection(LayerCollection[_Markers]):
         params.setdefault("y", ys)
         if "i" not in params:
             params["i"] = np.arange(xs.size)
-        texts = [
-            template.format(**{k: v[i] for k, v in params.items()})
-            for i in range(xs.size)
-        ]
-        texts = np.array(texts, dtype=object)
+        texts = HoverTexts(template, params, xs.size)
         return self._set_hover_text_unsafe(texts)
 
-    def _set_hover_text_unsafe(self, texts: NDArray[np.object_]):
+    def _set_hover_text_unsafe(self, texts: NDArray[np.object_] | HoverTexts):
         for i, layer in enumerate(self):
             sl = self._slices[i]
             layer._backend._plt_set_hover_text(texts[sl])
         return self
 
+    def _update_rows(
+        self,
+        xdata: ArrayLike1D,
+        ydata: ArrayLike1D,
+        symbols: NDArray[np.object_],
+        hatches: NDArray[np.object_],
+    ) -> None:
+        """
+        Replace all the rows of the collection.
+
+        Child layers with the same symbol and hatch are reused, so that the backend
+        objects are not recreated if the combinations of symbols and hatches do not
+        change.
+        """
+        xdata = as_array_1d(xdata)
+        ydata = as_array_1d(ydata)
+        symbols = np.array([Symbol(s) for s in symbols], dtype=object)
+        hatches = np.array([Hatch(h) for h in hatches], dtype=object)
+        covered = np.zeros(xdata.size, dtype=np.bool_)
+        new_slices: list[NDArray[np.bool_]] = []
+        for layer in self:
+            if layer.ndata > 0:
+                hatch = layer.face.hatch[0]
+            else:
+                hatch = Hatch.SOLID
+            sl = (symbols == layer.symbol) & (hatches == hatch)
+            layer.data = XYData(xdata[sl], ydata[sl])
+            covered |= sl
+            new_slices.append(sl)
+        self._slices = new_slices
+        if covered.all():
+            return None
+        # new combinations of symbols and hatches
+        rest = ~covered
+        keys = list(zip(symbols[rest], hatches[rest]))
+        for sym, hatch in OrderedSet(keys):
+            sl = rest & (symbols == sym) & (hatches == hatch)
+            markers = Markers(
+                xdata[sl], ydata[sl], symbol=sym, hatch=hatch,
+                backend=self._backend_name,
+            )._as_all_multi()  # fmt: skip
+            self.append(markers)
+            self._slices.append(sl)
+        return None
+
     def _split_markers(
         self,
         idx: int,
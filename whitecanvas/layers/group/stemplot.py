@@ -54,10 +54,12 @@ class StemPlot(LayerContainer, Generic[_Face, _Edge, _Size]):
     @property
     def bottom(self) -> NDArray[np.floating]:
         """Bottom of the stem."""
+        segs = self.lines.data
+        roots = segs.coords[segs.offsets[:-1]]
         if self.orient.is_vertical:
-            return np.array([d[0, 1] for d in self.lines.data])
+            return roots[:, 1]
         else:
-            return np.array([d[0, 0] for d in self.lines.data])
+            return roots[:, 0]
 
     @property
     def top(self) -> NDArray[np.floating]:
@@ -27,6 +27,7 @@ from whitecanvas.types import (
     XYZData,
     _Void,
 )
+from whitecanvas.utils.lut import map_colors
 from whitecanvas.utils.normalize import as_array_1d, normalize_xyz
 
 if TYPE_CHECKING:
@@ -252,7 +253,7 @@ class Markers3D(
         xyz = np.vstack([xyzdata.x, xyzdata.y, xyzdata.z])
         density = gaussian_kde(xyz)(xyz)
         normed = density / density.max()
-        self.with_face_multi(color=Colormap(cmap)(normed))
+        self.with_face_multi(color=map_colors(Colormap(cmap), normed))
         if width is not None:
             self.width = width
         return self
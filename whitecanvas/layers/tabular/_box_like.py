@@ -23,8 +23,10 @@ from whitecanvas.types import (
     LineStyle,
     Orientation,
     Symbol,
+    XYYData,
     _Void,
 )
+from whitecanvas.utils.grouped import GroupedArray
 from whitecanvas.utils.type_check import is_real_number
 
 if TYPE_CHECKING:
@@ -290,6 +292,31 @@ class _BoxLikeWrapper(_shared.DataFrameLayerWrapper[_L, _DF], _BoxLikeMixin):
             hatch_by=_p.HatchPlan.from_dict_or_plan(d["hatch_by"]),
         )
 
+    def _update_source(self, df: DataFrameWrapper[_DF]) -> None:
+        categories = [tuple(cat) for cat in self._categories]
+        groups = {
+            sl: np.asarray(sub[self._value]) for sl, sub in df.group_by(self._splitby)
+        }
+        if unknown := set(groups) - set(categories):
+            raise ValueError(
+                f"New categories {sorted('/'.join(map(str, c)) for c in unknown)} "
+                "are not in the plot. "
+                "Categorical plots cannot add categories by `update_source`."
+            )
+        arrays = [groups.get(cat, np.zeros(0)) for cat in categories]
+        self._update_arrays(arrays)
+        self._cat_iter = self._cat_iter.with_df(df)
+
+    def _update_arrays(self, arrays: list[np.ndarray]) -> None:
+        """
+        Update the base layer for the new arrays of each category.
+
+        Every subclass overrides this method.
+        """
+        raise TypeError(
+            f"{type(self).__name__} does not support updating the source data frame."
+        )
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "type": f"{self.__module__}.{self.__class__.__name__}",
@@ -333,6 +360,7 @@ class DFViolinPlot(_BoxLikeWrapper[_lg.ViolinPlot, _DF], Generic[_DF]):
         )  # fmt: skip
         self = cls(base, cat, categories, value, dodge, _splitby, color_by, hatch_by)
         self.with_hover_template("\n".join(f"{k}: {{{k}!r}}" for k in self._splitby))
+        self._arrays = arr
         return self
 
     @property
@@ -340,6 +368,18 @@ class DFViolinPlot(_BoxLikeWrapper[_lg.ViolinPlot, _DF], Generic[_DF]):
         """Orientation of the violins."""
         return self._base_layer.orient
 
+    def _update_arrays(self, arrays: list[np.ndarray]) -> None:
+        old = getattr(self, "_arrays", None)
+        if old is None:
+            indices = None
+        else:
+            indices = [
+                i for i, (a0, a1) in enumerate(zip(old, arrays))
+                if not np.array_equal(a0, a1)
+            ]  # fmt: skip
+        self._base_layer._update_arrays(arrays, indices)
+        self._arrays = arrays
+
     @property
     def shape(self) -> Literal["both", "left", "right"]:
         """Shape of the violins."""
@@ -347,9 +387,16 @@ class DFViolinPlot(_BoxLikeWrapper[_lg.ViolinPlot, _DF], Generic[_DF]):
 
     def move(self, shift: float = 0.0, autoscale: bool = True) -> Self:
         """Move the layer by the given shift."""
-        for layer in self._base_layer:
-            _old = layer.data
-            layer.set_data(edge_low=_old.y0 + shift, edge_high=_old.y1 + shift)
+        self._base_layer.data = [
+            XYYData(xyy.x, xyy.y0 + shift, xyy.y1 + shift)
+            for xyy in self._base_layer.data
+        ]
+        if self._base_layer._kde_offsets is not None:
+            self._base_layer._kde_offsets = self._base_layer._kde_offsets + shift
+            for i, xyy in enumerate(self._base_layer._kde_curves):
+                self._base_layer._kde_curves[i] = XYYData(
+                    xyy.x, xyy.y0 + shift, xyy.y1 + shift
+                )
         if autoscale and (canvas := self._canvas_ref()):
             canvas._autoscale_for_layer(self, pad_rel=0.025)
         return self
@@ -506,24 +553,14 @@ class DFViolinPlot(_BoxLikeWrapper[_lg.ViolinPlot, _DF], Generic[_DF]):
         _pos_map = _cat_self.prep_position_map(self._splitby, self._dodge)
         _extent = _cat_self.zoom_factor(self._dodge) * extent
 
-        # calculate outliers and update the separators
-        df_outliers = {c: [] for c in (*self._splitby, self._value)}
-        colors = []
-        for idx_cat, (sl, sub) in enumerate(self._source.group_by(self._splitby)):
-            arr = sub[self._value]
-            q1, q3 = np.quantile(arr, [0.25, 0.75])
-            iqr = q3 - q1  # interquartile range
-            low = q1 - ratio * iqr  # lower bound of inliers
-            high = q3 + ratio * iqr  # upper bound of inliers
-            outliers = arr[(arr < low) | (arr > high)]
-            for _cat, _s in zip(sl, self._splitby):
-                df_outliers[_s].extend([_cat] * outliers.size)
-            df_outliers[self._value].extend(outliers)
-            if is_edge_only:
-                _this_color = self.base.edge.color[idx_cat]
-            else:
-                _this_color = self.base.face.color[idx_cat]
-            colors.extend([_this_color] * outliers.size)
+        # calculate outliers
+        df_outliers, is_inlier, _, codes = _split_outliers(
+            self._source, self._splitby, self._value, ratio
+        )
+        if is_edge_only:
+            colors = self.base.edge.color[codes[~is_inlier]]
+        else:
+            colors = self.base.face.color[codes[~is_inlier]]
 
         df_outliers = parse(df_outliers)
         xj = _jitter.UniformJitter(self._splitby, _pos_map, extent=_extent, seed=seed)
@@ -534,7 +571,7 @@ class DFViolinPlot(_BoxLikeWrapper[_lg.ViolinPlot, _DF], Generic[_DF]):
         )  # fmt: skip
         if color is None:
             if is_edge_only:  # edge only
-                new._apply_color(np.stack(colors, axis=0, dtype=np.float32))
+                new._apply_color(colors.astype(np.float32))
             new.as_edge_only(width=self.base.edge.width.mean())
         return _combine_main_and_others(self, new)
 
@@ -716,6 +753,10 @@ class DFBoxPlot(_BoxLikeWrapper[_lg.BoxPlot, _DF], Generic[_DF]):
         self._base_layer.move(shift, autoscale=autoscale)
         return self
 
+    def _update_arrays(self, arrays: list[np.ndarray]) -> None:
+        agg_arr = GroupedArray.from_arrays(arrays).quantile([0, 0.25, 0.5, 0.75, 1])
+        self._base_layer._update_data(agg_arr)
+
     def with_hover_text(self, text: str | list[str]) -> Self:
         """Set the hover tooltip text for the layer."""
         self.base.boxes.with_hover_text(text)
@@ -783,27 +824,18 @@ class DFBoxPlot(_BoxLikeWrapper[_lg.BoxPlot, _DF], Generic[_DF]):
         _extent = self._cat_iter.zoom_factor(self._dodge) * extent
 
         # calculate outliers and update the separators
-        df_outliers = {c: [] for c in (*self._splitby, self._value)}
-        agg_values = self.base._get_sep_values()  # for updating whiskers
-        colors = []
-        for idx_cat, (sl, sub) in enumerate(self._source.group_by(self._splitby)):
-            arr = sub[self._value]
-            q1, q3 = np.quantile(arr, [0.25, 0.75])
-            iqr = q3 - q1  # interquartile range
-            low = q1 - ratio * iqr  # lower bound of inliers
-            high = q3 + ratio * iqr  # upper bound of inliers
-            is_inlier = (low <= arr) & (arr <= high)
-            inliers = arr[is_inlier]
-            agg_values[:, idx_cat] = np.quantile(inliers, [0, 0.25, 0.5, 0.75, 1.0])
-            outliers = arr[~is_inlier]
-            for _cat, _s in zip(sl, self._splitby):
-                df_outliers[_s].extend([_cat] * outliers.size)
-            df_outliers[self._value].extend(outliers)
-            if is_edge_only:
-                _this_color = self.base.edge.color[idx_cat]
-            else:
-                _this_color = self.base.face.color[idx_cat]
-            colors.extend([_this_color] * outliers.size)
+        if is_edge_only:
+            _colors = self.base.edge.color
+        else:
+            _colors = self.base.face.color
+        df_outliers, is_inlier, values, codes = _split_outliers(
+            self._source, self._splitby, self._value, ratio
+        )
+        # for updating whiskers
+        agg_values = GroupedArray.from_codes(
+            values[is_inlier], codes[is_inlier], ngroups=_colors.shape[0]
+        ).quantile([0, 0.25, 0.5, 0.75, 1.0])
+        colors = _colors[codes[~is_inlier]]
 
         df_outliers = parse(df_outliers)
         xj = _jitter.UniformJitter(self._splitby, _pos_map, extent=_extent, seed=seed)
@@ -814,7 +846,7 @@ class DFBoxPlot(_BoxLikeWrapper[_lg.BoxPlot, _DF], Generic[_DF]):
         )  # fmt: skip
         if color is None:
             if is_edge_only:  # edge only
-                new._apply_color(np.stack(colors, axis=0, dtype=np.float32))
+                new._apply_color(colors.astype(np.float32))
             new.as_edge_only(width=self.base.edge.width.mean())
         if update_whiskers:
             self.base._update_data(agg_values)
@@ -843,31 +875,43 @@ class DFBoxPlot(_BoxLikeWrapper[_lg.BoxPlot, _DF], Generic[_DF]):
         return _BoxLikeMixin._as_legend_item(self)
 
 
+def _default_est_func(x: GroupedArray):
+    return x.mean()
+
+
+def _default_err_func(x: GroupedArray):
+    _mean = x.mean()
+    _sd = x.std(ddof=1)
+    return _mean - _sd, _mean + _sd
+
+
 class _EstimatorWrapper(_BoxLikeWrapper[_L, _DF]):
+    # last functions used for estimation, re-used when the source is updated
+    _est_func = staticmethod(_default_est_func)
+    _err_func = staticmethod(_default_err_func)
+
     def est_by_mean(self) -> Self:
         """Set estimator to mean."""
 
-        def est_func(x: np.ndarray):
-            return np.mean(x)
+        def est_func(x: GroupedArray):
+            return x.mean()
 
         return self._update_estimate(est_func)
 
     def est_by_median(self) -> Self:
         """Set estimator to median."""
 
-        def est_func(x: np.ndarray):
-            return np.median(x)
+        def est_func(x: GroupedArray):
+            return x.median()
 
         return self._update_estimate(est_func)
 
     def err_by_sd(self, scale: float = 1.0, *, ddof: int = 1) -> Self:
         """Set error to standard deviation."""
 
-        def err_func(x: np.ndarray):
-            _mean = np.mean(x)
-            if x.size <= ddof:
-                return _mean, _mean
-            _sd = np.std(x, ddof=ddof) * scale
+        def err_func(x: GroupedArray):
+            _mean = x.mean()
+            _sd = x.std(ddof=ddof) * scale
             return _mean - _sd, _mean + _sd
 
         return self._update_error(err_func)
@@ -875,11 +919,9 @@ class _EstimatorWrapper(_BoxLikeWrapper[_L, _DF]):
     def err_by_se(self, scale: float = 1.0, *, ddof: int = 1) -> Self:
         """Set error to standard error."""
 
-        def err_func(x: np.ndarray):
-            _mean = np.mean(x)
-            if x.size <= ddof:
-                return _mean, _mean
-            _er = np.std(x, ddof=ddof) / np.sqrt(len(x)) * scale
+        def err_func(x: GroupedArray):
+            _mean = x.mean()
+            _er = x.sem(ddof=ddof) * scale
             return _mean - _er, _mean + _er
 
         return self._update_error(err_func)
@@ -893,32 +935,73 @@ class _EstimatorWrapper(_BoxLikeWrapper[_L, _DF]):
         elif high < 0 or high > 1:
             raise ValueError(f"Quantile must be between 0 and 1, got {high}")
 
-        def err_func(x):
-            _qnt = np.quantile(x, [low, high])
+        def err_func(x: GroupedArray):
+            _qnt = x.quantile([low, high])
             return _qnt[0], _qnt[1]
 
         return self._update_error(err_func)
 
-    def _update_estimate(self, est_func: Callable[[np.ndarray], float]) -> Self:
-        arrays = self._get_arrays()
-        est = [est_func(arr) for arr in arrays]
+    def err_by_bootstrap(
+        self,
+        n_boot: int = 10000,
+        ci: float = 0.95,
+        *,
+        estimator: Literal["mean", "median"] = "mean",
+        seed: int | None = 0,
+        n_workers: int | None = None,
+    ) -> Self:
+        """
+        Set error to the bootstrap confidence interval.
+
+        Parameters
+        ----------
+        n_boot : int, default 10000
+            Number of bootstrap resamples for each category.
+        ci : float, default 0.95
+            Confidence level of the interval.
+        estimator : "mean" or "median", default "mean"
+            Statistic to be bootstrapped. This should usually match the estimator.
+        seed : int, optional
+            Random seed. Each category uses an independent random stream derived
+            from this seed, so the result is reproducible.
+        n_workers : int, optional
+            If given, categories are distributed over a process pool of this size.
+        """
+
+        def err_func(x: GroupedArray):
+            return x.bootstrap(
+                n_boot, ci, estimator=estimator, seed=seed, n_workers=n_workers
+            )
+
+        return self._update_error(err_func)
+
+    def _update_estimate(self, est_func: Callable[[GroupedArray], np.ndarray]) -> Self:
+        est = est_func(self._get_grouped())
         self._set_estimation_values(est)
+        self._est_func = est_func
         return self
 
     def _update_error(
         self,
-        err_func: Callable[[np.ndarray], tuple[float, float]],
+        err_func: Callable[[GroupedArray], tuple[np.ndarray, np.ndarray]],
     ) -> Self:
-        arrays = self._get_arrays()
-        err_low = []
-        err_high = []
-        for arr in arrays:
-            low, high = err_func(arr)
-            err_low.append(low)
-            err_high.append(high)
+        err_low, err_high = err_func(self._get_grouped())
         self._set_error_values(err_low, err_high)
+        self._err_func = err_func
         return self
 
+    def _update_arrays(self, arrays: list[np.ndarray]) -> None:
+        self._arrays = arrays
+        self._grouped = None
+        self._update_estimate(self._est_func)
+        self._update_error(self._err_func)
+
+    def _get_grouped(self) -> GroupedArray:
+        """Return the (cached) grouped values for vectorized estimation."""
+        if self._grouped is None:
+            self._grouped = GroupedArray.from_arrays(self._get_arrays())
+        return self._grouped
+
     @abstractmethod
     def _get_arrays(self) -> list[np.ndarray]: ...
     @abstractmethod
@@ -943,6 +1026,7 @@ class DFPointPlot(_EstimatorWrapper[_lg.LabeledPlot, _DF], Generic[_DF]):
             base, cat, categories, value, dodge, splitby, color_by, hatch_by
         )
         self._arrays: list[np.ndarray] | None = None  # cache of the arrays
+        self._grouped: GroupedArray | None = None  # cache of the grouped arrays
         self._orient = Orientation.VERTICAL
 
     @classmethod
@@ -1043,6 +1127,7 @@ class DFBarPlot(_EstimatorWrapper[_lg.LabeledBars, _DF], Generic[_DF]):
             base, cat, categories, value, dodge, splitby, color_by, hatch_by
         )
         self._arrays: list[np.ndarray] | None = None  # cache of the arrays
+        self._grouped: GroupedArray | None = None  # cache of the grouped arrays
 
     @classmethod
     def from_cat_iter(
@@ -1127,6 +1212,42 @@ class DFBarPlot(_EstimatorWrapper[_lg.LabeledBars, _DF], Generic[_DF]):
         return _BoxLikeMixin._as_legend_item(self)
 
 
+def _split_outliers(
+    df: DataFrameWrapper[_DF],
+    splitby: tuple[str, ...],
+    value: str,
+    ratio: float,
+) -> tuple[dict[str, list], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Split values into inliers and outliers by the interquartile range of each group.
+
+    Returns
+    -------
+    (dict, np.ndarray, np.ndarray, np.ndarray)
+        Dictionary of the outliers, boolean array of inliers, concatenated values
+        and the group codes of each value.
+    """
+    categories: list[tuple] = []
+    arrays: list[np.ndarray] = []
+    for sl, sub in df.group_by(splitby):
+        categories.append(sl)
+        arrays.append(np.asarray(sub[value]))
+    sizes = [arr.size for arr in arrays]
+    values = np.concatenate(arrays) if arrays else np.zeros(0)
+    codes = np.repeat(np.arange(len(arrays)), sizes)
+    q1, q3 = GroupedArray.from_arrays(arrays).quantile([0.25, 0.75])
+    iqr = q3 - q1  # interquartile range
+    low = (q1 - ratio * iqr)[codes]  # lower bound of inliers
+    high = (q3 + ratio * iqr)[codes]  # upper bound of inliers
+    is_inlier = (low <= values) & (values <= high)
+    out_codes = codes[~is_inlier]
+    df_outliers = {
+        _s: [categories[code][i] for code in out_codes] for i, _s in enumerate(splitby)
+    }
+    df_outliers[value] = values[~is_inlier]
+    return df_outliers, is_inlier, values, codes
+
+
 _L0 = TypeVar("_L0", bound=Layer)
 _L1 = TypeVar("_L1", bound=Layer)
 
@@ -54,6 +54,9 @@ class DFLines(_shared.DataFrameLayerWrapper[_lg.LineCollection, _DF], Generic[_D
         self._style_by = style_by
         self._categories = categories
         self._splitby = splitby
+        self._x_jitter: _jitter.JitterBase | None = None
+        self._y_jitter: _jitter.JitterBase | None = None
+        self._hover_template: str | None = None
         super().__init__(base, source)
         self.with_hover_template("\n".join(f"{k}: {{{k}!r}}" for k in self._splitby))
 
@@ -108,10 +111,12 @@ class DFLines(_shared.DataFrameLayerWrapper[_lg.LineCollection, _DF], Generic[_D
         for sl, sub in df.group_by(splitby):
             labels.append(sl)
             segs.append(np.column_stack([xj.map(sub), yj.map(sub)]))
-        return DFLines.from_arrays(
+        self = DFLines.from_arrays(
             df, segs, labels, name=name, color=color, width=width, style=style,
             backend=backend,
         )  # fmt: skip
+        self._x_jitter, self._y_jitter = xj, yj
+        return self
 
     @classmethod
     def from_dict(cls, d: dict[str, Any], backend: str | Backend | None = None) -> Self:
@@ -200,8 +205,48 @@ class DFLines(_shared.DataFrameLayerWrapper[_lg.LineCollection, _DF], Generic[_D
         for i, key in enumerate(self._splitby):
             extra[key] = [row[i] for row in self._categories]
         self.base.with_hover_template(template, extra=extra)
+        self._hover_template = template
         return self
 
+    def _update_source(self, df: DataFrameWrapper[_DF]) -> None:
+        if self._x_jitter is None or self._y_jitter is None:
+            raise NotImplementedError(
+                f"Cannot update the source of {type(self).__name__} that was not "
+                "created from a data frame."
+            )
+        segs: dict[tuple[Any, ...], np.ndarray] = {}
+        for sl, sub in df.group_by(self._splitby):
+            segs[sl] = np.column_stack(
+                [self._x_jitter.map(sub), self._y_jitter.map(sub)]
+            )
+        existing = set(self._categories)
+        new_categories = [sl for sl in segs if sl not in existing]
+        base = self._base_layer
+        for line, sl in zip(base, self._categories):
+            seg = segs.get(sl, np.zeros((0, 2)))
+            old_data = line.data
+            if (
+                old_data.x.size == seg.shape[0]
+                and np.array_equal(old_data.x, seg[:, 0].astype(old_data.x.dtype))
+                and np.array_equal(old_data.y, seg[:, 1].astype(old_data.y.dtype))
+            ):
+                continue  # this group is not affected
+            line.data = seg
+        if not new_categories:
+            return None
+        width = base.width[0] if len(base) > 0 else 1.0
+        for sl in new_categories:
+            line = _l.Line([], [], width=width, backend=base._backend_name)
+            line.data = segs[sl]
+            base.append(line)
+        self._categories = self._categories + new_categories
+        # category order is kept so that old categories keep the color and style
+        base.color = self._color_by.generate(self._categories, self._splitby)
+        base.style = self._style_by.generate(self._categories, self._splitby)
+        if self._hover_template is not None:
+            self.with_hover_template(self._hover_template)
+        return None
+
     def with_markers(
         self,
         *,
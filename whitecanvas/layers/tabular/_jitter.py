@@ -111,7 +111,8 @@ class SwarmJitter(CategoricalLikeJitter):
         dv = (vmax - vmin) / nbin
         # bin index that each value belongs to
         v_indices = np.floor((values - vmin) / dv).astype(np.int32)
-        v_indices[v_indices == nbin] = nbin - 1
+        # values may be out of the limits if the source was updated
+        v_indices = np.clip(v_indices, 0, nbin - 1)
 
         args = [src[b] for b in self._by]
         offset_pre = np.zeros(len(src), dtype=np.float32)
@@ -230,6 +230,9 @@ class DFMarkers(
         self._size_by = size_by
         self._symbol_by = symbol_by
         self._width_by = width_by
+        self._x_jitter: _jitter.JitterBase | None = None
+        self._y_jitter: _jitter.JitterBase | None = None
+        self._hover_template: str | None = None
         super().__init__(base, source)
 
     @classmethod
@@ -259,6 +262,7 @@ class DFMarkers(
             symbol_by=_p.SymbolPlan.default(),
             width_by=_p.WidthPlan.default(),
         )
+        self._x_jitter, self._y_jitter = x, y
         if color is not None:
             self._update_color_or_colormap(color)
         if hatch is not None:
@@ -463,8 +467,43 @@ class DFMarkers(
         """Set the hover tooltip template for the layer."""
         extra = dict(self._source.iter_items())
         self.base.with_hover_template(template, extra=extra)
+        self._hover_template = template
         return self
 
+    def _update_source(self, df: DataFrameWrapper[_DF]) -> None:
+        if self._x_jitter is None or self._y_jitter is None:
+            raise ValueError(
+                f"Cannot update the source of {type(self).__name__} that was not "
+                "created from a data frame."
+            )
+        base = self._base_layer
+        old = self._source
+        # current values are used for the properties with constant plans
+        face_color, edge_color = base.face.color, base.edge.color
+        size, width = base.size, base.edge.width
+        base._update_rows(
+            self._x_jitter.map(df),
+            self._y_jitter.map(df),
+            symbols=_remap(self._symbol_by, df, old, base.symbol),
+            hatches=_remap(self._hatch_by, df, old, base.face.hatch),
+        )
+        if base.ndata == 0:
+            return None
+        face_color = _remap(self._color_by, df, old, face_color)
+        edge_color = _remap(self._edge_color_by, df, old, edge_color)
+        base.face.color = _as_color_rows(face_color)
+        base.edge.color = _as_color_rows(edge_color)
+        base.size = np.asarray(_remap(self._size_by, df, old, size), dtype=np.float32)
+        base.edge.width = np.asarray(
+            _remap(self._width_by, df, old, width), dtype=np.float32
+        )
+        if (alpha_by := getattr(self, "_alpha_by", None)) is not None:
+            self._apply_alpha(alpha_by.map(df))
+        if self._hover_template is not None:
+            extra = dict(df.iter_items())
+            base.with_hover_template(self._hover_template, extra=extra)
+        return None
+
     def with_reg(
         self,
         *,
@@ -1198,6 +1237,31 @@ class DFRugGroups(DFRug[_DF]):
         return self
 
 
+def _remap(
+    plan: _p.CyclicPlan | _p.MapPlan,
+    df: DataFrameWrapper[_DF],
+    reference: DataFrameWrapper[_DF],
+    current: Sequence[Any],
+) -> Sequence[Any]:
+    """
+    Map the new data frame using the plan.
+
+    If the plan is constant, the current value of the layer is used, so that changes
+    made directly to the layer are kept.
+    """
+    if plan.is_const() and len(current) > 0:
+        return np.repeat(np.asarray(current)[:1], len(df), axis=0)
+    if isinstance(plan, _p.CyclicPlan):
+        return plan.remap(df, reference)
+    return plan.map(df)
+
+
+def _as_color_rows(colors: Sequence[Any]) -> NDArray[np.float32]:
+    if isinstance(colors, np.ndarray) and colors.dtype.kind == "f":
+        return colors.astype(np.float32, copy=False)
+    return np.stack([Color(c).rgba for c in colors], axis=0, dtype=np.float32)
+
+
 def default_template(it: Iterable[tuple[str, np.ndarray]], max_rows: int = 10) -> str:
     """
     Default template string for markers
@@ -10,6 +10,7 @@ from numpy.typing import NDArray
 from whitecanvas.canvas._palette import ColorPalette
 from whitecanvas.types import Hatch, LineStyle, Symbol
 from whitecanvas.utils.collections import OrderedSet
+from whitecanvas.utils.lut import map_colors
 from whitecanvas.utils.type_check import is_real_number
 
 if TYPE_CHECKING:
@@ -168,6 +169,36 @@ class CyclicPlan(CategoricalPlan[_V]):
             i += 1
         return out
 
+    def remap(
+        self,
+        values: DataFrameWrapper[_DF],  # the new data frame
+        reference: DataFrameWrapper[_DF],  # the data frame used so far
+    ) -> Sequence[_V]:
+        """
+        Map a new dataframe to values, keeping the values assigned to the categories
+        that already exist in the reference dataframe.
+        """
+        if not self._by:
+            return self.map(values)
+        lookup = dict(self.create_key_values(reference))
+        series = [values[k] for k in self._by]
+        out = self._empty_output(series[0].size)
+        i = len(lookup)
+        for row in OrderedSet(zip(*series)):
+            sl: NDArray[np.bool_] = np.all(
+                np.column_stack([a == b for a, b in zip(series, row)]), axis=1
+            )
+            if row in lookup:
+                val = lookup[row]
+            else:
+                val = self.values[i % len(self.values)]
+                i += 1
+            out[sl] = [val] * sl.sum()
+        return out
+
+    def _empty_output(self, size: int) -> np.ndarray:
+        return np.empty(size, dtype=object)
+
     def to_entries(self, df: DataFrameWrapper[_DF]) -> list[tuple[str, _V]]:
         """Prepare legend item entries."""
         if len(df) == 0:
@@ -334,6 +365,9 @@ class ColorPlan(CyclicPlan[Color]):
             return cls.from_const(colors[0])
         return cls(tuple(by), colors)
 
+    def _empty_output(self, size: int) -> np.ndarray:
+        return np.empty((size, 4), dtype=np.float32)
+
     # NOTE: Color instance is detected as a sequence of 4 floats
     #       so we need to override the default mapper
     def map(
@@ -353,8 +387,7 @@ class ColorPlan(CyclicPlan[Color]):
             )
             ntrue = sl.sum()
             if ntrue > 0:
-                val = self.values[i % len(self.values)]
-                out[sl] = [val] * ntrue
+                out[sl] = np.asarray(self.values[i % len(self.values)])
                 i += 1
         return out
 
@@ -554,7 +587,7 @@ class ColormapMap:
             return np.full((arr.size, 4), np.asarray(color))
         _arr = arr.clip(amin, amax)
         _arr[np.isnan(_arr)] = amin
-        return self._cmap((_arr - amin) / (amax - amin))
+        return map_colors(self._cmap, _arr, (amin, amax))
 
     def create_samples(self, values: dict[str, np.ndarray]) -> list[tuple[Color, _V]]:
         """Sample colors for the legends."""
@@ -28,6 +28,40 @@ class DataFrameLayerWrapper(LayerWrapper[_L], Generic[_L, _DF]):
         """The internal dataframe."""
         return self._source.get_native()
 
+    def update_source(self, source: _DF) -> Self:
+        """
+        Update the source data frame and re-plot the layer in place.
+
+        The plot plans (color, hatch, symbol etc.), the category order and the
+        backend objects of this layer are reused. Only the data that depend on the
+        new rows are recalculated.
+
+        >>> layer = canvas.cat_x(df, "x", "y").add_boxplot(color="c")
+        >>> layer.update_source(new_df)  # same columns, new rows
+
+        Only markers (including strip and swarm plots), lines, box plots, violin
+        plots, point plots and bar plots support this method. Other layers raise a
+        TypeError.
+
+        Parameters
+        ----------
+        source : data frame
+            New data frame. Must have the same columns used by this layer.
+        """
+        df = parse(source)
+        self._update_source(df)
+        self._source = df
+        if canvas := self._canvas_ref():
+            canvas._autoscale_for_layer(self, pad_rel=0.025)
+        return self
+
+    def _update_source(self, df: DataFrameWrapper[_DF]) -> None:
+        """Update the base layer for the new data frame."""
+        raise TypeError(
+            f"{type(self).__name__} does not support updating the source data frame. "
+            "Create a new layer instead."
+        )
+
     @classmethod
     def from_dict(cls, d: dict[str, Any], backend: Backend | str | None = None) -> Self:
         from whitecanvas.layers.tabular._df_compat import from_dict
@@ -32,6 +32,7 @@ from whitecanvas.types import (
 )
 from whitecanvas.utils.collections import OrderedSet
 from whitecanvas.utils.normalize import as_any_1d_array, as_color_array, parse_texts
+from whitecanvas.utils.template import HoverTexts
 from whitecanvas.utils.type_check import is_real_number
 
 if TYPE_CHECKING:
@@ -154,10 +155,7 @@ class AreaCollection(_lg.LayerCollection[_lg.Area]):
         # set default format keys
         if "i" not in params:
             params["i"] = np.arange(len(self))
-        texts = [
-            template.format(**{k: v[i] for k, v in params.items()})
-            for i in range(len(self))
-        ]
+        texts = HoverTexts(template, params, len(self))
         return self.with_hover_texts(texts)
 
 
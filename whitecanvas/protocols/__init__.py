@@ -17,6 +17,7 @@ from whitecanvas.protocols.layer_protocols import (
     LineProtocol,
     MarkersProtocol,
     MeshProtocol,
+    MultiBandProtocol,
     MultiLineProtocol,
     RangeDataProtocol,
     TextProtocol,
@@ -31,6 +32,7 @@ __all__ = [
     "MarkersProtocol",
     "BarProtocol",
     "BandProtocol",
+    "MultiBandProtocol",
     "ErrorbarProtocol",
     "TextProtocol",
     "ImageProtocol",
@@ -253,6 +253,17 @@ class BandProtocol(OrientedXYYDataProtocol, HasFaces, HasEdges, Protocol):
         """Set hover text to the band"""
 
 
+@runtime_checkable
+class MultiBandProtocol(
+    BaseProtocol, HasMultiFaces, HasMultiEdges, SupportsMouseEvents, Protocol
+):
+    def _plt_get_data(self) -> list[NDArray[np.number]]:
+        """Return the list of (N, 2) polygon vertices."""
+
+    def _plt_set_data(self, data: list[NDArray[np.number]]):
+        """Set the list of (N, 2) polygon vertices."""
+
+
 @runtime_checkable
 class ErrorbarProtocol(OrientedXYYDataProtocol, HasEdges, Protocol):
     def _plt_get_capsize(self) -> float:
@@ -1,5 +1,6 @@
 """Built-in tools."""
 
+from whitecanvas.tools._crossfilter import CrossFilter
 from whitecanvas.tools._selection import (
     lasso_selector,
     line_selector,
@@ -10,6 +11,7 @@ from whitecanvas.tools._selection import (
 )
 
 __all__ = [
+    "CrossFilter",
     "line_selector",
     "rect_selector",
     "xspan_selector",
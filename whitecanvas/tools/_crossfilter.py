@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING, TypeVar
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from psygnal import Signal
+
+from whitecanvas.layers import Layer, LayerWrapper, Markers
+from whitecanvas.layers._mixin import MultiFace
+from whitecanvas.tools._selection import LassoSelectionTool
+from whitecanvas.types import ColorType, MouseEvent, MouseEventType, XYData
+from whitecanvas.utils.normalize import as_color_array
+from whitecanvas.utils.throttle import Throttled
+
+if TYPE_CHECKING:
+    from whitecanvas.tools._selection import SelectionToolBase
+
+_L = TypeVar("_L", bound=Layer)
+
+
+class CrossFilter:
+    """
+    Linked selection of the rows shared by multiple layers.
+
+    Layers that show the same rows (such as markers of different columns of the same
+    data frame) are registered to a cross filter. When rows are selected, the faces
+    of the unselected rows are dimmed in all the linked layers.
+
+    >>> cf = CrossFilter(len(df))
+    >>> layer0 = cf.add_layer(canvas0.cat(df, "x", "y").add_markers())
+    >>> layer1 = cf.add_layer(canvas1.cat(df, "u", "v").add_markers())
+    >>> cf.connect_selector(tools.lasso_selector(canvas0), layer0)
+
+    Parameters
+    ----------
+    nrows : int
+        Number of the rows.
+    dim_alpha : float, default 0.2
+        Alpha multiplier of the unselected rows.
+    dim_color : color, optional
+        If given, unselected rows are colored by this color instead of being dimmed.
+    msec : int, default 16
+        Minimum interval of the layer updates driven by connected selectors in
+        milliseconds. Selections that come faster are merged, and the last one is
+        applied at most `msec` later in the event loop of the canvas (or immediately
+        on mouse release or by `flush()`). Set 0 to update the layers synchronously.
+        `select` and `clear` always update the layers immediately.
+    """
+
+    changed = Signal(object)
+    """Emitted with the boolean selection mask when the selection is updated."""
+
+    def __init__(
+        self,
+        nrows: int,
+        *,
+        dim_alpha: float = 0.2,
+        dim_color: ColorType | None = None,
+        msec: int = 16,
+    ):
+        if nrows < 0:
+            raise ValueError(f"nrows must be non-negative, got {nrows!r}.")
+        if not 0 <= dim_alpha <= 1:
+            raise ValueError(f"dim_alpha must be in [0, 1], got {dim_alpha!r}.")
+        self._nrows = nrows
+        self._dim_alpha = dim_alpha
+        if dim_color is None:
+            self._dim_color = None
+        else:
+            self._dim_color = as_color_array(dim_color, 1)[0]
+        # selection as packed bits, all the rows are selected by default
+        self._bits = np.packbits(np.ones(nrows, dtype=np.bool_))
+        self._target_bits = self._bits
+        self._links: list[_LinkedLayer] = []
+        self._msec = msec
+        self._throttles: list[Throttled] = []  # one for each connected selector
+
+    def __repr__(self) -> str:
+        nsel = int(self.selection.sum())
+        return (
+            f"{type(self).__name__}(nrows={self._nrows}, selected={nsel}, "
+            f"nlayers={len(self._links)})"
+        )
+
+    @property
+    def nrows(self) -> int:
+        """Number of the rows."""
+        return self._nrows
+
+    @property
+    def selection(self) -> NDArray[np.bool_]:
+        """Boolean mask of the selected rows."""
+        return np.unpackbits(self._target_bits, count=self._nrows).astype(np.bool_)
+
+    def select(self, rows: ArrayLike) -> None:
+        """
+        Select the rows.
+
+        Parameters
+        ----------
+        rows : array-like
+            Boolean mask of length `nrows` or integer indices of the rows.
+        """
+        self._set_target(rows)
+        self._apply_now()
+
+    def clear(self) -> None:
+        """Clear the selection, i.e. select all the rows."""
+        self._target_bits = np.packbits(np.ones(self._nrows, dtype=np.bool_))
+        self._apply_now()
+
+    def flush(self) -> None:
+        """Apply the pending selection of the selectors to the layers immediately."""
+        for throttled in self._throttles:
+            throttled.flush()
+
+    def add_layer(self, layer: _L, rows: ArrayLike | None = None) -> _L:
+        """
+        Link a layer to the cross filter.
+
+        Parameters
+        ----------
+        layer : Layer
+            Layer with face colors of each data point, such as `Markers`, `Bars` or
+            data frame layers built on them.
+        rows : array-like of int, optional
+            Row index of each data point of the layer. Data points are assumed to be
+            the rows in the same order if not given.
+        """
+        link = _LinkedLayer(layer, rows, self._nrows)
+        link.update(np.arange(self._nrows), self.selection, self)
+        self._links.append(link)
+        return layer
+
+    def remove_layer(self, layer: Layer) -> None:
+        """Unlink a layer and restore its face colors."""
+        for i, link in enumerate(self._links):
+            if link.layer is layer:
+                link.restore()
+                self._links.pop(i)
+                return None
+        raise ValueError(f"{layer!r} is not linked to the cross filter.")
+
+    def connect_selector(
+        self,
+        tool: SelectionToolBase,
+        layer: Layer,
+    ) -> SelectionToolBase:
+        """
+        Select the rows of the data points of `layer` inside the selection of `tool`.
+
+        Clearing the selection of the tool also clears the cross filter.
+        """
+        link = self._find_link(layer)
+        target = _face_layer(layer)
+        canvas = tool._canvas()
+        if self._msec > 0:
+            apply = Throttled(
+                self._apply_now, msec=self._msec, call_later=canvas.mouse._call_later
+            )
+            self._throttles.append(apply)
+        else:
+            apply = self._apply_now
+
+        def _on_changed(*_):
+            if isinstance(target, Markers) and isinstance(tool, LassoSelectionTool):
+                inside = tool.contains_points(target)  # use the spatial index
+            else:
+                inside = tool.contains_points(_as_xydata(target))
+            self._set_target(link.rows[inside])
+            apply()
+
+        def _flush_on_mouse_event(ev: MouseEvent):
+            # the final selection is emitted on release
+            if ev.type is not MouseEventType.MOVE:
+                apply.flush()
+
+        tool.changed.connect(_on_changed)
+        tool.cleared.connect(self.clear)
+        if isinstance(apply, Throttled):
+            # connected after the tool, so that it is called after the tool callback
+            canvas.mouse.moved.connect(_flush_on_mouse_event, msec=0)
+        return tool
+
+    def _find_link(self, layer: Layer) -> _LinkedLayer:
+        for link in self._links:
+            if link.layer is layer:
+                return link
+        raise ValueError(f"{layer!r} is not linked. Call `add_layer` first.")
+
+    def _set_target(self, rows: ArrayLike) -> None:
+        rows = np.asarray(rows)
+        if rows.dtype == np.bool_:
+            if rows.shape != (self._nrows,):
+                raise ValueError(
+                    f"Boolean mask must have shape ({self._nrows},), got {rows.shape}."
+                )
+            mask = rows
+        else:
+            mask = np.zeros(self._nrows, dtype=np.bool_)
+            mask[rows.astype(np.intp, copy=False)] = True
+        self._target_bits = np.packbits(mask)
+
+    def _apply_now(self) -> None:
+        target = self._target_bits
+        diff = np.unpackbits(self._bits ^ target, count=self._nrows)
+        changed_rows = np.flatnonzero(diff)
+        if changed_rows.size == 0:
+            return None
+        selection = np.unpackbits(target, count=self._nrows).astype(np.bool_)
+        for link in self._links:
+            link.update(changed_rows, selection, self)
+        self._bits = target
+        self.changed.emit(selection)
+        return None
+
+
+class _LinkedLayer:
+    def __init__(self, layer: Layer, rows: ArrayLike | None, nrows: int):
+        self._layer_ref = weakref.ref(layer)
+        target = _face_layer(layer)
+        if hasattr(target, "with_face_multi") and not isinstance(
+            target.face, MultiFace
+        ):
+            target.with_face_multi()
+        ndata = target.ndata
+        if rows is None:
+            if ndata != nrows:
+                raise ValueError(
+                    f"Layer has {ndata} data points but the cross filter has {nrows} "
+                    "rows. Specify the row index of each data point by `rows`."
+                )
+            self.rows = np.arange(nrows)
+            self._identity = True
+        else:
+            self.rows = np.asarray(rows, dtype=np.intp)
+            if self.rows.shape != (ndata,):
+                raise ValueError(f"rows must have shape ({ndata},).")
+            if self.rows.size > 0 and (self.rows.min() < 0 or self.rows.max() >= nrows):
+                raise ValueError("rows out of range.")
+            self._identity = False
+            # sorted rows for looking up the data points of the changed rows
+            self._order = np.argsort(self.rows, kind="stable")
+            self._sorted_rows = self.rows[self._order]
+        self._original = as_color_array(target.face.color, ndata).copy()
+        self._colors = self._original.copy()
+
+    @property
+    def layer(self) -> Layer | None:
+        return self._layer_ref()
+
+    def _points_of_rows(self, rows: NDArray[np.intp]) -> NDArray[np.intp]:
+        if self._identity:
+            return rows
+        start = np.searchsorted(self._sorted_rows, rows, side="left")
+        stop = np.searchsorted(self._sorted_rows, rows, side="right")
+        counts = stop - start
+        offsets = np.repeat(start - np.cumsum(counts) + counts, counts)
+        return self._order[np.arange(counts.sum()) + offsets]
+
+    def update(
+        self,
+        changed_rows: NDArray[np.intp],
+        selection: NDArray[np.bool_],
+        cf: CrossFilter,
+    ) -> None:
+        layer = self.layer
+        if layer is None:
+            return
+        points = self._points_of_rows(changed_rows)
+        if points.size == 0:
+            return
+        selected = selection[self.rows[points]]
+        colors = self._original[points].copy()
+        unsel = ~selected
+        if cf._dim_color is not None:
+            colors[unsel] = cf._dim_color
+        else:
+            colors[unsel, 3] *= cf._dim_alpha
+        self._colors[points] = colors
+        _face_layer(layer).face.color = self._colors
+
+    def restore(self) -> None:
+        if layer := self.layer:
+            _face_layer(layer).face.color = self._original
+
+
+def _face_layer(layer: Layer):
+    """The layer that has the face colors of each data point."""
+    while isinstance(layer, LayerWrapper):
+        layer = layer.base
+    if not hasattr(layer, "face") or not hasattr(layer, "ndata"):
+        raise TypeError(f"{layer!r} does not have face colors of each data point.")
+    return layer
+
+
+def _as_xydata(layer) -> XYData:
+    data = layer.data
+    if not isinstance(data, XYData):
+        raise TypeError(f"Cannot select data points of {layer!r} by a selector.")
+    return data
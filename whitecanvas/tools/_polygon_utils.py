@@ -1,27 +1,137 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import numpy as np
 from numpy.typing import NDArray
 
-# modified from: https://qiita.com/yamadasuzaku/items/b7482131a06759731b47
-
-
-def is_in_polygon(points: NDArray[np.number], poly: NDArray[np.number]):
-    num = poly.shape[0]
-    inside = np.full(points.shape[0], False, dtype=np.bool_)
-    xs = points[:, 0]
-    ys = points[:, 1]
-    p1x, p1y = poly[0]
-    for i in range(1, num + 1):
-        p2x, p2y = poly[i % num]
-        mask = (
-            (ys > min(p1y, p2y))
-            & (ys <= max(p1y, p2y))
-            & (xs <= max(p1x, p2x))
-            & (p1y != p2y)
-        )
-        xinters = (ys[mask] - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-        inside[mask] = np.logical_xor(inside[mask], xs[mask] < xinters)
-        p1x, p1y = p2x, p2y
+if TYPE_CHECKING:
+    from whitecanvas.utils.spatial import GridIndex
+
+# Even-odd rule with the ray cast to -x direction, as in
+# https://qiita.com/yamadasuzaku/items/b7482131a06759731b47
+# Points are sorted by y so that each edge only visits the points in its y-range.
+
+_MAX_PAIRS = 1 << 22  # maximum number of (edge, point) pairs processed at once
+
 
+def is_in_polygon(
+    points: NDArray[np.number],
+    poly: NDArray[np.number],
+    index: GridIndex | None = None,
+) -> NDArray[np.bool_]:
+    """
+    Check if each point is inside the polygon.
+
+    Parameters
+    ----------
+    points : (N, 2) array
+        Points to be tested.
+    poly : (M, 2) array
+        Vertices of the polygon. The last vertex is connected to the first one.
+    index : GridIndex, optional
+        Spatial index of the points. If given, it is used to find the points inside
+        the bounding box of the polygon.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    poly = np.asarray(poly, dtype=np.float64)
+    inside = np.zeros(points.shape[0], dtype=np.bool_)
+    if poly.shape[0] < 3 or points.shape[0] == 0:
+        return inside
+    (xmin, ymin), (xmax, ymax) = poly.min(axis=0), poly.max(axis=0)
+    if index is not None:
+        cand = index.query_rect(xmin, xmax, ymin, ymax)
+    else:
+        xs, ys = points[:, 0], points[:, 1]
+        cand = np.flatnonzero((xmin <= xs) & (xs <= xmax) & (ymin <= ys) & (ys <= ymax))
+    if cand.size == 0:
+        return inside
+    scan = _Scanline(points[cand])
+    inside[cand] = scan.crossings(poly, np.roll(poly, -1, axis=0))
     return inside
+
+
+class _Scanline:
+    """Points sorted by y, used to count the edge crossings of each point."""
+
+    def __init__(self, points: NDArray[np.float64]):
+        self._xs = points[:, 0]
+        self._ys = points[:, 1]
+        self._order = np.argsort(self._ys, kind="stable")
+        self._ys_sorted = self._ys[self._order]
+
+    def crossings(
+        self,
+        starts: NDArray[np.float64],
+        ends: NDArray[np.float64],
+    ) -> NDArray[np.bool_]:
+        """Parity of the number of edges (starts[i], ends[i]) crossed by each ray."""
+        parity = np.zeros(self._xs.size, dtype=np.bool_)
+        p1x, p1y = starts[:, 0], starts[:, 1]
+        p2x, p2y = ends[:, 0], ends[:, 1]
+        valid = p1y != p2y  # horizontal edges never cross
+        p1x, p1y, p2x, p2y = p1x[valid], p1y[valid], p2x[valid], p2y[valid]
+        # points with min(p1y, p2y) < y <= max(p1y, p2y)
+        lo = np.searchsorted(self._ys_sorted, np.minimum(p1y, p2y), side="right")
+        hi = np.searchsorted(self._ys_sorted, np.maximum(p1y, p2y), side="right")
+        counts = hi - lo
+        cum = np.cumsum(counts)
+        if cum.size == 0 or cum[-1] == 0:
+            return parity
+        dx, dy = p2x - p1x, p2y - p1y
+        # split the edges into chunks to limit the size of the temporary arrays
+        splits = np.searchsorted(cum, np.arange(_MAX_PAIRS, cum[-1], _MAX_PAIRS))
+        for edges in np.split(np.arange(counts.size), np.unique(splits + 1)):
+            if edges.size == 0:
+                continue
+            n_each = counts[edges]
+            edge_idx = np.repeat(edges, n_each)
+            offsets = np.repeat(lo[edges] - np.cumsum(n_each) + n_each, n_each)
+            pt = self._order[np.arange(edge_idx.size) + offsets]
+            dy_pt = self._ys[pt] - p1y[edge_idx]
+            xinters = dy_pt * dx[edge_idx] / dy[edge_idx] + p1x[edge_idx]
+            crossed = pt[self._xs[pt] < xinters]
+            parity ^= np.bincount(crossed, minlength=parity.size) % 2 == 1
+        return parity
+
+
+class PolygonContainment:
+    """
+    Containment of fixed points in a polygon that is being drawn.
+
+    Crossing parities are additive over the polygon edges, so that only the edges
+    that changed since the last update have to be processed. The closing edge (last
+    vertex to the first vertex) is added when `contains` is called.
+
+    >>> cont = PolygonContainment(points)
+    >>> cont.update(vertices)  # called whenever vertices are added or moved
+    >>> cont.contains()  # (N,) bool array
+    """
+
+    def __init__(self, points: NDArray[np.number]):
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        self._scan = _Scanline(points)
+        self._parity = np.zeros(points.shape[0], dtype=np.bool_)
+        self._vertices = np.zeros((0, 2), dtype=np.float64)
+
+    def update(self, vertices: NDArray[np.number]) -> None:
+        """Update the vertices of the (open) polygon."""
+        vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+        old = self._vertices
+        # length of the common prefix of the old and new vertices
+        nmin = min(old.shape[0], vertices.shape[0])
+        same = np.all(old[:nmin] == vertices[:nmin], axis=1)
+        nsame = nmin if same.all() else int(np.argmin(same))
+        # XOR is involutive; removing an edge is the same as adding it again
+        start = max(nsame - 1, 0)
+        for verts in (old[start:], vertices[start:]):
+            if verts.shape[0] > 1:
+                self._parity ^= self._scan.crossings(verts[:-1], verts[1:])
+        self._vertices = vertices
+
+    def contains(self) -> NDArray[np.bool_]:
+        """Return if each point is inside the polygon closed at this moment."""
+        if self._vertices.shape[0] < 3:
+            return np.zeros_like(self._parity)
+        closing = self._scan.crossings(self._vertices[-1:], self._vertices[:1])
+        return self._parity ^ closing
@@ -17,8 +17,8 @@ from numpy.typing import NDArray
 from psygnal import Signal
 
 from whitecanvas.canvas import CanvasBase
-from whitecanvas.layers import Layer, Line, Rects, Spans
-from whitecanvas.tools._polygon_utils import is_in_polygon
+from whitecanvas.layers import Layer, Line, Markers, Rects, Spans
+from whitecanvas.tools._polygon_utils import PolygonContainment, is_in_polygon
 from whitecanvas.types import (
     ColorType,
     LineStyle,
@@ -121,6 +121,7 @@ class SelectionToolBase(ABC, Generic[_L]):
             self.clear_selection()
         with canvas.autoscale_context(enabled=False):
             canvas.add_layer(self._layer)
+        canvas._set_animated(self._layer)
         dragged = False
         while e.type is not MouseEventType.RELEASE:
             self._update_layer(pos_start, e.pos)
@@ -387,6 +388,8 @@ class YSpanSelectionTool(_SpanSelectionTool):
 
 
 class LassoSelectionTool(LineSelectionTool):
+    _containment: PolygonContainment | None = None
+
     def _update_layer(
         self,
         start: tuple[float, float],
@@ -433,14 +436,65 @@ class LassoSelectionTool(LineSelectionTool):
         poly = self._layer.data
         return is_in_polygon(np.array([[x, y]]), poly.stack())[0]
 
-    def contains_points(self, points: XYData | NDArray[np.number]) -> NDArray[np.bool_]:
+    def contains_points(
+        self,
+        points: XYData | NDArray[np.number] | Markers,
+    ) -> NDArray[np.bool_]:
+        """
+        Return if each point is inside the lasso.
+
+        If a `Markers` layer is given, its data is tested using the spatial index of
+        the layer.
+        """
+        index = None
+        if isinstance(points, Markers):
+            index = points._get_spatial_index()
+            points = points.data
         points = _atleast_2d(points)
         poly = self._layer.data
         if points.ndim == 2 and points.shape[1] == 2:
-            return is_in_polygon(points, poly.stack())
+            return is_in_polygon(points, poly.stack(), index=index)
         else:
             raise ValueError("points must be (2,) or (N, 2) array.")
 
+    def track_points(self, points: XYData | NDArray[np.number] | Markers | None):
+        """
+        Track the containment of the points while the lasso is being drawn.
+
+        The containment is updated incrementally every time a vertex is added, so
+        that `tracked_points_inside` is cheap even for a large number of points.
+
+        >>> tool = lasso_selector(canvas)
+        >>> tool.track_points(markers)
+        >>> tool.changed.connect(lambda _: print(tool.tracked_points_inside()))
+
+        Parameters
+        ----------
+        points : (N, 2) array, XYData or Markers
+            Points to be tracked. Pass None to stop tracking.
+        """
+        if points is None:
+            self._containment = None
+            return
+        if isinstance(points, Markers):
+            points = points.data
+        points = _atleast_2d(points)
+        if points.ndim != 2 or points.shape[1] != 2:
+            raise ValueError("points must be (2,) or (N, 2) array.")
+        self._containment = PolygonContainment(points)
+        self._containment.update(self._layer.data.stack())
+        self._layer.events.data.connect(self._update_containment, unique=True)
+
+    def tracked_points_inside(self) -> NDArray[np.bool_]:
+        """Return if each of the tracked points is inside the lasso."""
+        if self._containment is None:
+            raise ValueError("No points are tracked. Call `track_points` first.")
+        return self._containment.contains()
+
+    def _update_containment(self, data: XYData):
+        if self._containment is not None:
+            self._containment.update(data.stack())
+
 
 class PolygonSelectionTool(LassoSelectionTool):
     def callback(self, e: MouseEvent):
@@ -458,6 +512,7 @@ class PolygonSelectionTool(LassoSelectionTool):
             return
         with canvas.autoscale_context(enabled=False):
             canvas.add_layer(self._layer)
+        canvas._set_animated(self._layer)
 
         while True:
             while e.type is not MouseEventType.RELEASE:
@@ -25,6 +25,7 @@ from whitecanvas.types._enums import (
     Symbol,
 )
 from whitecanvas.types._mouse import MouseEvent, Point
+from whitecanvas.types._packed import PackedLines
 from whitecanvas.types._tuples import (
     MeshData,
     Rect,
@@ -68,5 +69,6 @@ __all__ = [
     "XYZVectorData",
     "Rect",
     "MeshData",
+    "PackedLines",
     "_Void",
 ]
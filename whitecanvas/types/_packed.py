@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Sequence, overload
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+
+class PackedLines(Sequence[NDArray[np.number]]):
+    """
+    Lines of any lengths packed in one contiguous coordinate buffer.
+
+    The i-th line is ``coords[offsets[i]:offsets[i + 1]]``, which is a view of the
+    buffer. ``offsets`` starts with 0 and ends with the number of points. Used as
+    the data of MultiLine.
+    """
+
+    def __init__(self, coords: NDArray[np.number], offsets: NDArray[np.intp]):
+        if coords.ndim != 2:
+            raise ValueError(f"Expected coords to be (N, D), got {coords.shape}")
+        if offsets.ndim != 1 or offsets.size == 0:
+            raise ValueError("Offsets must be a non-empty 1D array")
+        if offsets[0] != 0 or offsets[-1] != coords.shape[0]:
+            raise ValueError("Offsets must start at 0 and end at the number of points")
+        self._coords = coords
+        self._offsets = offsets
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[ArrayLike], ndim: int = 2) -> PackedLines:
+        """Pack a list of (N, D) arrays."""
+        arrays = [np.asarray(line) for line in lines]
+        offsets = np.zeros(len(arrays) + 1, dtype=np.intp)
+        if len(arrays) == 0:
+            return cls(np.zeros((0, ndim)), offsets)
+        np.cumsum([arr.shape[0] for arr in arrays], out=offsets[1:])
+        return cls(np.concatenate(arrays, axis=0), offsets)
+
+    @classmethod
+    def from_array(cls, arr: NDArray[np.number]) -> PackedLines:
+        """Pack a (N, P, D) array of N lines with P points each without copying."""
+        nlines, npoints, ndim = arr.shape
+        offsets = np.arange(nlines + 1, dtype=np.intp) * npoints
+        return cls(arr.reshape(nlines * npoints, ndim), offsets)
+
+    @property
+    def coords(self) -> NDArray[np.number]:
+        """The (M, D) coordinates of all the points."""
+        return self._coords
+
+    @property
+    def offsets(self) -> NDArray[np.intp]:
+        """The (N + 1,) array of the start index of each line."""
+        return self._offsets
+
+    @property
+    def lengths(self) -> NDArray[np.intp]:
+        """Number of points of each line."""
+        return np.diff(self._offsets)
+
+    def read_only(self) -> PackedLines:
+        """Return a view of the data that cannot be modified in place."""
+        coords = self._coords.view()
+        coords.setflags(write=False)
+        offsets = self._offsets.view()
+        offsets.setflags(write=False)
+        return PackedLines(coords, offsets)
+
+    def as_array(self) -> NDArray[np.number] | None:
+        """Return a (N, P, D) view of the data if all the lines have P points."""
+        lengths = self.lengths
+        if lengths.size == 0 or np.any(lengths != lengths[0]):
+            return None
+        return self._coords.reshape(lengths.size, -1, self._coords.shape[1])
+
+    def __len__(self) -> int:
+        return self._offsets.size - 1
+
+    @overload
+    def __getitem__(self, key: int) -> NDArray[np.number]: ...
+    @overload
+    def __getitem__(self, key: slice) -> PackedLines: ...
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                lines = [self[i] for i in range(start, stop, step)]
+                return PackedLines.from_lines(lines, ndim=self._coords.shape[1])
+            stop = max(start, stop)
+            offsets = self._offsets[start : stop + 1]
+            coords = self._coords[offsets[0] : offsets[-1]]
+            return PackedLines(coords, offsets - offsets[0])
+        nlines = len(self)
+        if key < 0:
+            key += nlines
+        if not 0 <= key < nlines:
+            raise IndexError(f"Index {key} out of range for {nlines} lines")
+        return self._coords[self._offsets[key] : self._offsets[key + 1]]
+
+    def __iter__(self) -> Iterator[NDArray[np.number]]:
+        coords, offsets = self._coords, self._offsets
+        for i in range(offsets.size - 1):
+            yield coords[offsets[i] : offsets[i + 1]]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<{len(self)} lines, {self._coords.dtype}>)"
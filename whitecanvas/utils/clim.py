@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import math
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+def strided_sample(arr: NDArray[np.number], sample_size: int) -> NDArray[np.number]:
+    """
+    Sample about `sample_size` values from the array by a regular stride.
+
+    The same stride is used for all the axes, so that the sample is a view of the
+    array and no large temporary array is created.
+    """
+    if sample_size < 1:
+        raise ValueError(f"sample_size must be positive, got {sample_size!r}.")
+    if arr.size <= sample_size or arr.ndim == 0:
+        return arr
+    step = math.ceil((arr.size / sample_size) ** (1 / arr.ndim))
+    return arr[(slice(None, None, step),) * arr.ndim]
+
+
+def contrast_limits(
+    arr: NDArray[np.number],
+    percentiles: tuple[float, float] = (0.0, 100.0),
+    sample_size: int | None = None,
+) -> tuple[float, float]:
+    """
+    Calculate the contrast limits of an array ignoring NaN and infinity.
+
+    Parameters
+    ----------
+    arr : array
+        The data.
+    percentiles : (float, float), default (0, 100)
+        Percentiles of the lower and upper limits. (0, 100) is the min and max.
+    sample_size : int, optional
+        If given, the limits are calculated from a strided subsample of about this
+        size.
+    """
+    return stack_contrast_limits([arr], percentiles, sample_size)
+
+
+def stack_contrast_limits(
+    arrays: Sequence[NDArray[np.number]],
+    percentiles: tuple[float, float] = (0.0, 100.0),
+    sample_size: int | None = None,
+) -> tuple[float, float]:
+    """Calculate the contrast limits of all the arrays."""
+    low, high = percentiles
+    if not 0 <= low <= high <= 100:
+        raise ValueError(f"Invalid percentiles: {percentiles!r}.")
+    arrays = [np.asarray(a) for a in arrays if np.size(a) > 0]
+    if len(arrays) == 0:
+        return 0.0, 1.0
+    if sample_size is not None:
+        each = max(sample_size // len(arrays), 1)
+        arrays = [strided_sample(a, each) for a in arrays]
+    if low == 0 and high == 100:
+        mins, maxs = [], []
+        for arr in arrays:
+            if arr.dtype.kind == "f" and not (finite := np.isfinite(arr)).all():
+                values = arr[finite]
+                if values.size == 0:
+                    continue
+            else:
+                values = arr
+            mins.append(values.min())
+            maxs.append(values.max())
+        if len(mins) == 0:
+            return 0.0, 1.0
+        return float(min(mins)), float(max(maxs))
+    values = np.concatenate([np.ravel(a) for a in arrays])
+    if values.dtype.kind == "f":
+        values = values[np.isfinite(values)]
+    if values.size == 0:
+        return 0.0, 1.0
+    lo, hi = np.percentile(values, [low, high])
+    return float(lo), float(hi)
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+from typing import Literal, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+
+class GroupedArray:
+    """
+    Values of many 1D arrays packed into one buffer, sorted within each group.
+
+    All the reductions are calculated for every group at once using `reduceat` and
+    fancy indexing, so that the cost does not depend on the number of groups.
+
+    >>> grouped = GroupedArray.from_arrays([[3, 1, 2], [5, 4]])
+    >>> grouped.quantile([0, 0.5, 1])  # (3, 2) array
+    """
+
+    def __init__(self, values: NDArray[np.floating], offsets: NDArray[np.intp]):
+        self._values = values
+        self._offsets = offsets
+        self._sizes = np.diff(offsets)
+
+    @classmethod
+    def from_arrays(cls, arrays: Sequence[ArrayLike]) -> GroupedArray:
+        """Construct a grouped array from a list of 1D arrays."""
+        arrays = [np.asarray(arr, dtype=np.float64).ravel() for arr in arrays]
+        sizes = np.array([arr.size for arr in arrays], dtype=np.intp)
+        if len(arrays) == 0:
+            return cls(np.zeros(0, dtype=np.float64), np.zeros(1, dtype=np.intp))
+        values = np.concatenate(arrays)
+        codes = np.repeat(np.arange(len(arrays)), sizes)
+        return cls._from_sorted_codes(values, codes, sizes)
+
+    @classmethod
+    def from_codes(
+        cls,
+        values: ArrayLike,
+        codes: ArrayLike,
+        ngroups: int | None = None,
+    ) -> GroupedArray:
+        """
+        Construct a grouped array from a value array and its group codes.
+
+        Parameters
+        ----------
+        values : array-like
+            1D array of values.
+        codes : array-like of int
+            Group code (0, 1, 2, ...) of each value.
+        ngroups : int, optional
+            Number of groups. Inferred from the codes if not given.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        codes = np.asarray(codes, dtype=np.intp).ravel()
+        if values.shape != codes.shape:
+            raise ValueError(
+                f"Shape mismatch between values {values.shape} and codes {codes.shape}"
+            )
+        if ngroups is None:
+            ngroups = int(codes.max()) + 1 if codes.size > 0 else 0
+        sizes = np.bincount(codes, minlength=ngroups)
+        return cls._from_sorted_codes(values, codes, sizes)
+
+    @classmethod
+    def _from_sorted_codes(cls, values, codes, sizes) -> GroupedArray:
+        order = np.lexsort((values, codes))  # sort by code, then by value
+        offsets = np.zeros(sizes.size + 1, dtype=np.intp)
+        np.cumsum(sizes, out=offsets[1:])
+        return cls(values[order], offsets)
+
+    @property
+    def ngroups(self) -> int:
+        """Number of groups."""
+        return self._sizes.size
+
+    @property
+    def sizes(self) -> NDArray[np.intp]:
+        """Number of values in each group."""
+        return self._sizes
+
+    def split(self) -> list[NDArray[np.float64]]:
+        """Split into the (sorted) arrays of each group."""
+        return np.split(self._values, self._offsets[1:-1])
+
+    def _reduceat(self, ufunc: np.ufunc, values: NDArray, empty: float):
+        out = np.full(self.ngroups, empty, dtype=np.float64)
+        nonempty = self._sizes > 0
+        if nonempty.any():
+            out[nonempty] = ufunc.reduceat(values, self._offsets[:-1][nonempty])
+        return out
+
+    def sum(self) -> NDArray[np.float64]:
+        """Sum of each group."""
+        return self._reduceat(np.add, self._values, 0.0)
+
+    def mean(self) -> NDArray[np.float64]:
+        """Mean of each group."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.sum() / self._sizes
+
+    def std(self, ddof: int = 0) -> NDArray[np.float64]:
+        """Standard deviation of each group. Groups with size <= ddof will be 0."""
+        mean = self.mean()
+        dev = self._values - np.repeat(mean, self._sizes)
+        ssq = self._reduceat(np.add, dev * dev, 0.0)
+        dof = self._sizes - ddof
+        out = np.zeros(self.ngroups, dtype=np.float64)
+        valid = dof > 0
+        out[valid] = np.sqrt(ssq[valid] / dof[valid])
+        return out
+
+    def sem(self, ddof: int = 0) -> NDArray[np.float64]:
+        """Standard error of the mean of each group."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.std(ddof=ddof) / np.sqrt(self._sizes)
+
+    def min(self) -> NDArray[np.float64]:
+        """Minimum of each group."""
+        return self.quantile(0.0)
+
+    def max(self) -> NDArray[np.float64]:
+        """Maximum of each group."""
+        return self.quantile(1.0)
+
+    def median(self) -> NDArray[np.float64]:
+        """Median of each group."""
+        return self.quantile(0.5)
+
+    def quantile(self, q: float | ArrayLike) -> NDArray[np.float64]:
+        """
+        Quantiles of each group, using the same linear interpolation as `np.quantile`.
+
+        Returns
+        -------
+        np.ndarray
+            If `q` is a scalar, a (N,) array is returned. Otherwise, a (len(q), N)
+            array is returned, where N is the number of groups.
+        """
+        q_arr = np.asarray(q, dtype=np.float64)
+        if np.any((q_arr < 0) | (q_arr > 1)):
+            raise ValueError(f"Quantiles must be in the range [0, 1], got {q!r}.")
+        qs = np.atleast_1d(q_arr)[:, np.newaxis]
+        nonempty = self._sizes > 0
+        sizes = self._sizes[nonempty]
+        starts = self._offsets[:-1][nonempty]
+        pos = qs * (sizes - 1)
+        lower = np.floor(pos).astype(np.intp)
+        upper = np.minimum(lower + 1, sizes - 1)
+        frac = pos - lower
+        v0 = self._values[starts + lower]
+        v1 = self._values[starts + upper]
+        out = np.full((qs.shape[0], self.ngroups), np.nan, dtype=np.float64)
+        with np.errstate(invalid="ignore"):
+            out[:, nonempty] = np.where(frac == 0, v0, v0 + (v1 - v0) * frac)
+        # NaN is sorted to the end of each group; propagate it like `np.quantile`.
+        has_nan = self._reduceat(np.add, np.isnan(self._values), 0.0) > 0
+        out[:, has_nan] = np.nan
+        if q_arr.ndim == 0:
+            return out[0]
+        return out
+
+    def bootstrap(
+        self,
+        n_boot: int = 10000,
+        ci: float = 0.95,
+        *,
+        estimator: Literal["mean", "median"] = "mean",
+        seed: int | np.random.SeedSequence | None = None,
+        n_workers: int | None = None,
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Percentile bootstrap confidence interval of each group.
+
+        Resamples are drawn in vectorized batches. Each group has its own random
+        stream spawned from `seed`, so that the result does not depend on the number
+        of workers or the order of groups being processed.
+
+        Parameters
+        ----------
+        n_boot : int, default 10000
+            Number of bootstrap resamples for each group.
+        ci : float, default 0.95
+            Confidence level of the interval.
+        estimator : "mean" or "median", default "mean"
+            Statistic to be bootstrapped.
+        seed : int or SeedSequence, optional
+            Seed of the random number generator.
+        n_workers : int, optional
+            If given and larger than 1, groups are distributed over a process pool of
+            this size.
+
+        Returns
+        -------
+        (np.ndarray, np.ndarray)
+            Lower and upper bounds of the confidence interval.
+        """
+        if not 0 < ci < 1:
+            raise ValueError(f"`ci` must be between 0 and 1, got {ci!r}.")
+        if n_boot < 1:
+            raise ValueError(f"`n_boot` must be positive, got {n_boot!r}.")
+        if estimator not in ("mean", "median"):
+            raise ValueError(f"Unknown estimator {estimator!r}.")
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        seeds = seed.spawn(self.ngroups)
+        args = [
+            (arr, seeds[i], n_boot, ci, estimator) for i, arr in enumerate(self.split())
+        ]
+        if n_workers is not None and n_workers > 1 and self.ngroups > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                results = list(executor.map(_bootstrap_one, *zip(*args)))
+        else:
+            results = [_bootstrap_one(*arg) for arg in args]
+        if len(results) == 0:
+            return np.zeros(0), np.zeros(0)
+        low, high = np.array(results, dtype=np.float64).T
+        return low, high
+
+
+_BOOTSTRAP_BATCH_SIZE = 1 << 20  # maximum number of values sampled at once
+
+
+def _bootstrap_one(
+    values: NDArray[np.float64],
+    seed: np.random.SeedSequence,
+    n_boot: int,
+    ci: float,
+    estimator: str,
+) -> tuple[float, float]:
+    """Bootstrap confidence interval of a single group."""
+    size = values.size
+    if size == 0:
+        return np.nan, np.nan
+    if size == 1:
+        return values[0], values[0]
+    rng = np.random.default_rng(seed)
+    stats = np.empty(n_boot, dtype=np.float64)
+    batch = max(_BOOTSTRAP_BATCH_SIZE // size, 1)
+    for start in range(0, n_boot, batch):
+        stop = min(start + batch, n_boot)
+        resampled = values[rng.integers(0, size, size=(stop - start, size))]
+        if estimator == "mean":
+            stats[start:stop] = resampled.mean(axis=1)
+        else:
+            stats[start:stop] = np.median(resampled, axis=1)
+    alpha = (1 - ci) / 2
+    low, high = np.quantile(stats, [alpha, 1 - alpha])
+    return low, high
@@ -56,6 +56,35 @@ def get_hist_edges(
     return np.histogram_bin_edges(np.concatenate(arrays), bins, range)
 
 
+def bin_counts(
+    values: NDArray[np.number],
+    edges: NDArray[np.number],
+) -> NDArray[np.intp]:
+    """
+    Count the values in the bins of fixed edges.
+
+    This is same as `np.histogram(values, edges)[0]` but the edges are not validated
+    and the counting is done by `np.bincount`. Values outside the edges are ignored.
+    """
+    nbins = edges.size - 1
+    first, last = edges[0], edges[-1]
+    widths = np.diff(edges)
+    if np.allclose(widths, widths[0]):
+        # uniform bins, compute the indices directly as `np.histogram` does
+        values = values[(values >= first) & (values <= last)]
+        indices = ((values - first) * (nbins / (last - first))).astype(np.intp)
+        indices[indices == nbins] -= 1
+        # correct the floating point errors around the edges
+        indices[values < edges[indices]] -= 1
+        indices[(values >= edges[indices + 1]) & (indices != nbins - 1)] += 1
+    else:
+        indices = np.searchsorted(edges, values, side="right") - 1
+        # the last bin includes its right edge, as `np.histogram`
+        indices[values == last] = nbins - 1
+        indices = indices[(indices >= 0) & (indices < nbins)]
+    return np.bincount(indices, minlength=nbins)
+
+
 def histograms(
     arrays: list[NDArray[np.number]],
     bins: HistBinType,
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+if TYPE_CHECKING:
+    from cmap import Colormap
+
+LUT_SIZE = 1024  # number of the quantized colors of a colormap
+_MAX_CACHED = 64
+
+# id(cmap) -> (weakref to cmap, extended LUT)
+_LUT_CACHE: dict[int, tuple[weakref.ref[Colormap], NDArray[np.float32]]] = {}
+
+
+def _extended_lut(cmap: Colormap) -> NDArray[np.float32]:
+    """
+    The cached float32 LUT of [under, *colors, over, bad] of the colormap.
+
+    With this order, the floor of the scaled values clipped to [-1, LUT_SIZE] plus 1
+    is directly the index of the LUT.
+    """
+    key = id(cmap)
+    if (cached := _LUT_CACHE.get(key)) is not None and cached[0]() is cmap:
+        return cached[1]
+    lut = cmap.lut(LUT_SIZE, with_over_under=True)  # [*colors, under, over, bad]
+    ext = np.concatenate(
+        [lut[LUT_SIZE : LUT_SIZE + 1], lut[:LUT_SIZE], lut[LUT_SIZE + 1 :]],
+        axis=0,
+        dtype=np.float32,
+    )
+    ext.flags.writeable = False
+    if len(_LUT_CACHE) >= _MAX_CACHED:
+        _LUT_CACHE.pop(next(iter(_LUT_CACHE)))
+    _LUT_CACHE[key] = (weakref.ref(cmap, lambda _: _LUT_CACHE.pop(key, None)), ext)
+    return ext
+
+
+def colormap_lut(cmap: Colormap) -> NDArray[np.float32]:
+    """Return the cached (LUT_SIZE, 4) float32 lookup table of the colormap."""
+    return _extended_lut(cmap)[1 : LUT_SIZE + 1]
+
+
+def map_colors(
+    cmap: Colormap,
+    values: ArrayLike,
+    clim: tuple[float, float] | None = None,
+) -> NDArray[np.float32]:
+    """
+    Map values to RGBA colors using the cached LUT of the colormap.
+
+    If `clim` is not given, this is equivalent to `cmap(values, N=LUT_SIZE)` but
+    returns a float32 array. Values below 0, above 1 and NaN are mapped to the
+    under, over and bad colors.
+
+    Parameters
+    ----------
+    cmap : Colormap
+        The colormap.
+    values : array-like
+        Values to be mapped.
+    clim : (float, float), optional
+        Contrast limits. If given, values are normalized by the limits before mapping,
+        which is faster than normalizing them in advance.
+    """
+    ext = _extended_lut(cmap)
+    values = np.asarray(values)
+    dtype = np.float64 if values.dtype == np.float64 else np.float32
+    if clim is None:
+        scaled = np.multiply(values, LUT_SIZE, dtype=dtype)
+    else:
+        low, high = clim
+        scaled = np.subtract(values, low, dtype=dtype)
+        scaled *= LUT_SIZE / (high - low)
+    scaled[scaled == LUT_SIZE] = LUT_SIZE - 1  # 1.0 is not out of range
+    with np.errstate(invalid="ignore"):
+        np.floor(scaled, out=scaled)
+        np.clip(scaled, -1, LUT_SIZE, out=scaled)
+        scaled += 1
+        index = scaled.astype(np.intp)
+    if values.dtype.kind == "f" and (isnan := np.isnan(scaled)).any():
+        index[isnan] = LUT_SIZE + 2
+    return ext.take(index, axis=0)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import base64
+from functools import lru_cache
 from typing import Any, Mapping
 
 import numpy as np
@@ -91,6 +92,8 @@ def normalize_xyz(
 
 def arr_color(color) -> np.ndarray:
     """Normalize a color input to a 4-element float array."""
+    if isinstance(color, str):
+        return np.array(_str_to_rgba(color), dtype=np.float32)
     try:
         c = Color(color)
     except Exception:
@@ -98,6 +101,68 @@ def arr_color(color) -> np.ndarray:
     return np.array(c.rgba, dtype=np.float32)
 
 
+@lru_cache(maxsize=1024)
+def _str_to_rgba(color: str) -> tuple[float, float, float, float]:
+    """Cached conversion of a color name or a hex code to RGBA."""
+    try:
+        c = Color(color)
+    except Exception:
+        raise ValueError(f"Invalid input for a color: {color!r}") from None
+    return tuple(c.rgba)
+
+
+def _hex_table() -> NDArray[np.int16]:
+    table = np.full(128, -1, dtype=np.int16)
+    for i, char in enumerate("0123456789abcdef"):
+        table[ord(char)] = table[ord(char.upper())] = i
+    return table
+
+
+_HEX_TABLE = _hex_table()
+
+
+def _parse_hex_array(color: NDArray[np.str_]) -> NDArray[np.float32] | None:
+    """
+    Parse an array of "#RRGGBB" or "#RRGGBBAA" strings at once.
+
+    None is returned if any of the strings is not in these formats.
+    """
+    nchars = color.dtype.itemsize // 4
+    if nchars not in (7, 9) or color.ndim != 1:
+        return None
+    codes = np.ascontiguousarray(color).view(np.uint32).reshape(color.size, nchars)
+    lengths = np.count_nonzero(codes, axis=1)
+    if np.any(codes[:, 0] != ord("#")) or np.any((lengths != 7) & (lengths != 9)):
+        return None
+    digits = codes[:, 1:]
+    if np.any(digits >= 128):
+        return None
+    values = _HEX_TABLE[digits]
+    values[lengths == 7, 6:] = 15  # alpha is not given
+    if np.any(values < 0):
+        return None
+    rgba = (values[:, 0::2] * 16 + values[:, 1::2]).astype(np.float32)
+    if rgba.shape[1] == 3:
+        rgba = np.column_stack([rgba, np.full(color.size, 255, dtype=np.float32)])
+    return rgba / np.float32(255)
+
+
+def _as_color_array_from_objects(color: NDArray[Any]) -> NDArray[np.float32]:
+    """Convert an array of color-like objects into a (N, 4) array."""
+    if color.dtype.kind == "U" and color.size > 0 and color[0].startswith("#"):
+        if (out := _parse_hex_array(color)) is not None:
+            return out
+    values = color.tolist()
+    try:
+        # colors are usually repeated, such as the colors of categories
+        unique = {c: i for i, c in enumerate(dict.fromkeys(values))}
+    except TypeError:  # unhashable
+        return np.stack([arr_color(each) for each in values], axis=0)
+    table = np.stack([arr_color(each) for each in unique], axis=0)
+    indices = np.fromiter(map(unique.__getitem__, values), np.intp, len(values))
+    return table[indices]
+
+
 def hex_color(color) -> str:
     """Normalize a color input to a #RRGGBBAA string."""
     return Color(color).hex
@@ -108,6 +173,27 @@ def rgba_str_color(color) -> str:
     return Color(color).rgba_string
 
 
+def hex_colors(color) -> list[str]:
+    """Normalize a (N, 4) color array to a list of #RRGGBBAA strings."""
+    return _map_unique_rows(hex_color, color)
+
+
+def rgba_str_colors(color) -> list[str]:
+    """Normalize a (N, 4) color array to a list of rgba(r, g, b, a) strings."""
+    return _map_unique_rows(rgba_str_color, color)
+
+
+def _map_unique_rows(func, color) -> list[str]:
+    """Apply `func` only once for each unique row of the color array."""
+    arr = np.asarray(color)
+    if arr.ndim != 2:
+        return [func(c) for c in color]
+    keys = list(map(tuple, arr.tolist()))
+    row_of_key = dict(zip(keys, range(len(keys))))
+    converted = {key: func(arr[i]) for key, i in row_of_key.items()}
+    return list(map(converted.__getitem__, keys))
+
+
 def as_any_1d_array(x: Any, size: int, dtype=None) -> np.ndarray:
     if _tc.is_not_array(x):
         out = np.full((size,), x, dtype=dtype)
@@ -119,6 +205,12 @@ def as_any_1d_array(x: Any, size: int, dtype=None) -> np.ndarray:
 
 
 def as_color_array(color, size: int) -> NDArray[np.float32]:
+    if (
+        isinstance(color, np.ndarray)
+        and color.dtype == np.float32
+        and color.shape == (size, 4)
+    ):
+        return color  # already normalized
     if isinstance(color, str):  # e.g. color = "black"
         col = arr_color(color)
         return np.repeat(col[np.newaxis, :], size, axis=0)
@@ -130,7 +222,7 @@ def as_color_array(color, size: int) -> NDArray[np.float32]:
                 raise ValueError(
                     f"Expected color array of shape ({size},), got {color.shape}"
                 )
-            return np.stack([arr_color(each) for each in color], axis=0)
+            return _as_color_array_from_objects(color)
         elif color.shape in [(3,), (4,)]:
             col = arr_color(color)
             return np.repeat(col[np.newaxis, :], size, axis=0)
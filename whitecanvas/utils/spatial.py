@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+_POINTS_PER_CELL = 4  # average number of points in a grid cell
+
+
+class GridIndex:
+    """
+    Uniform grid index of 2D points for fast rectangle and nearest-point queries.
+
+    Points are bucketed into the cells of a regular grid and sorted by the cell ID,
+    so that the points of a rectangular block of cells can be collected by one slice
+    per grid row. Building the index is O(N log N) and queries only touch the cells
+    around the query region.
+
+    >>> index = GridIndex(xdata, ydata)
+    >>> index.query_rect(0, 1, 0, 1)  # indices of points in [0, 1] x [0, 1]
+    >>> index.nearest(0.5, 0.5, k=3)  # indices and distances of the 3 nearest
+    """
+
+    def __init__(self, xdata: ArrayLike, ydata: ArrayLike):
+        x = np.asarray(xdata, dtype=np.float64).ravel()
+        y = np.asarray(ydata, dtype=np.float64).ravel()
+        if x.shape != y.shape:
+            raise ValueError(f"Shape mismatch between x {x.shape} and y {y.shape}")
+        self._x = x
+        self._y = y
+        valid = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+        if valid.size == 0:
+            self._x0 = self._y0 = 0.0
+            self._dx = self._dy = 1.0
+            self._nx = self._ny = 1
+        else:
+            xv, yv = x[valid], y[valid]
+            self._x0, x1 = float(xv.min()), float(xv.max())
+            self._y0, y1 = float(yv.min()), float(yv.max())
+            width, height = x1 - self._x0, y1 - self._y0
+            ncells = max(valid.size // _POINTS_PER_CELL, 1)
+            if width > 0 and height > 0:
+                ratio = width / height
+                nx = math.sqrt(ncells * ratio)
+                ny = math.sqrt(ncells / ratio)
+            elif width > 0:
+                nx, ny = ncells, 1
+            elif height > 0:
+                nx, ny = 1, ncells
+            else:
+                nx, ny = 1, 1
+            self._nx = int(min(max(round(nx), 1), ncells))
+            self._ny = int(min(max(round(ny), 1), ncells))
+            # make the cells slightly larger so that the max value is in the last cell
+            self._dx = width / self._nx * (1 + 1e-9) or 1.0
+            self._dy = height / self._ny * (1 + 1e-9) or 1.0
+        ix = self._cell_x(x[valid])
+        iy = self._cell_y(y[valid])
+        cell_ids = iy * self._nx + ix
+        order = np.argsort(cell_ids, kind="stable")
+        self._indices = valid[order]
+        counts = np.bincount(cell_ids, minlength=self._nx * self._ny)
+        self._cell_starts = np.zeros(counts.size + 1, dtype=np.intp)
+        np.cumsum(counts, out=self._cell_starts[1:])
+
+    @property
+    def size(self) -> int:
+        """Number of indexed points."""
+        return self._x.size
+
+    def _cell_x(self, x) -> NDArray[np.intp]:
+        ix = np.floor((np.asarray(x) - self._x0) / self._dx)
+        return np.clip(ix, 0, self._nx - 1).astype(np.intp)
+
+    def _cell_y(self, y) -> NDArray[np.intp]:
+        iy = np.floor((np.asarray(y) - self._y0) / self._dy)
+        return np.clip(iy, 0, self._ny - 1).astype(np.intp)
+
+    def _candidates(self, ix0: int, ix1: int, iy0: int, iy1: int) -> NDArray[np.intp]:
+        """Indices of the points in the block of cells [ix0, ix1] x [iy0, iy1]."""
+        rows = np.arange(iy0, iy1 + 1) * self._nx
+        starts = self._cell_starts[rows + ix0]
+        stops = self._cell_starts[rows + ix1 + 1]
+        if rows.size == 1:
+            return self._indices[starts[0] : stops[0]]
+        return np.concatenate(
+            [self._indices[start:stop] for start, stop in zip(starts, stops)]
+        )
+
+    def query_rect(
+        self,
+        left: float,
+        right: float,
+        bottom: float,
+        top: float,
+    ) -> NDArray[np.intp]:
+        """Return the sorted indices of the points inside the rectangle."""
+        if left > right or bottom > top or self._indices.size == 0:
+            return np.zeros(0, dtype=np.intp)
+        ix0, ix1 = self._cell_x([left, right])
+        iy0, iy1 = self._cell_y([bottom, top])
+        cand = self._candidates(ix0, ix1, iy0, iy1)
+        xc, yc = self._x[cand], self._y[cand]
+        inside = (left <= xc) & (xc <= right) & (bottom <= yc) & (yc <= top)
+        return np.sort(cand[inside])
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        k: int = 1,
+        max_dist: float = np.inf,
+    ) -> tuple[NDArray[np.intp], NDArray[np.float64]]:
+        """
+        Find the k nearest points from (x, y).
+
+        Parameters
+        ----------
+        x, y : float
+            Coordinates of the query point.
+        k : int, default 1
+            Maximum number of points to return.
+        max_dist : float, optional
+            Points farther than this distance are not returned.
+
+        Returns
+        -------
+        (np.ndarray, np.ndarray)
+            Indices and distances of the points, sorted by the distance.
+        """
+        if k < 1:
+            raise ValueError(f"k must be positive, got {k!r}.")
+        empty = np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.float64)
+        if self._indices.size == 0 or not (np.isfinite(x) and np.isfinite(y)):
+            return empty
+        ix = int(self._cell_x(x))
+        iy = int(self._cell_y(y))
+        cell_size = min(self._dx, self._dy)
+        max_radius = max(ix, self._nx - 1 - ix, iy, self._ny - 1 - iy)
+        radius = 0
+        while True:
+            # all the points outside the block are farther than radius * cell_size
+            cand = self._candidates(
+                max(ix - radius, 0), min(ix + radius, self._nx - 1),
+                max(iy - radius, 0), min(iy + radius, self._ny - 1),
+            )  # fmt: skip
+            covered = radius * cell_size
+            if radius >= max_radius or covered >= max_dist:
+                break
+            if cand.size >= k:
+                dist = np.hypot(self._x[cand] - x, self._y[cand] - y)
+                if np.partition(dist, k - 1)[k - 1] <= covered:
+                    break
+            # grow the block exponentially to keep the number of iterations small
+            radius = min(max(radius * 2, 1), max_radius)
+        dist = np.hypot(self._x[cand] - x, self._y[cand] - y)
+        valid = dist <= max_dist
+        cand, dist = cand[valid], dist[valid]
+        order = np.lexsort((cand, dist))[:k]
+        return cand[order], dist[order]
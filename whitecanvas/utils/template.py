@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import operator
+import string
+from typing import Any, Iterator, Mapping, Sequence, overload
+
+import numpy as np
+from numpy.typing import NDArray
+
+_FORMATTER = string.Formatter()
+
+
+class HoverTexts(Sequence[str]):
+    """
+    Hover texts of data points, formatted from a template on demand.
+
+    Backends that look up the hovered data point themselves only index this object,
+    so that only the hovered row is formatted. Iterating over it (or calling
+    `to_list`) formats all the rows at once by `format_template`.
+
+    >>> texts = HoverTexts("x={x:.2f}", {"x": np.arange(3)}, 3)
+    >>> texts[1]  # "x=1.00"
+    >>> list(texts)  # ["x=0.00", "x=1.00", "x=2.00"]
+    """
+
+    def __init__(self, template: str, params: Mapping[str, Any], size: int):
+        self._template = template
+        self._params = {k: _as_param_array(v) for k, v in params.items()}
+        self._size = size
+        if size > 0:
+            self[0]  # dry run to raise missing keys or invalid format specs
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._template!r}, size={self._size})"
+
+    def __len__(self) -> int:
+        return self._size
+
+    @overload
+    def __getitem__(self, key: int) -> str: ...
+    @overload
+    def __getitem__(self, key: slice | NDArray[np.integer]) -> HoverTexts: ...
+
+    def __getitem__(self, key):
+        if isinstance(key, (slice, np.ndarray, list)):
+            if not isinstance(key, slice):
+                key = np.asarray(key)
+            params = {k: v[key] for k, v in self._params.items()}
+            size = np.arange(self._size)[key].size
+            return HoverTexts(self._template, params, size)
+        index = operator.index(key)
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(f"Index {key} out of range for size {self._size}.")
+        return self._template.format(**{k: v[index] for k, v in self._params.items()})
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_list())
+
+    @property
+    def template(self) -> str:
+        """The template string."""
+        return self._template
+
+    def to_list(self) -> list[str]:
+        """Format all the rows."""
+        return format_template(self._template, self._params, self._size)
+
+
+def format_template(
+    template: str,
+    params: Mapping[str, Any],
+    size: int,
+) -> list[str]:
+    """
+    Format a template for each row of the parameters.
+
+    The result is the same as `[template.format(**{k: v[i] ...}) for i in ...]`, but
+    the template is parsed only once and each field is converted column-wise.
+    """
+    fields = _parse_fields(template)
+    if fields is None:  # not supported, fall back to row-wise formatting
+        _params = {k: _as_param_array(v) for k, v in params.items()}
+        return [
+            template.format(**{k: v[i] for k, v in _params.items()})
+            for i in range(size)
+        ]
+    positional, keys = fields
+    if not keys:
+        return [positional.format()] * size
+    columns = [_column_values(params[key], conv) for key, conv in keys]
+    return list(map(positional.format, *columns))
+
+
+def _parse_fields(template: str) -> tuple[str, list[tuple[str, str | None]]] | None:
+    """
+    Convert a template into the one with auto-numbered fields.
+
+    For example, "x={x:.2f}, y={y!r}" is converted to "x={:.2f}, y={!r}" and the keys
+    [("x", None), ("y", "r")]. None is returned if the template cannot be converted.
+    """
+    pieces: list[str] = []
+    keys: list[tuple[str, str | None]] = []
+    for literal, field_name, spec, conv in _FORMATTER.parse(template):
+        pieces.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field_name is None:
+            continue
+        if spec and "{" in spec:  # nested fields
+            return None
+        key, sep, rest = field_name.partition(".")
+        if "[" in key:
+            key, bracket, after = key.partition("[")
+            rest = bracket + after + sep + rest
+            sep = ""
+        if not key.isidentifier():
+            return None
+        field = "{" + sep + rest
+        if conv is not None:
+            field += "!" + conv
+        if spec:
+            field += ":" + spec
+        pieces.append(field + "}")
+        keys.append((key, conv))
+    return "".join(pieces), keys
+
+
+def _as_param_array(value: Any) -> NDArray[Any]:
+    if isinstance(value, np.ndarray):
+        return value
+    out = np.empty(len(value), dtype=np.object_)
+    for i, each in enumerate(value):
+        out[i] = each
+    return out
+
+
+def _column_values(value: Any, conv: str | None) -> list[Any]:
+    arr = _as_param_array(value)
+    # Python scalars are formatted exactly the same as these numpy scalars, but `str`
+    # of float32 values and `repr` of any numpy scalars are different.
+    if conv is None and arr.dtype.kind in "iufU":
+        return arr.tolist()
+    if conv == "s" and (arr.dtype.kind in "iuU" or arr.dtype == np.float64):
+        return arr.tolist()
+    return list(arr)
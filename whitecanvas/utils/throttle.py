@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import threading
+from timeit import default_timer
+from typing import Any, Callable
+
+CallLater = Callable[[int, Callable[[], Any]], Any]
+
+
+def call_later(canvas: Any, msec: int, callback: Callable[[], Any]) -> None:
+    """
+    Call `callback` after `msec` milliseconds in the event loop of a backend canvas.
+
+    Backends that have an event loop implement `_plt_call_later`. The callback is
+    called in a timer thread for the other backends (such as plotly, bokeh and mock),
+    which do not have a GUI thread to dispatch to.
+    """
+    if (_call_later := getattr(canvas, "_plt_call_later", None)) is not None:
+        _call_later(msec, callback)
+    else:
+        call_later_in_thread(msec, callback)
+
+
+def call_later_in_thread(msec: int, callback: Callable[[], Any]) -> None:
+    """Call `callback` after `msec` milliseconds in a timer thread."""
+    timer = threading.Timer(msec / 1000, callback)
+    timer.daemon = True
+    timer.start()
+
+
+class Throttled:
+    """
+    Call a function at most once per `msec` milliseconds.
+
+    A call that comes within `msec` after the last one is kept pending. The pending
+    call is executed by the next call after the interval, by `flush`, or by the
+    trailing call scheduled with `call_later`, a function that calls the given
+    callback later in the GUI event loop (see `call_later`). Unlike
+    `psygnal.throttled`, the function is never called from a timer thread unless the
+    `call_later` function does so.
+
+    >>> update = Throttled(canvas._draw_canvas, msec=16, call_later=...)
+    >>> update()  # called immediately
+    >>> update()  # pending, called 16 msec later
+    >>> update.flush()  # or called now
+    """
+
+    def __init__(
+        self,
+        func: Callable[[], object],
+        msec: int,
+        leading: bool = True,
+        call_later: CallLater | None = None,
+    ):
+        if msec < 0:
+            raise ValueError(f"msec must be non-negative, got {msec!r}.")
+        self._func = func
+        self._msec = msec
+        self._leading = leading
+        self._call_later = call_later
+        self._last_call = -float("inf")
+        self._pending = False
+        self._scheduled = False
+
+    @property
+    def interval(self) -> int:
+        """Minimum interval of the calls in milliseconds."""
+        return self._msec
+
+    @property
+    def pending(self) -> bool:
+        """True if a call is pending."""
+        return self._pending
+
+    def __call__(self) -> None:
+        now = default_timer()
+        elapsed = (now - self._last_call) * 1000
+        if elapsed < self._msec:
+            self._pending = True
+            self._schedule(self._msec - elapsed)
+        elif not self._leading and not self._pending:
+            # start a new interval without calling the function
+            self._last_call = now
+            self._pending = True
+            self._schedule(self._msec)
+        else:
+            self._call(now)
+
+    def flush(self) -> None:
+        """Execute the pending call immediately."""
+        if self._pending:
+            self._call(default_timer())
+
+    def cancel(self) -> None:
+        """Discard the pending call."""
+        self._pending = False
+
+    def _schedule(self, msec: float) -> None:
+        if self._call_later is None or self._scheduled:
+            return
+        self._scheduled = True
+        self._call_later(max(int(msec + 0.5), 1), self._on_timeout)
+
+    def _on_timeout(self) -> None:
+        self._scheduled = False
+        if not self._pending:
+            return
+        elapsed = (default_timer() - self._last_call) * 1000
+        if elapsed < self._msec:  # timer fired early
+            self._schedule(self._msec - elapsed)
+        else:
+            self.flush()
+
+    def _call(self, now: float) -> None:
+        self._pending = False
+        self._last_call = now
+        self._func()